@@ -1,8 +1,17 @@
 # CLI commands module
+#
+# Command modules are loaded lazily (PEP 562) so that `ttrpg --help` does not
+# pull in whisper, pandas, or the LLM SDKs just to print usage.
 
-from . import transcribe_cmd
-from . import cleanup_cmd
-from . import replace_cmd
-from . import process_cmd
+import importlib
 
-__all__ = ['transcribe_cmd', 'cleanup_cmd', 'replace_cmd', 'process_cmd']
\ No newline at end of file
+__all__ = ['transcribe_cmd', 'cleanup_cmd', 'replace_cmd', 'process_cmd', 'generate_cmd']
+
+
+def __getattr__(name):
+    """Import a command module on first attribute access."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,15 +2,9 @@
 Cleanup command for processing transcript files.
 """
 
-import sys
-from pathlib import Path
+import argparse
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from transcript_cleanup.transcript_cleanup_v2 import main as cleanup_main
+from transcript_cleanup.transcript_cleanup_v2 import run as cleanup_run
 
 
 def add_parser(subparsers):
@@ -73,28 +67,13 @@ def run(args, logger):
     logger.info("TTRPG Cleanup - Processing transcript files")
     logger.info("=" * 50)
     
-    # Convert CLI args to format expected by cleanup_main
-    cleanup_args = [
-        '--base-path', args.base_path
-    ]
-    
-    if args.session_name:
-        cleanup_args.extend(['--session-name', args.session_name])
-        
-    if args.part:
-        cleanup_args.extend(['--part', args.part])
-        
-    if args.config_file:
-        cleanup_args.extend(['--config', args.config_file])
+    # Hand the parsed options straight to the cleanup pipeline
+    cleanup_args = argparse.Namespace(
+        base_path=args.base_path,
+        session_name=args.session_name,
+        part=args.part,
+        config=args.config_file
+    )
     
-    # Save original sys.argv and replace
-    original_argv = sys.argv
-    try:
-        sys.argv = ['transcript_cleanup_v2.py'] + cleanup_args
-        result = cleanup_main()
-        # cleanup_main returns True for success, convert to 0 for CLI
-        return 0 if result else 1
-    except SystemExit as e:
-        return e.code if e.code is not None else 0
-    finally:
-        sys.argv = original_argv
\ No newline at end of file
+    # cleanup_run returns True for success, convert to 0 for CLI
+    return 0 if cleanup_run(cleanup_args, logger) else 1
@@ -5,12 +5,26 @@ Supports both standalone operation and integration with existing workflow.
 
 import argparse
 import logging
+import mmap
+import types
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, TYPE_CHECKING
 
-from shared_utils.config import SharedConfig
-from shared_utils.campaign_generator import CampaignGenerator, GenerationRequest
-from shared_utils.entity_resolver import EntityType
+# Heavy imports (LLM SDKs, frontmatter, fuzzy matching) are deferred to run()
+if TYPE_CHECKING:
+    from shared_utils.config import SharedConfig
+    from shared_utils.campaign_generator import CampaignGenerator
+
+# Transcripts larger than this are memory-mapped and decoded in a single pass
+MMAP_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# Entity type (--types) -> prompt template name
+_TYPE_TO_PROMPT = types.MappingProxyType({
+    'NPC': 'NPC_template',
+    'LOCATION': 'LOCATIONS_template',
+    'ENCOUNTER': 'dm_encounter_template',
+    'STORY': 'dm_simple_story_summarizer',
+})
 
 
 def add_parser(subparsers):
@@ -98,6 +112,29 @@ Examples:
         help='How to merge with existing documents (default: intelligent)'
     )
     
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Submit prompts through the provider Batch API (cheaper, but completes asynchronously; '
+             'rerun the same command to resume waiting)'
+    )
+    
+    parser.add_argument(
+        '--batch-timeout',
+        type=float,
+        help='Seconds to wait for a --batch job before giving up; rerun to resume (default: 25 hours)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint',
+        help='Record completed prompt types in this JSONL file and skip them when the command is re-run'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache LLM responses in this directory and reuse them on reruns (default: no caching)'
+    )
+    
     parser.add_argument(
         '--max-entities',
         type=int,
@@ -135,11 +172,22 @@ Examples:
 
 def run(args, logger: logging.Logger) -> int:
     """Execute the generate command."""
+    from shared_utils.config import SharedConfig
+    from shared_utils.campaign_generator import CampaignGenerator
+    from shared_utils.llm_client import BATCH_PROVIDERS, BATCH_TIMEOUT
     
     try:
         # Load configuration
         config = SharedConfig(args.config if hasattr(args, 'config') else None)
         
+        provider = args.provider or config.ai.get('preferred_provider', 'anthropic')
+        if args.batch and provider not in BATCH_PROVIDERS:
+            logger.error(
+                f"--batch is not supported for provider {provider}; "
+                f"use --provider {' or '.join(sorted(BATCH_PROVIDERS))}"
+            )
+            return 1
+        
         # Resolve transcript file
         transcript_path = Path(args.transcript)
         transcript_content = _load_transcript_content(transcript_path, logger)
@@ -155,54 +203,64 @@ def run(args, logger: logging.Logger) -> int:
         # Configure LLM settings
         llm_config = _build_llm_config(config, args)
         
-        # Initialize campaign generator
-        generator = CampaignGenerator(
+        # Initialize campaign generator (closed when generation finishes)
+        with CampaignGenerator(
             campaign_directory=output_dir,
             llm_config=llm_config
-        )
-        
-        # Determine what to generate
-        prompts_to_use = _determine_prompts(args, generator, logger)
-        
-        if not prompts_to_use:
-            logger.error("No prompts to generate. Use --all-types, --types, or --prompts")
-            return 1
-        
-        # Show generation plan
-        _show_generation_plan(prompts_to_use, transcript_path, output_dir, args, logger)
-        
-        if args.dry_run:
-            logger.info("Dry run complete - no files were created")
-            return 0
-        
-        # Generate documents
-        session_name = args.session_name or transcript_path.stem
-        provider = args.provider or config.ai.get('preferred_provider', 'anthropic')
-        
-        logger.info(f"Starting document generation with {provider}")
-        
-        results = generator.generate_campaign_documents(
-            transcript_content=transcript_content,
-            session_name=session_name,
-            prompt_types=prompts_to_use,
-            preferred_provider=provider
-        )
-        
-        # Report results
-        _report_results(results, logger)
-        
-        # Return appropriate exit code
-        successful_results = [r for r in results if r.success]
-        if successful_results:
-            logger.info(f"Generated {len(successful_results)} documents successfully")
-            return 0
-        else:
-            logger.error("No documents were generated successfully")
-            return 1
+        ) as generator:
+            # Determine what to generate
+            prompts_to_use = _determine_prompts(args, generator, logger)
+            
+            if not prompts_to_use:
+                logger.error("No prompts to generate. Use --all-types, --types, or --prompts")
+                return 1
+            
+            # Show generation plan
+            _show_generation_plan(prompts_to_use, transcript_path, output_dir, args, logger)
+            
+            if args.dry_run:
+                logger.info("Dry run complete - no files were created")
+                return 0
+            
+            # Generate documents
+            session_name = args.session_name or transcript_path.stem
+            
+            logger.info(f"Starting document generation with {provider}")
+            
+            if args.batch:
+                results = generator.generate_campaign_documents_batch(
+                    sessions=[(transcript_content, session_name)],
+                    prompt_types=prompts_to_use,
+                    preferred_provider=provider,
+                    timeout=args.batch_timeout if args.batch_timeout is not None else BATCH_TIMEOUT
+                )
+            else:
+                results = generator.generate_campaign_documents(
+                    transcript_content=transcript_content,
+                    session_name=session_name,
+                    prompt_types=prompts_to_use,
+                    preferred_provider=provider,
+                    output_jsonl=Path(args.checkpoint) if args.checkpoint else None
+                )
+            
+            # Report results
+            _report_results(results, logger)
+            
+            # Return appropriate exit code
+            successful_results = [r for r in results if r.success]
+            if successful_results:
+                logger.info(f"Generated {len(successful_results)} documents successfully")
+                return 0
+            else:
+                logger.error("No documents were generated successfully")
+                return 1
             
     except KeyboardInterrupt:
         logger.info("Generation cancelled by user")
         return 130
+    except TimeoutError as e:
+        logger.error(f"{e}; rerun the same command to keep waiting for the batch")
+        return 1
     except Exception as e:
         logger.error(f"Generation failed: {e}")
         logger.debug("Full error details:", exc_info=True)
@@ -219,8 +277,7 @@ def _load_transcript_content(transcript_path: Path, logger: logging.Logger) -> O
     if transcript_path.is_file():
         # Single file
         try:
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_transcript_file(transcript_path)
             logger.info(f"Loaded transcript: {transcript_path} ({len(content)} chars)")
             return content
         except Exception as e:
@@ -228,24 +285,18 @@ def _load_transcript_content(transcript_path: Path, logger: logging.Logger) -> O
             return None
     
     elif transcript_path.is_dir():
-        # Directory - look for final transcript files
-        final_files = list(transcript_path.glob("*Final_COMPLETE.txt"))
+        # Directory - use the first final transcript, else any text file
+        transcript_file = next(transcript_path.glob("*Final_COMPLETE.txt"), None)
         
-        if not final_files:
-            # Look for any text files
-            text_files = list(transcript_path.glob("*.txt"))
-            if text_files:
-                final_files = text_files[:1]  # Use first text file
+        if transcript_file is None:
+            transcript_file = next(transcript_path.glob("*.txt"), None)
         
-        if not final_files:
+        if transcript_file is None:
             logger.error(f"No transcript files found in directory: {transcript_path}")
             return None
         
-        # Use the first (most recent) final transcript
-        transcript_file = final_files[0]
         try:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = _read_transcript_file(transcript_file)
             logger.info(f"Loaded transcript: {transcript_file} ({len(content)} chars)")
             return content
         except Exception as e:
@@ -257,7 +308,23 @@ def _load_transcript_content(transcript_path: Path, logger: logging.Logger) -> O
         return None
 
 
-def _build_llm_config(config: SharedConfig, args) -> dict:
+def _read_transcript_file(transcript_file: Path) -> str:
+    """Read a transcript in one pass, memory-mapping very large files."""
+    
+    if transcript_file.stat().st_size <= MMAP_THRESHOLD_BYTES:
+        return transcript_file.read_text(encoding='utf-8')
+    
+    with open(transcript_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            content = mm[:].decode('utf-8')
+    
+    # Match the newline translation done by text-mode reads
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _build_llm_config(config: 'SharedConfig', args) -> dict:
     """Build LLM configuration from config and arguments."""
     
     llm_config = config.ai.copy()
@@ -277,13 +344,16 @@ def _build_llm_config(config: SharedConfig, args) -> dict:
     if args.max_entities:
         llm_config['max_entities_per_type'] = args.max_entities
     
+    if args.cache_dir:
+        llm_config['cache_dir'] = args.cache_dir
+    
     return llm_config
 
 
-def _determine_prompts(args, generator: CampaignGenerator, logger: logging.Logger) -> List[str]:
+def _determine_prompts(args, generator: 'CampaignGenerator', logger: logging.Logger) -> Sequence[str]:
     """Determine which prompts to use based on arguments."""
     
-    available_prompts = generator.get_available_prompts()
+    available_prompts = generator.available_prompts
     
     if args.prompts:
         # Specific prompts requested
@@ -291,79 +361,83 @@ def _determine_prompts(args, generator: CampaignGenerator, logger: logging.Logge
         if invalid_prompts:
             logger.warning(f"Unknown prompts (will be skipped): {invalid_prompts}")
         
-        return [p for p in args.prompts if p in available_prompts]
+        return tuple(p for p in args.prompts if p in available_prompts)
     
     elif args.all_types:
-        # All available prompts
-        return available_prompts
+        # All available prompts, in template load order
+        return tuple(generator.get_available_prompts())
     
     elif args.types:
         # Map entity types to prompts
-        type_to_prompt = {
-            'NPC': 'NPC_template',
-            'LOCATION': 'LOCATIONS_template',
-            'ENCOUNTER': 'dm_encounter_template',
-            'STORY': 'dm_simple_story_summarizer',
-        }
-        
         prompts = []
         for entity_type in args.types:
-            prompt = type_to_prompt.get(entity_type)
+            prompt = _TYPE_TO_PROMPT.get(entity_type)
             if prompt and prompt in available_prompts:
                 prompts.append(prompt)
             else:
                 logger.warning(f"No prompt available for entity type: {entity_type}")
         
-        return prompts
+        return tuple(prompts)
     
     else:
-        # No specific selection - return empty list
-        return []
+        # No specific selection - nothing to generate
+        return ()
 
 
-def _show_generation_plan(prompts: List[str], 
+def _show_generation_plan(prompts: Sequence[str], 
                          transcript_path: Path, 
                          output_dir: Path, 
                          args, 
                          logger: logging.Logger):
     """Show what will be generated."""
     
-    logger.info("=" * 60)
-    logger.info("AI Campaign Document Generation Plan")
-    logger.info("=" * 60)
-    logger.info(f"Transcript: {transcript_path}")
-    logger.info(f"Output Directory: {output_dir}")
-    logger.info(f"Prompts to Use: {', '.join(prompts)}")
-    logger.info(f"AI Provider: {args.provider or 'from config'}")
-    logger.info(f"Merge Strategy: {args.merge_strategy or 'intelligent'}")
-    logger.info(f"Max Entities: {args.max_entities}")
-    logger.info(f"Backup Files: {args.backup}")
-    logger.info("=" * 60)
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
+    lines = [
+        "=" * 60,
+        "AI Campaign Document Generation Plan",
+        "=" * 60,
+        f"Transcript: {transcript_path}",
+        f"Output Directory: {output_dir}",
+        f"Prompts to Use: {', '.join(prompts)}",
+        f"AI Provider: {args.provider or 'from config'}",
+        f"Merge Strategy: {args.merge_strategy or 'intelligent'}",
+        f"Max Entities: {args.max_entities}",
+        f"Backup Files: {args.backup}",
+        "=" * 60,
+    ]
+    logger.info("\n".join(lines))
 
 
 def _report_results(results: List, logger: logging.Logger):
     """Report generation results to user."""
     
-    logger.info("=" * 60)
-    logger.info("Generation Results")
-    logger.info("=" * 60)
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
     successful = [r for r in results if r.success]
     failed = [r for r in results if not r.success]
     
-    logger.info(f"Successful: {len(successful)}")
-    logger.info(f"Failed: {len(failed)}")
+    lines = [
+        "=" * 60,
+        "Generation Results",
+        "=" * 60,
+        f"Successful: {len(successful)}",
+        f"Failed: {len(failed)}",
+    ]
     
     if successful:
-        logger.info("\nSuccessful generations:")
+        lines.append("\nSuccessful generations:")
         for result in successful:
             merge_info = f" ({result.merge_type})" if result.was_merged else " (new)"
-            logger.info(f"  ✓ {result.entity_name} -> {result.file_path.name}{merge_info}")
+            lines.append(f"  ✓ {result.entity_name} -> {result.file_path.name}{merge_info}")
     
     if failed:
-        logger.info("\nFailed generations:")
+        lines.append("\nFailed generations:")
         for result in failed:
             error_info = f" - {result.error}" if result.error else ""
-            logger.info(f"  ✗ {result.entity_name}{error_info}")
+            lines.append(f"  ✗ {result.entity_name}{error_info}")
     
-    logger.info("=" * 60)
\ No newline at end of file
+    lines.append("=" * 60)
+    logger.info("\n".join(lines))
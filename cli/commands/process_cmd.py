@@ -3,15 +3,19 @@ Process command for full pipeline automation.
 Chains transcription, cleanup, and text replacement operations.
 """
 
-import sys
+import logging
+import os
+from argparse import Namespace
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
+# Pipeline step selections
+TRANSCRIBE_ONLY_STEPS = ('transcribe',)
+CLEANUP_ONLY_STEPS = ('cleanup',)
+ALL_STEPS = ('transcribe', 'cleanup', 'replace')
+DEFAULT_STEPS = ('transcribe', 'cleanup')
 
-from cli.commands import transcribe_cmd, cleanup_cmd, replace_cmd
+# File types listed in the pipeline summary
+OUTPUT_FILE_EXTENSIONS = frozenset({'.tsv', '.csv', '.txt', '.json'})
 
 
 def add_parser(subparsers):
@@ -106,40 +110,42 @@ def add_parser(subparsers):
 
 def run(args, logger):
     """Execute the process command with full pipeline automation."""
-    logger.info("TTRPG Process - Full Pipeline Automation")
-    logger.info("=" * 60)
-    
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Determine which steps to run
     if args.transcribe_only:
-        steps = ['transcribe']
+        steps = TRANSCRIBE_ONLY_STEPS
     elif args.cleanup_only:
-        steps = ['cleanup']
+        steps = CLEANUP_ONLY_STEPS
     elif args.all_steps:
-        steps = ['transcribe', 'cleanup', 'replace']
+        steps = ALL_STEPS
     else:
-        # Default: transcribe + cleanup
-        steps = ['transcribe', 'cleanup']
+        steps = DEFAULT_STEPS
     
-    logger.info(f"Pipeline steps: {' → '.join(steps)}")
-    logger.info(f"Output directory: {output_dir}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("\n".join([
+            "TTRPG Process - Full Pipeline Automation",
+            "=" * 60,
+            f"Pipeline steps: {' → '.join(steps)}",
+            f"Output directory: {output_dir}",
+        ]))
     
     # Step 1: Transcription
     if 'transcribe' in steps:
         logger.info("\n" + "="*30 + " STEP 1: TRANSCRIPTION " + "="*30)
         
         # Create transcribe args
-        transcribe_args = type('Args', (), {
-            'input_path': args.input_path,
-            'output_dir': str(output_dir),
-            'model': args.model,
-            'no_fp16': args.no_fp16,
-            'language': 'en',
-            'config_file': args.config_file
-        })()
+        transcribe_args = Namespace(
+            input_path=args.input_path,
+            output_dir=str(output_dir),
+            model=args.model,
+            no_fp16=args.no_fp16,
+            language='en',
+            config_file=args.config_file
+        )
         
+        from cli.commands import transcribe_cmd
         result = transcribe_cmd.run(transcribe_args, logger)
         if result != 0:
             logger.error("Transcription failed, stopping pipeline")
@@ -153,28 +159,21 @@ def run(args, logger):
         
         # For cleanup-only, use input_path as source but output to output_dir
         if args.cleanup_only:
-            # Copy files to output directory first
-            import shutil
-            input_path = Path(args.input_path)
-            
-            # Copy TSV and JSON files to output directory
-            for file in input_path.glob("*.tsv"):
-                shutil.copy2(file, output_dir)
-            for file in input_path.glob("*.json"):
-                shutil.copy2(file, output_dir)
-                
+            # Copy TSV and JSON files to output directory first
+            _copy_session_files(Path(args.input_path), output_dir, ('.tsv', '.json'))
             cleanup_base_path = str(output_dir)
         else:
             cleanup_base_path = str(output_dir)
         
         # Create cleanup args
-        cleanup_args = type('Args', (), {
-            'base_path': cleanup_base_path,
-            'session_name': args.session_name,
-            'part': args.session_part,
-            'config_file': args.config_file
-        })()
+        cleanup_args = Namespace(
+            base_path=cleanup_base_path,
+            session_name=args.session_name,
+            part=args.session_part,
+            config_file=args.config_file
+        )
         
+        from cli.commands import cleanup_cmd
         result = cleanup_cmd.run(cleanup_args, logger)
         if result != 0:
             logger.error("Cleanup failed, stopping pipeline")
@@ -187,20 +186,19 @@ def run(args, logger):
         logger.info("\n" + "="*30 + " STEP 3: TEXT REPLACEMENT " + "="*30)
         
         # Find the complete transcript file
-        complete_files = list(output_dir.glob("*_Final_COMPLETE.txt"))
-        if not complete_files:
+        input_file = next(output_dir.glob("*_Final_COMPLETE.txt"), None)
+        if input_file is None:
             logger.warning("No complete transcript file found, skipping text replacement")
         else:
-            input_file = complete_files[0]
-            
             # Create replace args (use replacements file if it exists)
             replacements_file = output_dir / 'merge_replacements.json'
-            replace_args = type('Args', (), {
-                'input': str(input_file),
-                'output': None,  # Will auto-generate
-                'replacements': str(replacements_file) if replacements_file.exists() else None
-            })()
+            replace_args = Namespace(
+                input=str(input_file),
+                output=None,  # Will auto-generate
+                replacements=str(replacements_file) if replacements_file.exists() else None
+            )
             
+            from cli.commands import replace_cmd
             result = replace_cmd.run(replace_args, logger)
             if result != 0:
                 logger.warning("Text replacement had issues but continuing")
@@ -208,18 +206,42 @@ def run(args, logger):
                 logger.info("✓ Text replacement completed successfully")
     
     # Pipeline summary
-    logger.info("\n" + "="*30 + " PIPELINE COMPLETE " + "="*30)
-    logger.info(f"All files saved to: {output_dir}")
-    
-    # List output files
-    output_files = [
-        f for f in output_dir.iterdir() 
-        if f.is_file() and f.suffix in ['.tsv', '.csv', '.txt', '.json']
-    ]
-    
-    if output_files:
-        logger.info("Output files created:")
-        for file in sorted(output_files):
-            logger.info(f"  • {file.name}")
+    if logger.isEnabledFor(logging.INFO):
+        lines = [
+            "\n" + "="*30 + " PIPELINE COMPLETE " + "="*30,
+            f"All files saved to: {output_dir}",
+        ]
+        
+        # List output files
+        with os.scandir(output_dir) as it:
+            output_files = sorted(
+                entry.name for entry in it
+                if entry.is_file() and os.path.splitext(entry.name)[1] in OUTPUT_FILE_EXTENSIONS
+            )
+        
+        if output_files:
+            lines.append("Output files created:")
+            lines.extend(f"  • {name}" for name in output_files)
+        
+        logger.info("\n".join(lines))
     
-    return 0
\ No newline at end of file
+    return 0
+
+
+def _copy_session_files(source_dir, dest_dir, suffixes):
+    """Copy files ending in one of ``suffixes`` from source_dir into dest_dir.
+    
+    The source directory is scanned once and contents are copied with
+    shutil.copyfile (which uses os.sendfile where available). Files that
+    are already in dest_dir are left alone. Permissions and timestamps are
+    not copied since the files are only read back by the cleanup step.
+    """
+    import shutil
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(suffixes) or not entry.is_file():
+                continue
+            dest_path = os.path.join(dest_dir, entry.name)
+            if os.path.exists(dest_path) and os.path.samefile(entry.path, dest_path):
+                continue
+            shutil.copyfile(entry.path, dest_path)
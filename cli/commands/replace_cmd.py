@@ -2,15 +2,9 @@
 Replace command for applying text replacements to transcripts.
 """
 
-import sys
-from pathlib import Path
+import argparse
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from transcript_cleanup.json_text_replace_v2 import main as replace_main
+from transcript_cleanup.json_text_replace_v2 import run as replace_run
 
 
 def add_parser(subparsers):
@@ -48,26 +42,14 @@ def run(args, logger):
     logger.info("TTRPG Replace - Applying text corrections")
     logger.info("=" * 50)
     
-    # Convert CLI args to format expected by replace_main
-    replace_args = []
-    
-    if args.input:
-        replace_args.extend(['--input', args.input])
-        
-    if args.output:
-        replace_args.extend(['--output', args.output])
-        
-    if args.replacements:
-        replace_args.extend(['--replacements', args.replacements])
-        
+    # Hand the parsed options straight to the replacement step
     # Note: base_path is handled by passing full paths to files
+    replace_args = argparse.Namespace(
+        input=args.input,
+        output=args.output,
+        replacements=args.replacements,
+        config=None
+    )
     
-    # Save original sys.argv and replace
-    original_argv = sys.argv
-    try:
-        sys.argv = ['json_text_replace_v2.py'] + replace_args
-        return replace_main()
-    except SystemExit as e:
-        return e.code if e.code is not None else 0
-    finally:
-        sys.argv = original_argv
\ No newline at end of file
+    # replace_run returns True for success, convert to 0 for CLI
+    return 0 if replace_run(replace_args, logger) else 1
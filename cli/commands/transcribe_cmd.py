@@ -2,15 +2,9 @@
 Transcribe command for converting audio files to text transcripts.
 """
 
-import sys
-from pathlib import Path
+import argparse
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-from transcribe.whisper_transcribe import main as transcribe_main
+from transcribe.whisper_transcribe import run as transcribe_run
 
 
 def add_parser(subparsers):
@@ -62,26 +56,20 @@ def run(args, logger):
     logger.info("TTRPG Transcribe - Converting audio to text")
     logger.info("=" * 50)
     
-    # Convert CLI args to format expected by transcribe_main
-    transcribe_args = [
-        args.input_path,
-        '--output-dir', args.output_dir,
-        '--model', args.model,
-        '--language', args.language
-    ]
-    
-    if args.no_fp16:
-        transcribe_args.append('--no-fp16')
-        
-    if args.config_file:
-        transcribe_args.extend(['--config', args.config_file])
+    # Hand the parsed options straight to the transcriber
+    transcribe_args = argparse.Namespace(
+        inputs=[args.input_path],
+        output_dir=args.output_dir,
+        config=args.config_file,
+        model=args.model,
+        language=args.language,
+        compression_ratio_threshold=None,
+        condition_on_previous_text=False,
+        no_fp16=args.no_fp16,
+        temperature=None,
+        quiet=False,
+        no_color=False,
+        create_config=None
+    )
     
-    # Save original sys.argv and replace
-    original_argv = sys.argv
-    try:
-        sys.argv = ['whisper_transcribe.py'] + transcribe_args  # Include all args including input_path
-        return transcribe_main()
-    except SystemExit as e:
-        return e.code
-    finally:
-        sys.argv = original_argv
\ No newline at end of file
+    return transcribe_run(transcribe_args)
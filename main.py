@@ -5,25 +5,65 @@ Provides a unified command-line interface with subcommands.
 """
 
 import argparse
+import functools
+import importlib
 import sys
 from pathlib import Path
 
-from shared_utils.logging_config import setup_logging, get_logger
-from shared_utils.config import SharedConfig
-from cli.commands import transcribe_cmd, cleanup_cmd, replace_cmd, process_cmd, generate_cmd
+VERSION = 'TTRPG Session Notes v2.1 (Phase 2)'
 
-# Command registry for dynamic dispatch
+# Command registry for dynamic dispatch (command name -> module in cli.commands).
+# Modules are imported on demand so unused commands never load their dependencies.
 COMMANDS = {
-    'transcribe': transcribe_cmd,
-    'cleanup': cleanup_cmd,
-    'replace': replace_cmd,
-    'process': process_cmd,
-    'generate': generate_cmd,
+    'transcribe': 'transcribe_cmd',
+    'cleanup': 'cleanup_cmd',
+    'replace': 'replace_cmd',
+    'process': 'process_cmd',
+    'generate': 'generate_cmd',
 }
 
+# Short help for each command, used when listing commands without importing them
+COMMAND_HELP = {
+    'transcribe': 'Transcribe audio files using Whisper',
+    'cleanup': 'Clean and organize transcript files',
+    'replace': 'Apply text replacements to transcript files',
+    'process': 'Full pipeline: audio → transcripts → cleaned text',
+    'generate': 'Generate AI-powered campaign documents from transcripts',
+}
+
+
+# Global options that take a separate value argument
+GLOBAL_OPTIONS_WITH_VALUES = frozenset({'--log-level', '--config'})
+
 
-def create_main_parser():
-    """Create the main argument parser with subcommands."""
+def load_command(name):
+    """Import and return the module implementing a subcommand."""
+    return importlib.import_module(f"cli.commands.{COMMANDS[name]}")
+
+
+def create_global_parser():
+    """Create a minimal parser that only locates the subcommand in argv.
+    
+    It knows the global options (so their values are not mistaken for the
+    command) and leaves validation and help output to the full parser.
+    """
+    parser = argparse.ArgumentParser(prog='ttrpg', add_help=False)
+    parser.add_argument('--log-level')
+    parser.add_argument('--config')
+    parser.add_argument('command', nargs='?')
+    parser.add_argument('command_args', nargs=argparse.REMAINDER)
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def create_main_parser(command=None):
+    """Create the main argument parser with subcommands.
+    
+    Only the parser for ``command`` is fully built (importing its module);
+    the remaining subcommands are registered as lightweight stubs so they
+    still appear in ``--help`` output. Parsers are cached per command so
+    repeated in-process invocations skip rebuilding the argparse tree.
+    """
     parser = argparse.ArgumentParser(
         prog='ttrpg',
         description='TTRPG Session Notes automation toolkit',
@@ -52,9 +92,9 @@ Examples:
     )
     
     parser.add_argument(
-        '--version',
+        '--version', '-V',
         action='version',
-        version='TTRPG Session Notes v2.1 (Phase 2)'
+        version=VERSION
     )
     
     # Create subparsers
@@ -65,16 +105,56 @@ Examples:
     )
     
     # Add subcommands dynamically
-    for command_module in COMMANDS.values():
-        command_module.add_parser(subparsers)
+    for command_name in COMMANDS:
+        if command_name == command:
+            load_command(command_name).add_parser(subparsers)
+        else:
+            stub = subparsers.add_parser(command_name, help=COMMAND_HELP[command_name])
+            stub.add_argument('command_args', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
     
     return parser
 
 
+def _requests_version(argv):
+    """Check whether --version/-V appears among the global options.
+    
+    Only tokens before the subcommand count, so a subcommand's own -V or
+    --version is left to its parser.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in ('--version', '-V'):
+            return True
+        if arg in GLOBAL_OPTIONS_WITH_VALUES:
+            next(args, None)  # Skip the option's value
+        elif arg == '--' or arg in COMMANDS:
+            return False
+    return False
+
+
 def main():
     """Main CLI entry point."""
-    parser = create_main_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    
+    # Fast path: answer --version before importing any of the toolkit
+    if _requests_version(argv):
+        print(VERSION)
+        return 0
+    
+    # Find the subcommand first so only its parser has to be built
+    global_args, _ = create_global_parser().parse_known_args(argv)
+    command = global_args.command if global_args.command in COMMANDS else None
+    
+    parser = create_main_parser(command)
+    args = parser.parse_args(argv)
+    
+    # Show help if no command provided (before any logging or config setup)
+    if not args.command:
+        parser.print_help()
+        return 0
+    
+    from shared_utils.logging_config import setup_logging
+    from shared_utils.config import SharedConfig
     
     # Setup logging
     logger = setup_logging(level=args.log_level, use_colors=True)
@@ -88,20 +168,10 @@ def main():
         except Exception as e:
             logger.warning(f"Failed to load config {args.config}: {e}")
     
-    # Show help if no command provided
-    if not args.command:
-        parser.print_help()
-        return 0
-    
     try:
-        # Execute the appropriate command dynamically
-        command_module = COMMANDS.get(args.command)
-        if command_module:
-            return command_module.run(args, logger)
-        else:
-            logger.error(f"Unknown command: {args.command}")
-            return 2
-            
+        # Execute the command; argparse has already rejected unknown names
+        return load_command(args.command).run(args, logger)
+        
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
         return 130  # Standard UNIX exit code for SIGINT
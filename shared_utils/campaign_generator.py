@@ -3,19 +3,80 @@ Campaign generator orchestrates AI-powered document generation from transcripts.
 Integrates LLM client, document manager, and entity resolver for intelligent campaign documentation.
 """
 
+import asyncio
+import functools
+import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, FrozenSet, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-from .llm_client import LLMClient, LLMResponse
+from .llm_client import LLMClient, LLMResponse, BATCH_PROVIDERS, BATCH_TIMEOUT
 from .document_manager import DocumentManager, CampaignDocument
 from .entity_resolver import EntityResolver, EntityType, EntityMatch, EntityInfo, MatchConfidence
 
 logger = logging.getLogger(__name__)
 
+# Thread pool size used when reading AI prompt templates
+PROMPT_LOADER_WORKERS = 8
+
+# Sampling temperature for direct document generation
+GENERATION_TEMPERATURE = 0.1
+
+
+def _prompt_dir_signature(prompts_dir: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Get (name, mtime_ns, size) for each prompt template, for cache invalidation."""
+    signature = []
+    with os.scandir(prompts_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('.txt') and entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _load_prompts(prompts_dir: str,
+                  signature: Tuple[Tuple[str, int, int], ...]) -> Tuple[Tuple[str, str], ...]:
+    """Read the prompt templates listed in signature as (name, content) pairs."""
+    
+    prompt_files = [Path(prompts_dir) / name for name, _, _ in signature]
+    mtimes = [mtime_ns for _, mtime_ns, _ in signature]
+    sizes = [size for _, _, size in signature]
+    
+    # Read the templates concurrently; results come back in directory order
+    with ThreadPoolExecutor(max_workers=PROMPT_LOADER_WORKERS) as executor:
+        loaded = list(executor.map(_read_prompt_template, prompt_files, mtimes, sizes))
+    
+    templates = []
+    for prompt_file, content in zip(prompt_files, loaded):
+        if content is not None:
+            templates.append((prompt_file.stem, content))
+            logger.debug(f"Loaded prompt template: {prompt_file.stem}")
+    
+    return tuple(templates)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_prompt_cached(prompt_file: str, mtime_ns: int, size: int) -> str:
+    """Read a prompt template; mtime_ns and size make an edited file miss the cache.
+    
+    Read errors propagate, so a failed read is never cached.
+    """
+    return Path(prompt_file).read_text(encoding='utf-8')
+
+
+def _read_prompt_template(prompt_file: Path, mtime_ns: int, size: int) -> Optional[str]:
+    """Read a prompt template, returning None (with a warning) on failure."""
+    try:
+        return _read_prompt_cached(str(prompt_file), mtime_ns, size)
+    except Exception as e:
+        logger.warning(f"Failed to load prompt {prompt_file}: {e}")
+        return None
+
 
 @dataclass
 class GenerationRequest:
@@ -52,63 +113,338 @@ class CampaignGenerator:
         
         self.campaign_dir = Path(campaign_directory)
         
-        # Initialize components
-        self.llm_client = LLMClient(llm_config or {})
-        self.document_manager = DocumentManager(self.campaign_dir)
-        self.entity_resolver = EntityResolver()
-        
-        # Load AI prompt templates
-        self.prompt_templates = {}
-        self._load_prompt_templates()
-        
-        # Create directory structure
-        self.document_manager.create_directory_structure()
-        
-        # Build entity cache
-        self._refresh_entity_cache()
+        # Initialize components; with cache_dir set, the LLM client's response
+        # cache lets repeat runs over the same transcript skip the LLM call
+        llm_config = dict(llm_config or {})
+        llm_config.setdefault('cache_max_temperature', GENERATION_TEMPERATURE)
+        self.llm_client = LLMClient(llm_config)
+        try:
+            self.document_manager = DocumentManager(
+                self.campaign_dir,
+                frontmatter_format=llm_config.get('frontmatter_format', 'yaml')
+            )
+            self.entity_resolver = EntityResolver()
+            
+            # Load AI prompt templates
+            self.prompt_templates = {}
+            self._load_prompt_templates()
+            
+            # Create directory structure
+            self.document_manager.create_directory_structure()
+            
+            # Entity cache is built on first use; direct generation does not need it
+            self._entity_cache_built = False
+        except BaseException:
+            # Don't leave the LLM client's connection pool open
+            self.llm_client.close()
+            raise
         
         logger.info(f"Campaign generator initialized for: {self.campaign_dir}")
     
     def generate_campaign_documents(self, 
                                    transcript_content: str,
                                    session_name: str = "Unknown Session",
-                                   prompt_types: List[str] = None,
-                                   preferred_provider: str = "anthropic") -> List[GenerationResult]:
-        """Generate campaign documents directly from transcript using LLM analysis."""
+                                   prompt_types: Sequence[str] = None,
+                                   preferred_provider: str = "anthropic",
+                                   output_jsonl: Optional[Path] = None) -> List[GenerationResult]:
+        """Generate campaign documents directly from transcript using LLM analysis.
+        
+        Runs agenerate_campaign_documents to completion in a new event loop, so
+        it cannot be called while a loop is running; await
+        agenerate_campaign_documents there instead.
+        """
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.agenerate_campaign_documents(
+                transcript_content=transcript_content,
+                session_name=session_name,
+                prompt_types=prompt_types,
+                preferred_provider=preferred_provider,
+                output_jsonl=output_jsonl
+            ))
+        
+        raise CampaignGeneratorError(
+            "generate_campaign_documents() cannot run inside an event loop; "
+            "await agenerate_campaign_documents() instead"
+        )
+    
+    async def agenerate_campaign_documents(self,
+                                           transcript_content: str,
+                                           session_name: str = "Unknown Session",
+                                           prompt_types: Sequence[str] = None,
+                                           preferred_provider: str = "anthropic",
+                                           output_jsonl: Optional[Path] = None) -> List[GenerationResult]:
+        """Async variant of generate_campaign_documents.
+        
+        LLM requests for the different prompt types are issued concurrently,
+        bounded by the ``max_concurrent_requests`` LLM setting. When
+        ``output_jsonl`` is given, each successful result is recorded there as
+        it completes and prompt types already recorded for this session are
+        skipped, so an interrupted run can be resumed.
+        """
         
         if prompt_types is None:
             prompt_types = ["NPC_template", "LOCATIONS_template"]
         
-        results = []
+        completed = self._load_checkpoint(output_jsonl, session_name) if output_jsonl else {}
         
+        known_prompt_types = []
+        pending_prompt_types = []
         for prompt_type in prompt_types:
             if prompt_type not in self.prompt_templates:
                 logger.warning(f"Unknown prompt type: {prompt_type}")
                 continue
             
-            try:
-                # Generate document directly using LLM
-                result = self._generate_direct_document(
-                    transcript_content=transcript_content,
-                    prompt_type=prompt_type,
-                    session_name=session_name,
-                    preferred_provider=preferred_provider
-                )
-                
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(f"Failed to generate documents for {prompt_type}: {e}")
+            known_prompt_types.append(prompt_type)
+            if prompt_type in completed:
+                logger.info(f"Skipping {prompt_type}: already generated ({completed[prompt_type]})")
+            else:
+                pending_prompt_types.append(prompt_type)
+        
+        outcomes = {}
+        if pending_prompt_types:
+            generated = await self._generate_documents_concurrently(
+                transcript_content=transcript_content,
+                session_name=session_name,
+                prompt_types=pending_prompt_types,
+                preferred_provider=preferred_provider,
+                output_jsonl=output_jsonl
+            )
+            outcomes = dict(zip(pending_prompt_types, generated))
+        
+        results = []
+        for prompt_type in known_prompt_types:
+            if prompt_type not in outcomes:
+                # Recorded as done in the checkpoint file
+                results.append(GenerationResult(
+                    success=True,
+                    entity_name=prompt_type,
+                    file_path=Path(completed[prompt_type]),
+                    was_merged=False,
+                    merge_type="new"
+                ))
+                continue
+            
+            outcome = outcomes[prompt_type]
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to generate documents for {prompt_type}: {outcome}")
                 results.append(GenerationResult(
                     success=False,
                     entity_name=f"Error_{prompt_type}",
                     file_path=Path("error"),
                     was_merged=False,
-                    error=str(e)
+                    error=str(outcome)
                 ))
+            else:
+                results.append(outcome)
         
         return results
     
+    def generate_campaign_documents_batch(self,
+                                         sessions: Sequence[Tuple[str, str]],
+                                         prompt_types: Sequence[str] = None,
+                                         preferred_provider: str = "openai",
+                                         poll_interval: float = 60.0,
+                                         timeout: Optional[float] = BATCH_TIMEOUT) -> List[GenerationResult]:
+        """Generate documents for many sessions through the provider's Batch API.
+        
+        ``sessions`` holds (transcript_content, session_name) pairs. All prompts
+        are submitted as one batch job and this call blocks until it finishes,
+        or raises TimeoutError after ``timeout`` seconds. The submitted batch is
+        recorded under ``pending_batches/`` so an interrupted or timed-out run
+        picks the same batch up again instead of resubmitting.
+        """
+        
+        if preferred_provider not in BATCH_PROVIDERS:
+            raise CampaignGeneratorError(
+                f"Batch generation is not supported for {preferred_provider}; "
+                f"supported providers: {', '.join(sorted(BATCH_PROVIDERS))}"
+            )
+        
+        if prompt_types is None:
+            prompt_types = ["NPC_template", "LOCATIONS_template"]
+        
+        # Request ids are positional; the pending record maps them back to
+        # (session_name, prompt_type), which may contain any characters
+        prompts = {}  # custom_id -> prompt
+        targets = {}  # custom_id -> (session_name, prompt_type)
+        for transcript_content, session_name in sessions:
+            for prompt_type in prompt_types:
+                if prompt_type not in self.prompt_templates:
+                    logger.warning(f"Unknown prompt type: {prompt_type}")
+                    continue
+                
+                custom_id = f"request-{len(prompts)}"
+                prompts[custom_id] = self._create_direct_prompt(
+                    self.prompt_templates[prompt_type], transcript_content, session_name
+                )
+                targets[custom_id] = (session_name, prompt_type)
+        
+        if not prompts:
+            return []
+        
+        pending_dir = self.campaign_dir / "pending_batches"
+        batch_id = self._find_pending_batch(pending_dir, preferred_provider, targets)
+        
+        if batch_id is None:
+            batch_id = self.llm_client.submit_batch(prompts, provider=preferred_provider)
+            pending_dir.mkdir(parents=True, exist_ok=True)
+            record = {
+                'batch_id': batch_id,
+                'provider': preferred_provider,
+                'submitted': datetime.now().isoformat(),
+                'requests': {custom_id: list(target) for custom_id, target in targets.items()}
+            }
+            (pending_dir / f"{batch_id}.json").write_text(json.dumps(record, indent=2), encoding='utf-8')
+        else:
+            logger.info(f"Resuming pending batch {batch_id}")
+        
+        batch = self.llm_client.wait_for_batch(batch_id, preferred_provider, poll_interval, timeout)
+        
+        if batch.status == 'completed':
+            responses = self.llm_client.get_batch_results(batch, preferred_provider)
+        else:
+            responses = {}
+        
+        results = []
+        for custom_id, (session_name, prompt_type) in targets.items():
+            outcome = responses.get(custom_id)
+            
+            if isinstance(outcome, LLMResponse):
+                results.append(self._save_generated_document(
+                    prompt_type, session_name, preferred_provider, outcome
+                ))
+            else:
+                error = outcome or f"Batch {batch_id} ended with status: {batch.status}"
+                logger.error(f"Batch generation failed for {prompt_type} ({session_name}): {error}")
+                results.append(GenerationResult(
+                    success=False,
+                    entity_name=prompt_type,
+                    file_path=Path("error"),
+                    was_merged=False,
+                    error=error
+                ))
+        
+        # The batch has reached a terminal state; nothing left to resume
+        (pending_dir / f"{batch_id}.json").unlink(missing_ok=True)
+        
+        return results
+    
+    def _find_pending_batch(self,
+                            pending_dir: Path,
+                            provider: str,
+                            targets: Dict[str, Tuple[str, str]]) -> Optional[str]:
+        """Return the id of a recorded batch covering exactly these requests, if any."""
+        
+        if not pending_dir.is_dir():
+            return None
+        
+        expected = {custom_id: list(target) for custom_id, target in targets.items()}
+        for record_path in pending_dir.glob("*.json"):
+            try:
+                record = json.loads(record_path.read_text(encoding='utf-8'))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable batch record {record_path}: {e}")
+                continue
+            
+            if record.get('provider') == provider and record.get('requests') == expected:
+                return record.get('batch_id')
+        
+        return None
+    
+    async def _generate_documents_concurrently(self,
+                                               transcript_content: str,
+                                               session_name: str,
+                                               prompt_types: Sequence[str],
+                                               preferred_provider: str,
+                                               output_jsonl: Optional[Path] = None) -> List[Any]:
+        """Run one generation task per prompt type, returning results or exceptions in order."""
+        
+        max_concurrent = self.llm_client.config.get('max_concurrent_requests', 4)
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrent)))
+        
+        async def generate(prompt_type: str) -> GenerationResult:
+            result = await self._generate_direct_document_async(
+                semaphore=semaphore,
+                transcript_content=transcript_content,
+                prompt_type=prompt_type,
+                session_name=session_name,
+                preferred_provider=preferred_provider
+            )
+            if output_jsonl and result.success:
+                self._append_checkpoint(output_jsonl, session_name, result)
+            return result
+        
+        tasks = [generate(prompt_type) for prompt_type in prompt_types]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _load_checkpoint(self, output_jsonl: Path, session_name: str) -> Dict[str, str]:
+        """Read prompt type -> file path for results already recorded for a session."""
+        
+        completed = {}
+        try:
+            with open(output_jsonl, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A run killed mid-write can leave a truncated last line
+                        continue
+                    if record.get('success') and record.get('session_name') == session_name:
+                        completed[record['prompt_type']] = record['file_path']
+        except FileNotFoundError:
+            pass
+        
+        return completed
+    
+    def _append_checkpoint(self, output_jsonl: Path, session_name: str, result: GenerationResult):
+        """Durably append a completed generation result to the checkpoint file."""
+        
+        record = {
+            'prompt_type': result.entity_name,
+            'session_name': session_name,
+            'file_path': str(result.file_path),
+            'success': result.success
+        }
+        
+        line = (json.dumps(record) + '\n').encode('utf-8')
+        
+        Path(output_jsonl).parent.mkdir(parents=True, exist_ok=True)
+        with open(output_jsonl, 'ab+') as f:
+            # Start a new line if a killed run left a partial record at the end
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+    
+    async def _generate_direct_document_async(self,
+                                              semaphore: asyncio.Semaphore,
+                                              transcript_content: str,
+                                              prompt_type: str,
+                                              session_name: str,
+                                              preferred_provider: str) -> GenerationResult:
+        """Async counterpart of _generate_direct_document."""
+        
+        try:
+            request = self._direct_generation_request(
+                transcript_content, prompt_type, session_name, preferred_provider
+            )
+            async with semaphore:
+                logger.info(f"Generating {prompt_type} using {preferred_provider}")
+                llm_response = await self.llm_client.agenerate_content(**request)
+            
+            return self._save_generated_document(
+                prompt_type, session_name, preferred_provider, llm_response
+            )
+            
+        except Exception as e:
+            return self._generation_failure(prompt_type, e)
+    
     def _generate_direct_document(self,
                                  transcript_content: str,
                                  prompt_type: str,
@@ -117,73 +453,97 @@ class CampaignGenerator:
         """Generate a document directly from transcript without entity extraction."""
         
         try:
-            # Create enhanced prompt with full transcript
-            prompt_template = self.prompt_templates[prompt_type]
-            enhanced_prompt = self._create_direct_prompt(
-                prompt_template, transcript_content, session_name
+            request = self._direct_generation_request(
+                transcript_content, prompt_type, session_name, preferred_provider
             )
-            
-            # Generate content with LLM
             logger.info(f"Generating {prompt_type} using {preferred_provider}")
+            llm_response = self.llm_client.generate_content(**request)
             
-            llm_response = self.llm_client.generate_content(
-                prompt=enhanced_prompt,
-                provider=preferred_provider,
-                max_tokens=4000,
-                temperature=0.1
-            )
-            
-            # Determine output file path
-            file_name = f"{prompt_type.replace('_template', '')}_{session_name.replace(' ', '_')}.md"
-            file_path = self.campaign_dir / file_name
-            
-            # Create document structure
-            frontmatter = {
-                'prompt_type': prompt_type,
-                'session_name': session_name,
-                'generated_date': datetime.now().isoformat(),
-                'provider': preferred_provider,
-                'auto_generated': True
-            }
-            
-            # Create and save document
-            document = CampaignDocument(
-                file_path=file_path,
-                frontmatter=frontmatter,
-                content=llm_response.content,
-                sections=[],  # Will be parsed later if needed
-                exists=False
+            return self._save_generated_document(
+                prompt_type, session_name, preferred_provider, llm_response
             )
-            
-            success = self.document_manager.save_document(document, backup=False)
-            
-            if success:
-                logger.info(f"Generated document: {file_path}")
-                return GenerationResult(
-                    success=True,
-                    entity_name=prompt_type,
-                    file_path=file_path,
-                    was_merged=False,
-                    merge_type="new",
-                    llm_response=llm_response
-                )
-            else:
-                return GenerationResult(
-                    success=False,
-                    entity_name=prompt_type,
-                    file_path=file_path,
-                    was_merged=False,
-                    error="Failed to save document"
-                )
                 
         except Exception as e:
-            logger.error(f"Failed to generate {prompt_type}: {e}")
+            return self._generation_failure(prompt_type, e)
+    
+    def _direct_generation_request(self,
+                                   transcript_content: str,
+                                   prompt_type: str,
+                                   session_name: str,
+                                   preferred_provider: str) -> Dict[str, Any]:
+        """Build the LLM call arguments for generating one prompt type from a transcript."""
+        
+        enhanced_prompt = self._create_direct_prompt(
+            self.prompt_templates[prompt_type], transcript_content, session_name
+        )
+        
+        return {
+            'prompt': enhanced_prompt,
+            'provider': preferred_provider,
+            'max_tokens': 4000,
+            'temperature': GENERATION_TEMPERATURE
+        }
+    
+    def _generation_failure(self, prompt_type: str, error: Exception) -> GenerationResult:
+        """Log a failed generation and build its result."""
+        
+        logger.error(f"Failed to generate {prompt_type}: {error}")
+        return GenerationResult(
+            success=False,
+            entity_name=prompt_type,
+            file_path=Path("error"),
+            was_merged=False,
+            error=str(error)
+        )
+    
+    def _save_generated_document(self,
+                                 prompt_type: str,
+                                 session_name: str,
+                                 preferred_provider: str,
+                                 llm_response: LLMResponse) -> GenerationResult:
+        """Write generated LLM content to the campaign directory."""
+        
+        # Determine output file path
+        file_name = f"{prompt_type.replace('_template', '')}_{session_name.replace(' ', '_')}.md"
+        file_path = self.campaign_dir / file_name
+        
+        # Create document structure
+        frontmatter = {
+            'prompt_type': prompt_type,
+            'session_name': session_name,
+            'generated_date': datetime.now().isoformat(),
+            'provider': preferred_provider,
+            'auto_generated': True
+        }
+        
+        # Create and save document
+        document = CampaignDocument(
+            file_path=file_path,
+            frontmatter=frontmatter,
+            content=llm_response.content,
+            sections=[],  # Will be parsed later if needed
+            exists=False
+        )
+        
+        success = self.document_manager.save_document(document, backup=False)
+        
+        if success:
+            logger.info(f"Generated document: {file_path}")
+            return GenerationResult(
+                success=True,
+                entity_name=prompt_type,
+                file_path=file_path,
+                was_merged=False,
+                merge_type="new",
+                llm_response=llm_response
+            )
+        else:
             return GenerationResult(
                 success=False,
                 entity_name=prompt_type,
-                file_path=Path("error"),
+                file_path=file_path,
                 was_merged=False,
-                error=str(e)
+                error="Failed to save document"
             )
     
     def _create_direct_prompt(self,
@@ -235,17 +595,9 @@ Generate complete documentation based on what you find in this transcript.
             logger.warning(f"AI_Prompts directory not found: {prompts_dir}")
             return
         
-        for prompt_file in prompts_dir.glob("*.txt"):
-            try:
-                with open(prompt_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                template_name = prompt_file.stem
-                self.prompt_templates[template_name] = content
-                logger.debug(f"Loaded prompt template: {template_name}")
-                
-            except Exception as e:
-                logger.warning(f"Failed to load prompt {prompt_file}: {e}")
+        # Reuse templates already read in this process unless a file changed
+        templates = _load_prompts(str(prompts_dir), _prompt_dir_signature(prompts_dir))
+        self.prompt_templates = dict(templates)
         
         logger.info(f"Loaded {len(self.prompt_templates)} prompt templates")
     
@@ -255,15 +607,38 @@ Generate complete documentation based on what you find in this transcript.
         # This method is kept for backwards compatibility
         documents = self.document_manager.list_all_documents()
         self.entity_resolver.build_entity_cache(documents)
+        self._entity_cache_built = True
         logger.debug("Entity cache refreshed")
     
+    def _ensure_entity_cache(self):
+        """Build the entity cache if it has not been built yet."""
+        if not self._entity_cache_built:
+            self._refresh_entity_cache()
+    
+    def close(self):
+        """Release the LLM client's pooled HTTP connections."""
+        self.llm_client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def get_available_prompts(self) -> List[str]:
         """Get list of available prompt templates."""
         return list(self.prompt_templates.keys())
     
+    @functools.cached_property
+    def available_prompts(self) -> FrozenSet[str]:
+        """Set of available prompt template names, for membership checks."""
+        return frozenset(self.prompt_templates)
+    
     def get_generation_stats(self) -> Dict[str, Any]:
         """Get statistics about the campaign generation setup."""
         
+        self._ensure_entity_cache()
+        
         return {
             'campaign_directory': str(self.campaign_dir),
             'available_providers': self.llm_client.get_available_providers(),
@@ -5,19 +5,137 @@ Handles parsing, updating, and intelligent merging of Obsidian-style documents.
 
 import os
 import re
+import json
+import shutil
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
+from collections import OrderedDict
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 
 try:
     import frontmatter
 except ImportError:
     frontmatter = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Markdown header line: level markers and title (surrounding whitespace ignored)
+_HEADER_RE = re.compile(r'^\s*(#{1,6})\s+(\S.*?)\s*$')
+
+# Section bodies that only hold a comment, TODO/TBD marker, or [placeholder]
+_MINIMAL_RE = re.compile(r'^(?:<!--.*-->|TODO:?|TBD:?|\[.*\])\s*$', re.IGNORECASE | re.DOTALL)
+
+# Recently serialized top-level YAML entries, keyed by a frozen copy of the entry
+FRONTMATTER_CACHE_SIZE = 512
+_frontmatter_cache: 'OrderedDict[Any, str]' = OrderedDict()
+
+
+def _freeze_metadata(value: Any) -> Any:
+    """Build a hashable, type-tagged snapshot of metadata; raises TypeError if unhashable."""
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze_metadata(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze_metadata(item) for item in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _export_json_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize metadata as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(metadata, indent=2, ensure_ascii=False, default=str)
+
+
+def _export_yaml_entry(key: Any, value: Any) -> str:
+    """Serialize one top-level metadata entry as block YAML, memoized by content."""
+    try:
+        cache_key = _freeze_metadata({key: value})
+    except TypeError:
+        cache_key = None
+    
+    if cache_key is not None and cache_key in _frontmatter_cache:
+        _frontmatter_cache.move_to_end(cache_key)
+        return _frontmatter_cache[cache_key]
+    
+    entry = frontmatter.default_handlers.YAMLHandler().export({key: value})
+    
+    if cache_key is not None:
+        _frontmatter_cache[cache_key] = entry
+        if len(_frontmatter_cache) > FRONTMATTER_CACHE_SIZE:
+            _frontmatter_cache.popitem(last=False)
+    
+    return entry
+
+
+def _export_yaml_metadata(metadata: Dict[str, Any]) -> str:
+    """Serialize metadata as YAML, one memoized entry at a time.
+    
+    Block-style top-level entries are independent of each other, so joining
+    them in PyYAML's sorted key order gives the same mapping as dumping the
+    whole dict, while a fresh ``last_updated`` timestamp only costs its own line.
+    """
+    if not metadata:
+        return frontmatter.default_handlers.YAMLHandler().export(metadata)
+    
+    try:
+        keys = sorted(metadata)
+    except TypeError:
+        keys = list(metadata)
+    return '\n'.join(_export_yaml_entry(key, metadata[key]) for key in keys)
+
+
+def _serialize_frontmatter(metadata: Dict[str, Any], frontmatter_format: str = 'yaml') -> str:
+    """Render the frontmatter block that precedes a document's content.
+    
+    YAML is written between ``---`` delimiters; JSON is written as a bare
+    object, the layout python-frontmatter's JSONHandler detects on load.
+    Empty JSON metadata gets no block at all, since ``{}`` on a single line
+    is not recognized as frontmatter and would be read back as content.
+    """
+    if frontmatter_format == 'json':
+        if not metadata:
+            return ''
+        return f"{_export_json_metadata(metadata)}\n\n\n"
+    return f"---\n{_export_yaml_metadata(metadata)}\n---\n\n"
+
+
+def _write_file_buffers(path: Path, buffers: List[bytes]) -> None:
+    """Write buffers to path in order with as few syscalls as possible, then fsync.
+    
+    Uses os.writev where available so the frontmatter and body are written
+    without first being joined into a single string.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        if hasattr(os, 'writev'):
+            pending = [memoryview(buf) for buf in buffers if buf]
+            while pending:
+                written = os.writev(fd, pending)
+                # Drop fully written buffers and trim a partially written one
+                while pending and written >= len(pending[0]):
+                    written -= len(pending[0])
+                    pending.pop(0)
+                if pending and written:
+                    pending[0] = pending[0][written:]
+        else:
+            for buf in buffers:
+                view = memoryview(buf)
+                while view:
+                    view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 
 @dataclass
 class DocumentSection:
@@ -27,6 +145,16 @@ class DocumentSection:
     level: int  # Header level (1-6)
     start_line: int
     end_line: int
+    title_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Lowercased once here rather than on every title comparison during merges
+        self.title_lower = self.title.lower()
+    
+    @cached_property
+    def line_set(self) -> FrozenSet[str]:
+        """Set of non-blank stripped content lines, computed on first use."""
+        return frozenset(line.strip() for line in self.content.splitlines() if line.strip())
 
 
 @dataclass
@@ -38,14 +166,33 @@ class CampaignDocument:
     sections: List[DocumentSection]
     exists: bool = False
     last_modified: Optional[datetime] = None
+    
+    @cached_property
+    def sections_by_title(self) -> Dict[str, DocumentSection]:
+        """Sections keyed by lowercased title (first occurrence wins), built on first use."""
+        index = {}
+        for section in self.sections:
+            index.setdefault(section.title_lower, section)
+        return index
 
 
 class DocumentManager:
     """Manages campaign documents with intelligent merging capabilities."""
     
-    def __init__(self, campaign_dir: Path):
-        """Initialize document manager with campaign directory."""
+    FRONTMATTER_FORMATS = ('yaml', 'json')
+    
+    def __init__(self, campaign_dir: Path, frontmatter_format: str = 'yaml'):
+        """Initialize document manager with campaign directory.
+        
+        ``frontmatter_format`` selects how metadata is written: 'yaml' (default,
+        what Obsidian reads as properties) or 'json' (faster to serialize).
+        Both formats are detected automatically when loading.
+        """
+        if frontmatter_format not in self.FRONTMATTER_FORMATS:
+            raise ValueError(f"Unknown frontmatter format: {frontmatter_format}")
+        
         self.campaign_dir = Path(campaign_dir)
+        self.frontmatter_format = frontmatter_format
         self.campaign_dir.mkdir(parents=True, exist_ok=True)
         
         # Validate frontmatter library
@@ -124,22 +271,29 @@ class DocumentManager:
         try:
             # Create backup if file exists and backup requested
             if backup and document.file_path.exists():
-                backup_path = document.file_path.with_suffix('.bak')
-                document.file_path.rename(backup_path)
+                backup_path = self._create_backup(document.file_path)
                 logger.debug(f"Created backup: {backup_path}")
             
             # Ensure directory exists
             document.file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create frontmatter post
-            post = frontmatter.Post(
-                content=document.content,
-                metadata=document.frontmatter
-            )
+            # Same layout as frontmatter.dumps, with the metadata block memoized
+            header = _serialize_frontmatter(document.frontmatter, self.frontmatter_format)
+            body = document.content.rstrip()
+            if not body:
+                header = header.rstrip()
             
-            # Write to file
-            with open(document.file_path, 'w', encoding='utf-8') as f:
-                f.write(frontmatter.dumps(post))
+            # Write to a temp file and swap it in, so a crash never leaves a partial document
+            tmp_path = document.file_path.with_suffix(document.file_path.suffix + '.tmp')
+            try:
+                _write_file_buffers(tmp_path, [header.encode('utf-8'), body.encode('utf-8')])
+                # Keep the permissions of the document being replaced
+                if document.file_path.exists():
+                    shutil.copymode(document.file_path, tmp_path)
+                os.replace(tmp_path, document.file_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
             logger.info(f"Saved document: {document.file_path}")
             return True
@@ -148,6 +302,23 @@ class DocumentManager:
             logger.error(f"Failed to save document {document.file_path}: {e}")
             return False
     
+    def _create_backup(self, file_path: Path) -> Path:
+        """Hard-link file_path to its .bak path, replacing any older backup.
+        
+        Documents are saved by replacing the path with a new file, so the
+        backup keeps the previous contents.
+        """
+        backup_path = file_path.with_suffix('.bak')
+        backup_path.unlink(missing_ok=True)
+        
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            # Filesystem without hard link support
+            shutil.copy2(file_path, backup_path)
+        
+        return backup_path
+    
     def merge_document_content(
         self,
         existing_doc: CampaignDocument,
@@ -191,38 +362,35 @@ class DocumentManager:
         
         # Parse new content sections
         new_sections = self._parse_sections(new_content)
-        new_sections_dict = {section.title.lower(): section for section in new_sections}
         
-        # Start with existing content
-        merged_content = existing_doc.content
-        merged_sections = existing_doc.sections.copy()
+        existing_sections_by_title = existing_doc.sections_by_title
+        
+        # Line edits against the existing content, applied in one pass at the end
+        edits = []
+        replaced_sections = set()
+        existing_line_count = existing_doc.content.count('\n') + 1
         
         # Track what we've added
         additions = []
         
         # Process each new section
         for new_section in new_sections:
-            section_key = new_section.title.lower()
-            existing_section = None
-            
-            # Find matching existing section
-            for existing in existing_doc.sections:
-                if existing.title.lower() == section_key:
-                    existing_section = existing
-                    break
+            section_key = new_section.title_lower
+            existing_section = existing_sections_by_title.get(section_key)
             
             if existing_section is None:
-                # New section - add it
+                # New section - add it at the end, after a blank line
                 additions.append(f"Added section: {new_section.title}")
-                merged_content += f"\n\n{self._format_section(new_section)}"
-                merged_sections.append(new_section)
+                edits.append((existing_line_count, existing_line_count,
+                              ['', self._format_section(new_section)], new_section))
                 
-            elif self._is_section_empty_or_minimal(existing_section):
+            elif (id(existing_section) not in replaced_sections
+                  and self._is_section_empty_or_minimal(existing_section)):
                 # Existing section is empty/minimal - replace it
                 additions.append(f"Updated empty section: {new_section.title}")
-                merged_content = self._replace_section_content(
-                    merged_content, existing_section, new_section
-                )
+                edits.append((existing_section.start_line, existing_section.end_line + 1,
+                              [self._format_section(new_section)], new_section))
+                replaced_sections.add(id(existing_section))
                 
             else:
                 # Existing section has content - append new info with timestamp
@@ -232,10 +400,13 @@ class DocumentManager:
                 
                 if new_info:
                     additions.append(f"Appended to section: {new_section.title}")
-                    merged_content = self._append_to_section(
-                        merged_content, existing_section, 
-                        addition_marker + new_info
-                    )
+                    insertion_point = existing_section.end_line + 1
+                    edits.append((insertion_point, insertion_point,
+                                  [addition_marker + new_info], None))
+        
+        merged_content, merged_sections = self._apply_line_edits(
+            existing_doc.content, existing_doc.sections, edits
+        )
         
         # Update frontmatter
         merged_frontmatter = existing_doc.frontmatter.copy()
@@ -253,7 +424,7 @@ class DocumentManager:
             file_path=existing_doc.file_path,
             frontmatter=merged_frontmatter,
             content=merged_content,
-            sections=self._parse_sections(merged_content),
+            sections=merged_sections,
             exists=True
         )
     
@@ -286,21 +457,26 @@ class DocumentManager:
     def _parse_sections(self, content: str) -> List[DocumentSection]:
         """Parse markdown content into sections based on headers."""
         sections = []
+        # Split on '\n' only: start_line/end_line must line up with the line
+        # numbers used when merge edits are spliced back into the content
         lines = content.split('\n')
         current_section = None
+        current_lines = []
         
         for i, line in enumerate(lines):
-            header_match = re.match(r'^(#{1,6})\s+(.+)$', line.strip())
+            header_match = _HEADER_RE.match(line)
             
             if header_match:
                 # Save previous section
                 if current_section:
                     current_section.end_line = i - 1
+                    current_section.content = self._join_section_lines(current_lines)
                     sections.append(current_section)
+                    current_lines = []
                 
                 # Start new section
                 level = len(header_match.group(1))
-                title = header_match.group(2).strip()
+                title = header_match.group(2)
                 
                 current_section = DocumentSection(
                     title=title,
@@ -311,14 +487,22 @@ class DocumentManager:
                 )
             
             elif current_section:
-                current_section.content += line + '\n'
+                current_lines.append(line)
         
         # Save last section
         if current_section:
+            current_section.content = self._join_section_lines(current_lines)
             sections.append(current_section)
         
         return sections
     
+    @staticmethod
+    def _join_section_lines(lines: List[str]) -> str:
+        """Join section body lines, keeping a newline after every line."""
+        if not lines:
+            return ""
+        return '\n'.join(lines) + '\n'
+    
     def _format_section(self, section: DocumentSection) -> str:
         """Format a section back to markdown."""
         header = '#' * section.level + ' ' + section.title
@@ -328,63 +512,80 @@ class DocumentManager:
         """Check if a section is empty or has minimal content."""
         content = section.content.strip()
         
-        # Empty
-        if not content:
+        # Empty or very short content (less than 20 chars)
+        if len(content) < 20:
             return True
         
-        # Only whitespace, comments, or placeholder text
-        minimal_patterns = [
-            r'^\s*$',  # Only whitespace
-            r'^<!--.*-->$',  # Only comments
-            r'^TODO:?\s*$',  # TODO markers
-            r'^TBD:?\s*$',   # TBD markers
-            r'^\[.*\]\s*$',  # Placeholder brackets
-        ]
-        
-        for pattern in minimal_patterns:
-            if re.match(pattern, content, re.IGNORECASE | re.DOTALL):
-                return True
-        
-        # Very short content (less than 20 chars)
-        return len(content) < 20
+        # Only comments or placeholder text
+        return _MINIMAL_RE.match(content) is not None
     
-    def _replace_section_content(
-        self, 
-        full_content: str, 
-        old_section: DocumentSection, 
-        new_section: DocumentSection
-    ) -> str:
-        """Replace content of a specific section."""
-        lines = full_content.split('\n')
-        
-        # Replace the section content
-        new_lines = (
-            lines[:old_section.start_line] +
-            [self._format_section(new_section)] +
-            lines[old_section.end_line + 1:]
-        )
-        
-        return '\n'.join(new_lines)
-    
-    def _append_to_section(
-        self, 
-        full_content: str, 
-        section: DocumentSection, 
-        addition: str
-    ) -> str:
-        """Append content to a specific section."""
+    def _apply_line_edits(
+        self,
+        full_content: str,
+        sections: List[DocumentSection],
+        edits: List[Tuple[int, int, List[str], Optional[DocumentSection]]]
+    ) -> Tuple[str, List[DocumentSection]]:
+        """Apply line-range replacements in a single pass and return content and sections.
+        
+        Each edit is (start, end, new_lines, header_section): lines ``start:end``
+        of ``full_content`` are replaced by ``new_lines``, whose last element
+        starts with the header of ``header_section`` when one is given. At the
+        same position, appends to an existing section (no header_section) go
+        before inserted sections, and both go ahead of a range replaced from
+        there; otherwise edits keep their recorded order. Section boundaries
+        are tracked while splicing, so the merged content does not need to be
+        parsed again.
+        """
         lines = full_content.split('\n')
-        
-        # Find insertion point (end of section)
-        insertion_point = section.end_line + 1
-        
-        new_lines = (
-            lines[:insertion_point] +
-            [addition] +
-            lines[insertion_point:]
-        )
-        
-        return '\n'.join(new_lines)
+        merged_lines = []
+        headers = []  # (line number in merged_lines, title, level)
+        
+        remaining_sections = iter(sections)
+        next_section = next(remaining_sections, None)
+        pos = 0
+        
+        def splice_order(item):
+            seq, (start, end, _, header_section) = item
+            return (start, end > start, header_section is not None, seq)
+        
+        for _, (start, end, new_lines, header_section) in sorted(enumerate(edits), key=splice_order):
+            # Copy untouched lines up to the edit, noting the headers they contain
+            while next_section is not None and next_section.start_line < start:
+                headers.append((len(merged_lines) + next_section.start_line - pos,
+                                next_section.title, next_section.level))
+                next_section = next(remaining_sections, None)
+            merged_lines.extend(lines[pos:start])
+            
+            inserted = '\n'.join(new_lines).split('\n')
+            if header_section is not None:
+                header_offset = len(inserted) - new_lines[-1].count('\n') - 1
+                headers.append((len(merged_lines) + header_offset,
+                                header_section.title, header_section.level))
+            merged_lines.extend(inserted)
+            
+            # Drop sections whose header was inside the replaced range
+            while next_section is not None and next_section.start_line < end:
+                next_section = next(remaining_sections, None)
+            pos = max(pos, end)
+        
+        while next_section is not None:
+            headers.append((len(merged_lines) + next_section.start_line - pos,
+                            next_section.title, next_section.level))
+            next_section = next(remaining_sections, None)
+        merged_lines.extend(lines[pos:])
+        
+        merged_sections = []
+        for i, (start_line, title, level) in enumerate(headers):
+            end_line = headers[i + 1][0] - 1 if i + 1 < len(headers) else len(merged_lines) - 1
+            merged_sections.append(DocumentSection(
+                title=title,
+                content=self._join_section_lines(merged_lines[start_line + 1:end_line + 1]),
+                level=level,
+                start_line=start_line,
+                end_line=end_line
+            ))
+        
+        return '\n'.join(merged_lines), merged_sections
     
     def _extract_new_information(
         self, 
@@ -393,10 +594,11 @@ class DocumentManager:
     ) -> str:
         """Extract information from new section that's not in existing section."""
         # Simple implementation - check for new bullet points, lines, etc.
-        existing_lines = set(line.strip() for line in existing_section.content.split('\n') if line.strip())
-        new_lines = [line.strip() for line in new_section.content.split('\n') if line.strip()]
-        
-        truly_new_lines = [line for line in new_lines if line not in existing_lines]
+        existing_lines = existing_section.line_set
+        truly_new_lines = [
+            stripped for stripped in (line.strip() for line in new_section.content.splitlines())
+            if stripped and stripped not in existing_lines
+        ]
         
         if truly_new_lines:
             return '\n'.join(truly_new_lines)
@@ -415,15 +617,23 @@ class DocumentManager:
         """List all documents organized by type."""
         document_types = {}
         
-        for subdir in self.campaign_dir.iterdir():
-            if subdir.is_dir() and not subdir.name.startswith('.'):
-                md_files = list(subdir.glob('*.md'))
+        # scandir exposes entry types without a stat call per file
+        with os.scandir(self.campaign_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_dir():
+                    continue
+                
+                with os.scandir(entry.path) as sub_entries:
+                    md_files = [
+                        Path(sub.path) for sub in sub_entries
+                        if sub.name.endswith('.md') and sub.is_file()
+                    ]
+                
                 if md_files:
-                    document_types[subdir.name] = md_files
+                    document_types[entry.name] = md_files
         
         return document_types
 
-
 class DocumentManagerError(Exception):
     """Base exception for document manager errors."""
     pass
\ No newline at end of file
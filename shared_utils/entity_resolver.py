@@ -3,20 +3,72 @@ Entity resolver for campaign documents using hybrid matching strategies.
 Handles NPCs, Locations, Items, and other campaign entities with intelligent deduplication.
 """
 
+import bisect
+import heapq
 import logging
+import math
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Set
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from enum import Enum
 
+# rapidfuzz scorers return floats on the same 0-100 scale fuzzywuzzy used,
+# so fuzzy_threshold is a percentage either way
 try:
-    from fuzzywuzzy import fuzz, process
+    import rapidfuzz
+    from rapidfuzz import fuzz, process
 except ImportError:
-    fuzz = process = None
+    rapidfuzz = fuzz = process = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Queries whose fuzzy scores are remembered per entity list
+SCORE_CACHE_SIZE = 4096
+
+# Threads used to read entity documents when building the cache; smaller
+# batches are read inline since starting the pool costs more than it saves
+ENTITY_READER_WORKERS = 8
+PARALLEL_READ_MIN_FILES = 4
+
+# Markdown header markers and frontmatter title key, stripped from name lines
+_HEADER_PREFIX_RE = re.compile(r'^#+\s*')
+_TITLE_PREFIX_RE = re.compile(r'^title:\s*')
+
+# Headers too generic to be an entity's name
+_GENERIC_HEADERS = frozenset({
+    'introduction', 'overview', 'description', 'summary',
+    'background', 'history', 'details', 'notes', 'information'
+})
+
+# Phrases that introduce alternative names ("also known as: X, Y"), one capture
+# group per phrase family. The lookahead keeps matches zero-width so one pass
+# finds every family's matches, including ones that overlap another family's.
+_ALIAS_RE = re.compile(
+    r'(?=(?:also known as|aka|aliases?)[:\s]+(.*?)(?:\n|$)'
+    r'|(?:nicknamed?|called)[:\s]+(.*?)(?:\n|$)'
+    r'|(?:goes by|known as)[:\s]+(.*?)(?:\n|$))',
+    re.IGNORECASE
+)
+_ALIAS_SPLIT_RE = re.compile(r'[,;]')
+
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+# Articles dropped from the start/end of names when comparing them
+_ARTICLES = frozenset({'the', 'a', 'an'})
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Deletes characters not allowed in filenames on common filesystems
+_FILENAME_INVALID_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
 
 class EntityType(Enum):
     """Types of campaign entities."""
@@ -29,6 +81,21 @@ class EntityType(Enum):
     STORY = "Stories"
 
 
+# Description phrases used as key phrases, per entity type
+_DESC_PATTERNS = {
+    # Character descriptions
+    EntityType.NPC: tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:is a|appears to be|seems like)\s+([^.]+)',
+        r'(?:personality|character|trait)[:\s]+([^.]+)',
+    )),
+    # Location descriptions
+    EntityType.LOCATION: tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'(?:located|situated|found)\s+([^.]+)',
+        r'(?:description|appearance)[:\s]+([^.]+)',
+    )),
+}
+
+
 class MatchConfidence(Enum):
     """Confidence levels for entity matching."""
     EXACT = "exact"         # 100% match
@@ -38,7 +105,19 @@ class MatchConfidence(Enum):
     NONE = "none"         # <50% match
 
 
-@dataclass
+# Minimum score for each confidence level above NONE; bisecting a score into
+# _CONFIDENCE_THRESHOLDS gives its index in _CONFIDENCE_LEVELS
+_CONFIDENCE_THRESHOLDS = (50, 70, 90, 100)
+_CONFIDENCE_LEVELS = (
+    MatchConfidence.NONE,
+    MatchConfidence.LOW,
+    MatchConfidence.MEDIUM,
+    MatchConfidence.HIGH,
+    MatchConfidence.EXACT,
+)
+
+
+@dataclass(slots=True)
 class EntityMatch:
     """Represents a potential entity match."""
     entity_name: str
@@ -46,10 +125,10 @@ class EntityMatch:
     confidence: MatchConfidence
     similarity_score: float
     match_type: str  # "exact", "fuzzy", "semantic", "alias"
-    aliases_matched: List[str] = None
+    aliases_matched: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityInfo:
     """Information extracted from entity name or content."""
     name: str
@@ -59,6 +138,150 @@ class EntityInfo:
     file_path: Optional[Path] = None
 
 
+def _read_entity_file(file_path: Path) -> Tuple[Optional[str], Optional[Exception]]:
+    """Read an entity document as (content, None), or (None, error) on failure.
+    
+    The file is read as bytes and decoded in one step, skipping the
+    incremental decoding of text-mode reads.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+    except Exception as e:
+        return None, e
+    
+    # Match the newline translation done by text-mode reads
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, None
+
+
+def _read_entity_files(file_paths: List[Path]) -> List[Tuple[Optional[str], Optional[Exception]]]:
+    """Read entity documents concurrently; results come back in file_paths order."""
+    if len(file_paths) < PARALLEL_READ_MIN_FILES:
+        return [_read_entity_file(file_path) for file_path in file_paths]
+    
+    with ThreadPoolExecutor(max_workers=min(ENTITY_READER_WORKERS, len(file_paths))) as executor:
+        return list(executor.map(_read_entity_file, file_paths))
+
+
+@dataclass
+class _LengthSortedCandidates:
+    """Candidate strings ordered by length, so a length band is one contiguous slice."""
+    strings: List[str]
+    lengths: List[int]
+    positions: List[int]  # Index of each string in the unsorted candidate list
+    
+    @classmethod
+    def from_strings(cls, candidates: List[str]) -> '_LengthSortedCandidates':
+        """Sort candidates by length, remembering their original positions."""
+        positions = sorted(range(len(candidates)), key=lambda i: len(candidates[i]))
+        strings = [candidates[i] for i in positions]
+        return cls(strings=strings, lengths=[len(c) for c in strings], positions=positions)
+
+
+def _length_band(length: int, threshold: float) -> Tuple[float, float]:
+    """Range of candidate lengths that can reach threshold against a query of this length.
+    
+    fuzz.ratio is 100 * (1 - distance / (len_a + len_b)) and the indel distance
+    is at least the length difference, so the best possible score for two
+    lengths is 200 * min / (len_a + len_b).
+    """
+    if threshold <= 0:
+        return 0, math.inf
+    
+    low = math.ceil(length * threshold / (200 - threshold) - 1e-9)
+    high = math.floor(length * (200 - threshold) / threshold + 1e-9)
+    return low, high
+
+
+@dataclass
+class _EntityIndex:
+    """Normalized names and aliases for a list of entities, computed once per list.
+    
+    Matching reads these parallel arrays instead of re-normalizing every
+    candidate on every query. Keys in the ``*_by_key`` dicts are names as
+    compared by ``EntityResolver._name_key``.
+    """
+    entities: List[EntityInfo]
+    names_lc: List[str]
+    name_idx_by_key: Dict[str, List[int]]
+    alias_names: List[str]
+    aliases_lc: List[str]
+    alias_owners: List[int]
+    alias_idx_by_key: Dict[str, List[int]]
+    names_by_length: _LengthSortedCandidates
+    aliases_by_length: _LengthSortedCandidates
+    # Filenames in use, including ones handed out by suggest_filename, and the
+    # next numeric suffix to try for each base name
+    taken_filenames: Set[str]
+    next_filename_suffix: Dict[str, int] = field(default_factory=dict)
+    # (candidate kind, query, threshold) -> (candidate index, score) hits, LRU ordered
+    score_cache: 'OrderedDict[Tuple[str, str, float], Tuple[Tuple[int, float], ...]]' = field(
+        default_factory=OrderedDict, repr=False
+    )
+    # Built on the first find_mentions call
+    mention_matcher: Optional['_MentionMatcher'] = field(default=None, repr=False)
+
+
+def _is_word_char(char: str) -> bool:
+    """Check if char counts as part of a word (same as regex \\w)."""
+    return char.isalnum() or char == '_'
+
+
+class _MentionMatcher:
+    """Finds whole-word occurrences of a fixed set of names in text in one pass.
+    
+    Uses a pyahocorasick automaton when it is installed, otherwise a single
+    regex alternation with the longest names first.
+    """
+    
+    def __init__(self, keys: List[str]):
+        """Prepare the matcher for the given (non-empty) names."""
+        keys = [key for key in keys if key]
+        self._automaton = None
+        self._pattern = None
+        
+        if not keys:
+            return
+        
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for key in keys:
+                self._automaton.add_word(key, key)
+            self._automaton.make_automaton()
+        else:
+            alternation = '|'.join(re.escape(key) for key in sorted(keys, key=len, reverse=True))
+            self._pattern = re.compile(rf'(?<!\w)(?:{alternation})(?!\w)')
+    
+    def iter_matches(self, text: str) -> Iterator[str]:
+        """Yield each name found in text, in order of position."""
+        if self._automaton is not None:
+            # Keep the longest whole-word match at each start. iter_long is not
+            # used because its longest match can fail the word check while a
+            # shorter one at the same start passes ("red" in "red dragons").
+            longest = {}
+            for end, key in self._automaton.iter(text):
+                start = end - len(key) + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                if len(key) > len(longest.get(start, '')):
+                    longest[start] = key
+            
+            # Leftmost non-overlapping matches, like the regex alternation
+            position = 0
+            for start in sorted(longest):
+                if start >= position:
+                    key = longest[start]
+                    position = start + len(key)
+                    yield key
+        elif self._pattern is not None:
+            for match in self._pattern.finditer(text):
+                yield match.group()
+
+
 class EntityResolver:
     """Resolves and matches campaign entities using multiple strategies."""
     
@@ -72,52 +295,128 @@ class EntityResolver:
         self.semantic_threshold = semantic_threshold
         self.case_sensitive = case_sensitive
         
-        # Validate fuzzywuzzy
+        # Validate rapidfuzz
         if fuzz is None or process is None:
             raise ImportError(
-                "fuzzywuzzy is required for entity resolution. "
-                "Install with: pip install fuzzywuzzy python-Levenshtein"
+                "rapidfuzz is required for entity resolution. "
+                "Install with: pip install rapidfuzz"
             )
         
-        # Cache for entity information
+        # Cache for entity information, plus normalized lookup tables for each list
         self._entity_cache: Dict[EntityType, List[EntityInfo]] = {}
+        self._entity_index: Dict[EntityType, _EntityIndex] = {}
         
         logger.info(f"Entity resolver initialized (fuzzy: {fuzzy_threshold}%, "
                    f"semantic: {semantic_threshold})")
+        logger.debug(f"Fuzzy scoring backend: rapidfuzz {rapidfuzz.__version__}")
     
     def find_matches(self, 
                     entity_name: str,
                     entity_type: EntityType,
                     existing_entities: List[EntityInfo],
                     max_matches: int = 3) -> List[EntityMatch]:
-        """Find potential matches for an entity using hybrid approach."""
+        """Find potential matches for an entity using hybrid approach.
+        
+        An exact name match, or failing that an exact alias match, is taken as
+        definitive and returned without fuzzy scoring. Otherwise fuzzy name and
+        alias matches are returned, best first.
+        """
         
         if not existing_entities:
             return []
         
-        matches = []
-        entity_name_clean = self._clean_name(entity_name)
+        index = self._get_entity_index(entity_type, existing_entities)
+        return self._find_matches_in_index(entity_name, index, max_matches)
+    
+    def find_mentions(self, text: str, entity_type: EntityType) -> List[EntityMatch]:
+        """Find cached entities whose name or an alias is mentioned in text.
+        
+        All names and aliases are matched in a single pass over the text, so
+        the cost does not grow with the number of cached entities. Returns
+        one exact match per entity, in order of first mention.
+        """
+        index = self._entity_index.get(entity_type)
+        if index is None or not index.entities:
+            return []
+        
+        if index.mention_matcher is None:
+            index.mention_matcher = _MentionMatcher(
+                list(dict.fromkeys([*index.name_idx_by_key, *index.alias_idx_by_key]))
+            )
+        
+        best_matches: Dict[str, EntityMatch] = {}
+        haystack = text if self.case_sensitive else text.lower()
+        
+        for key in index.mention_matcher.iter_matches(haystack):
+            for idx in index.name_idx_by_key.get(key, ()):
+                entity = index.entities[idx]
+                self._record_match(best_matches, EntityMatch(
+                    entity_name=entity.name,
+                    file_path=entity.file_path,
+                    confidence=MatchConfidence.EXACT,
+                    similarity_score=100.0,
+                    match_type="exact"
+                ))
+            
+            alias_idxs = index.alias_idx_by_key.get(key, ())
+            if alias_idxs:
+                self._record_alias_matches(index, dict.fromkeys(alias_idxs, 100.0), best_matches)
+        
+        return list(best_matches.values())
+    
+    def find_matches_batch(self, 
+                          entity_names: List[str],
+                          entity_type: EntityType,
+                          existing_entities: List[EntityInfo],
+                          max_matches: int = 3) -> List[List[EntityMatch]]:
+        """Find potential matches for many entities at once (e.g. a session import).
+        
+        Returns one result list per name, the same as calling find_matches for
+        each, but the fuzzy scores for every name are computed together with
+        rapidfuzz's process.cdist instead of one query at a time.
+        """
+        
+        if not existing_entities:
+            return [[] for _ in entity_names]
+        
+        index = self._get_entity_index(entity_type, existing_entities)
+        
+        # Names resolved by an exact name or alias lookup never need fuzzy scores
+        fuzzy_queries = []
+        for entity_name in entity_names:
+            name_key, query_lc = self._normalize_query(entity_name)
+            if name_key not in index.name_idx_by_key and name_key not in index.alias_idx_by_key:
+                fuzzy_queries.append(query_lc)
+        
+        self._score_candidates_batch(index, 'name', fuzzy_queries)
+        self._score_candidates_batch(index, 'alias', fuzzy_queries)
+        
+        return [self._find_matches_in_index(entity_name, index, max_matches)
+                for entity_name in entity_names]
+    
+    def _find_matches_in_index(self, 
+                               entity_name: str,
+                               index: _EntityIndex,
+                               max_matches: int) -> List[EntityMatch]:
+        """Match one entity name against an entity index."""
         
-        # Step 1: Try exact matching
-        exact_matches = self._find_exact_matches(entity_name_clean, existing_entities)
-        matches.extend(exact_matches)
+        # Best match per entity, filled in by each matching step
+        best_matches: Dict[str, EntityMatch] = {}
+        name_key, query_lc = self._normalize_query(entity_name)
         
-        # Step 2: Try fuzzy matching if no exact matches
-        if not exact_matches:
-            fuzzy_matches = self._find_fuzzy_matches(entity_name_clean, existing_entities)
-            matches.extend(fuzzy_matches)
+        # Step 1: Try exact name matching, then exact alias matching (both dict lookups)
+        if (self._find_exact_matches(name_key, index, best_matches)
+                or self._find_exact_alias_matches(name_key, index, best_matches)):
+            return list(best_matches.values())[:max_matches]
         
-        # Step 3: Try alias matching
-        alias_matches = self._find_alias_matches(entity_name_clean, existing_entities)
-        matches.extend(alias_matches)
+        # Step 2: Try fuzzy name matching
+        self._find_fuzzy_matches(query_lc, index, best_matches)
         
-        # Remove duplicates and sort by confidence
-        unique_matches = self._deduplicate_matches(matches)
-        sorted_matches = sorted(unique_matches, 
-                               key=lambda m: m.similarity_score, 
-                               reverse=True)
+        # Step 3: Try fuzzy alias matching
+        self._find_alias_matches(query_lc, index, best_matches)
         
-        return sorted_matches[:max_matches]
+        # Highest scores first (ties keep the order matches were found)
+        return heapq.nlargest(max_matches, best_matches.values(), key=lambda m: m.similarity_score)
     
     def extract_entity_info(self, 
                            content: str, 
@@ -147,20 +446,28 @@ class EntityResolver:
         """Build cache of existing entities from campaign documents."""
         
         self._entity_cache.clear()
+        self._entity_index.clear()
         
+        typed_documents = []
         for entity_type_str, file_paths in campaign_documents.items():
             try:
                 entity_type = EntityType(entity_type_str)
             except ValueError:
                 logger.warning(f"Unknown entity type: {entity_type_str}")
                 continue
-            
+            typed_documents.append((entity_type, file_paths))
+        
+        # Read every document up front so the file I/O overlaps; parsing stays on this thread
+        all_paths = [file_path for _, file_paths in typed_documents for file_path in file_paths]
+        read_results = dict(zip(all_paths, _read_entity_files(all_paths)))
+        
+        for entity_type, file_paths in typed_documents:
             entities = []
             for file_path in file_paths:
                 try:
-                    # Read file content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content, read_error = read_results[file_path]
+                    if read_error is not None:
+                        raise read_error
                     
                     # Extract entity info
                     entity_info = self.extract_entity_info(content, entity_type, file_path)
@@ -171,130 +478,308 @@ class EntityResolver:
                     continue
             
             self._entity_cache[entity_type] = entities
+            self._entity_index[entity_type] = self._build_entity_index(entities)
             logger.debug(f"Cached {len(entities)} {entity_type.value} entities")
     
     def suggest_filename(self, 
                         entity_name: str, 
                         entity_type: EntityType,
                         existing_entities: List[EntityInfo] = None) -> str:
-        """Suggest a filename for a new entity, avoiding conflicts."""
+        """Suggest a filename for a new entity, avoiding conflicts.
+        
+        Filenames suggested against the cached entity list are reserved, so
+        suggesting names for several new entities in a row never returns the
+        same filename twice.
+        """
         
         base_name = self._clean_name_for_filename(entity_name)
         filename = f"{base_name}.md"
         
+        if not existing_entities:
+            return filename
+        
+        index = self._cached_entity_index(entity_type, existing_entities)
+        if index is not None:
+            existing_files = index.taken_filenames
+            next_suffix = index.next_filename_suffix
+        else:
+            existing_files = self._entity_filenames(existing_entities)
+            next_suffix = {}
+        
         # Check for conflicts
-        if existing_entities:
-            existing_files = {
-                entity.file_path.name if entity.file_path else ""
-                for entity in existing_entities
-            }
+        if filename in existing_files:
+            # Add number suffix, resuming after the last one handed out for this name
+            for i in range(next_suffix.get(base_name, 2), 100):
+                numbered_filename = f"{base_name}_{i}.md"
+                if numbered_filename not in existing_files:
+                    filename = numbered_filename
+                    next_suffix[base_name] = i + 1
+                    break
+        
+        existing_files.add(filename)
+        return filename
+    
+    def _entity_filenames(self, entities: List[EntityInfo]) -> Set[str]:
+        """Get the set of filenames used by entities."""
+        return {entity.file_path.name if entity.file_path else "" for entity in entities}
+    
+    def _cached_entity_index(self, 
+                             entity_type: EntityType, 
+                             existing_entities: List[EntityInfo]) -> Optional[_EntityIndex]:
+        """Get the cached index for entity_type if it was built from existing_entities."""
+        index = self._entity_index.get(entity_type)
+        if (index is not None and index.entities is existing_entities
+                and len(index.names_lc) == len(existing_entities)):
+            return index
+        return None
+    
+    def _get_entity_index(self, 
+                          entity_type: EntityType, 
+                          existing_entities: List[EntityInfo]) -> _EntityIndex:
+        """Get lookup tables for existing_entities, reusing the cached ones when possible."""
+        index = self._cached_entity_index(entity_type, existing_entities)
+        if index is not None:
+            return index
+        
+        # Caller passed its own entity list
+        return self._build_entity_index(existing_entities)
+    
+    def _build_entity_index(self, entities: List[EntityInfo]) -> _EntityIndex:
+        """Normalize entity names and flatten aliases for matching."""
+        names_lc = []
+        name_idx_by_key = {}
+        alias_names = []
+        aliases_lc = []
+        alias_owners = []
+        alias_idx_by_key = {}
+        
+        for idx, entity in enumerate(entities):
+            names_lc.append(entity.name.lower())
+            name_idx_by_key.setdefault(self._name_key(entity.name), []).append(idx)
             
-            if filename in existing_files:
-                # Add number suffix
-                for i in range(2, 100):
-                    numbered_filename = f"{base_name}_{i}.md"
-                    if numbered_filename not in existing_files:
-                        filename = numbered_filename
-                        break
+            for alias in entity.aliases:
+                alias_idx_by_key.setdefault(self._name_key(alias), []).append(len(alias_names))
+                alias_names.append(alias)
+                aliases_lc.append(alias.lower())
+                alias_owners.append(idx)
+        
+        return _EntityIndex(
+            entities=entities,
+            names_lc=names_lc,
+            name_idx_by_key=name_idx_by_key,
+            alias_names=alias_names,
+            aliases_lc=aliases_lc,
+            alias_owners=alias_owners,
+            alias_idx_by_key=alias_idx_by_key,
+            names_by_length=_LengthSortedCandidates.from_strings(names_lc),
+            aliases_by_length=_LengthSortedCandidates.from_strings(aliases_lc),
+            taken_filenames=self._entity_filenames(entities)
+        )
+    
+    def _score_candidates(self, 
+                          index: _EntityIndex, 
+                          kind: str, 
+                          query: str) -> Tuple[Tuple[int, float], ...]:
+        """Fuzzy-score a lowercased query against the index's names or aliases.
+        
+        Returns (candidate index, score) pairs at or above the fuzzy threshold,
+        in candidate order. Results are cached on the index, so repeated
+        queries against the same entity list skip scoring entirely.
+        """
+        key = (kind, query, self.fuzzy_threshold)
+        hits = index.score_cache.get(key)
+        if hits is not None:
+            index.score_cache.move_to_end(key)
+            return hits
+        
+        # Candidates whose length alone rules out the threshold are never scored
+        candidates = index.names_by_length if kind == 'name' else index.aliases_by_length
+        min_length, max_length = _length_band(len(query), self.fuzzy_threshold)
+        start = bisect.bisect_left(candidates.lengths, min_length)
+        end = bisect.bisect_right(candidates.lengths, max_length)
+        
+        # Score the rest in one call; only hits above the threshold come back
+        results = process.extract(
+            query, candidates.strings[start:end],
+            scorer=fuzz.ratio,
+            score_cutoff=self.fuzzy_threshold,
+            limit=None
+        )
+        hits = tuple(sorted(
+            (candidates.positions[start + pos], similarity) for _, similarity, pos in results
+        ))
         
-        return filename
+        self._cache_scores(index, key, hits)
+        return hits
     
-    def _find_exact_matches(self, 
-                           entity_name: str, 
-                           existing_entities: List[EntityInfo]) -> List[EntityMatch]:
-        """Find exact name matches."""
-        matches = []
-        
-        for entity in existing_entities:
-            # Check primary name
-            if self._names_equal(entity_name, entity.name):
-                matches.append(EntityMatch(
-                    entity_name=entity.name,
-                    file_path=entity.file_path,
-                    confidence=MatchConfidence.EXACT,
-                    similarity_score=100.0,
-                    match_type="exact"
-                ))
+    def _score_candidates_batch(self, 
+                                index: _EntityIndex, 
+                                kind: str, 
+                                queries: List[str]) -> None:
+        """Fuzzy-score many lowercased queries in one call and add them to the score cache.
+        
+        Subsequent _score_candidates calls for these queries are cache hits.
+        """
+        threshold = self.fuzzy_threshold
+        pending = [query for query in dict.fromkeys(queries)
+                   if (kind, query, threshold) not in index.score_cache]
+        if not pending:
+            return
+        
+        candidates = index.names_lc if kind == 'name' else index.aliases_lc
+        if not candidates:
+            for query in pending:
+                self._cache_scores(index, (kind, query, threshold), ())
+            return
+        
+        # One (queries x candidates) score matrix, computed across all cores;
+        # scores below the cutoff come back as 0
+        scores = process.cdist(
+            pending, candidates,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            dtype='float64',
+            workers=-1
+        )
         
-        return matches
+        for query, row in zip(pending, scores):
+            hit_idxs = (row >= threshold).nonzero()[0] if threshold > 0 else range(len(row))
+            hits = tuple((int(idx), float(row[idx])) for idx in hit_idxs)
+            self._cache_scores(index, (kind, query, threshold), hits)
+    
+    def _cache_scores(self, 
+                      index: _EntityIndex, 
+                      key: Tuple[str, str, float], 
+                      hits: Tuple[Tuple[int, float], ...]) -> None:
+        """Store scoring hits in the index's LRU score cache."""
+        index.score_cache[key] = hits
+        if len(index.score_cache) > SCORE_CACHE_SIZE:
+            index.score_cache.popitem(last=False)
+    
+    def _record_match(self, best_matches: Dict[str, EntityMatch], match: EntityMatch) -> None:
+        """Keep match unless the same entity already has an equal or better match."""
+        key = str(match.file_path) if match.file_path else match.entity_name
+        current = best_matches.get(key)
+        if current is None or match.similarity_score > current.similarity_score:
+            best_matches[key] = match
+    
+    def _normalize_query(self, entity_name: str) -> Tuple[str, str]:
+        """Clean a query name once, as (exact-match key, lowercased form for fuzzy scoring).
+        
+        _clean_name already strips the name (and lowercases it unless
+        case-sensitive), so the cleaned name is its own exact-match key.
+        """
+        name_key = self._clean_name(entity_name)
+        query_lc = name_key.lower() if self.case_sensitive else name_key
+        return name_key, query_lc
+    
+    def _find_exact_matches(self, 
+                           name_key: str, 
+                           index: _EntityIndex,
+                           best_matches: Dict[str, EntityMatch]) -> int:
+        """Record exact name matches, returning how many were found."""
+        exact_idxs = index.name_idx_by_key.get(name_key, ())
+        
+        for idx in exact_idxs:
+            entity = index.entities[idx]
+            self._record_match(best_matches, EntityMatch(
+                entity_name=entity.name,
+                file_path=entity.file_path,
+                confidence=MatchConfidence.EXACT,
+                similarity_score=100.0,
+                match_type="exact"
+            ))
+        
+        return len(exact_idxs)
     
     def _find_fuzzy_matches(self, 
-                           entity_name: str, 
-                           existing_entities: List[EntityInfo]) -> List[EntityMatch]:
-        """Find fuzzy string matches."""
-        matches = []
-        
-        for entity in existing_entities:
-            # Check primary name
-            similarity = fuzz.ratio(entity_name.lower(), entity.name.lower())
-            
-            if similarity >= self.fuzzy_threshold:
-                confidence = self._score_to_confidence(similarity)
-                matches.append(EntityMatch(
-                    entity_name=entity.name,
-                    file_path=entity.file_path,
-                    confidence=confidence,
-                    similarity_score=similarity,
-                    match_type="fuzzy"
-                ))
-        
-        return matches
+                           query_lc: str, 
+                           index: _EntityIndex,
+                           best_matches: Dict[str, EntityMatch]) -> None:
+        """Record fuzzy string matches for an already lowercased query."""
+        for idx, similarity in self._score_candidates(index, 'name', query_lc):
+            entity = index.entities[idx]
+            confidence = self._score_to_confidence(similarity)
+            self._record_match(best_matches, EntityMatch(
+                entity_name=entity.name,
+                file_path=entity.file_path,
+                confidence=confidence,
+                similarity_score=similarity,
+                match_type="fuzzy"
+            ))
+    
+    def _find_exact_alias_matches(self, 
+                                 name_key: str, 
+                                 index: _EntityIndex,
+                                 best_matches: Dict[str, EntityMatch]) -> int:
+        """Record exact alias matches, returning how many aliases matched."""
+        alias_idxs = index.alias_idx_by_key.get(name_key, ())
+        
+        # Exact alias matches always score 100
+        self._record_alias_matches(index, dict.fromkeys(alias_idxs, 100.0), best_matches)
+        return len(alias_idxs)
     
     def _find_alias_matches(self, 
-                           entity_name: str, 
-                           existing_entities: List[EntityInfo]) -> List[EntityMatch]:
-        """Find matches through aliases."""
-        matches = []
-        
-        for entity in existing_entities:
-            matched_aliases = []
-            best_score = 0
-            
-            for alias in entity.aliases:
-                # Exact alias match
-                if self._names_equal(entity_name, alias):
-                    matched_aliases.append(alias)
-                    best_score = max(best_score, 100.0)
-                    continue
-                
-                # Fuzzy alias match
-                similarity = fuzz.ratio(entity_name.lower(), alias.lower())
-                if similarity >= self.fuzzy_threshold:
-                    matched_aliases.append(alias)
-                    best_score = max(best_score, similarity)
-            
-            if matched_aliases:
-                confidence = self._score_to_confidence(best_score)
-                matches.append(EntityMatch(
-                    entity_name=entity.name,
-                    file_path=entity.file_path,
-                    confidence=confidence,
-                    similarity_score=best_score,
-                    match_type="alias",
-                    aliases_matched=matched_aliases
-                ))
-        
-        return matches
+                           query_lc: str, 
+                           index: _EntityIndex,
+                           best_matches: Dict[str, EntityMatch]) -> None:
+        """Record fuzzy matches through aliases for an already lowercased query."""
+        if not index.alias_names:
+            return
+        
+        alias_scores = dict(self._score_candidates(index, 'alias', query_lc))
+        self._record_alias_matches(index, alias_scores, best_matches)
+    
+    def _record_alias_matches(self, 
+                              index: _EntityIndex,
+                              alias_scores: Dict[int, float],
+                              best_matches: Dict[str, EntityMatch]) -> None:
+        """Record one match per entity owning a scored alias, with its best alias score."""
+        # Entity index -> (matched aliases, best score), in entity order
+        alias_hits: Dict[int, Tuple[List[str], float]] = {}
+        for alias_idx in sorted(alias_scores):
+            owner = index.alias_owners[alias_idx]
+            matched_aliases, best_score = alias_hits.get(owner, ([], 0))
+            matched_aliases.append(index.alias_names[alias_idx])
+            alias_hits[owner] = (matched_aliases, max(best_score, alias_scores[alias_idx]))
+        
+        for owner, (matched_aliases, best_score) in alias_hits.items():
+            entity = index.entities[owner]
+            confidence = self._score_to_confidence(best_score)
+            self._record_match(best_matches, EntityMatch(
+                entity_name=entity.name,
+                file_path=entity.file_path,
+                confidence=confidence,
+                similarity_score=best_score,
+                match_type="alias",
+                aliases_matched=matched_aliases
+            ))
     
     def _extract_primary_name(self, content: str, entity_type: EntityType) -> str:
         """Extract the primary name from document content."""
         
-        # Try to extract from title/header
-        lines = content.split('\n')
-        for line in lines[:10]:  # Check first 10 lines
-            line = line.strip()
+        # Try to extract from title/header; only the first 10 lines are sliced
+        # out, so the cost does not grow with the document length
+        start = 0
+        for _ in range(10):
+            end = content.find('\n', start)
+            line = (content[start:] if end < 0 else content[start:end]).strip()
             
             # Markdown header
             if line.startswith('#'):
-                name = re.sub(r'^#+\s*', '', line).strip()
+                name = _HEADER_PREFIX_RE.sub('', line, count=1).strip()
                 if name and not self._is_generic_header(name):
                     return name
             
             # Frontmatter title
             if line.startswith('title:'):
-                name = re.sub(r'^title:\s*', '', line).strip().strip('"\'')
+                name = _TITLE_PREFIX_RE.sub('', line, count=1).strip().strip('"\'')
                 if name:
                     return name
+            
+            if end < 0:
+                break
+            start = end + 1
         
         # Fallback: use filename
         if hasattr(content, 'file_path') and content.file_path:
@@ -307,25 +792,25 @@ class EntityResolver:
         """Extract aliases from document content."""
         aliases = []
         
-        # Common alias patterns
-        patterns = [
-            r'(?:also known as|aka|aliases?)[:\s]+(.*?)(?:\n|$)',
-            r'(?:nicknamed?|called)[:\s]+(.*?)(?:\n|$)',
-            r'(?:goes by|known as)[:\s]+(.*?)(?:\n|$)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                alias_text = match.group(1).strip()
-                # Split multiple aliases
-                alias_parts = re.split(r'[,;]', alias_text)
-                for part in alias_parts:
-                    clean_alias = part.strip().strip('"\'')
-                    if clean_alias and len(clean_alias) > 1:
-                        aliases.append(clean_alias)
-        
-        return list(set(aliases))  # Remove duplicates
+        # Single pass over the content; each phrase family resumes after the end of
+        # its previous match, as a separate scan per family would
+        resume_at = [0] * (_ALIAS_RE.groups + 1)
+        for match in _ALIAS_RE.finditer(content):
+            family = match.lastindex
+            if match.start() < resume_at[family]:
+                continue
+            resume_at[family] = match.end(family) + 1
+            
+            alias_text = match.group(family).strip()
+            # Split multiple aliases
+            alias_parts = _ALIAS_SPLIT_RE.split(alias_text)
+            for part in alias_parts:
+                clean_alias = part.strip().strip('"\'')
+                if clean_alias and len(clean_alias) > 1:
+                    aliases.append(clean_alias)
+        
+        # Remove duplicates, keeping the order aliases appear in the document
+        return list(dict.fromkeys(aliases))
     
     def _extract_key_phrases(self, content: str, entity_type: EntityType) -> List[str]:
         """Extract key phrases for semantic matching."""
@@ -335,28 +820,12 @@ class EntityResolver:
         phrases = []
         
         # Extract quoted phrases
-        quoted_phrases = re.findall(r'"([^"]+)"', content)
+        quoted_phrases = _QUOTED_RE.findall(content)
         phrases.extend(quoted_phrases)
         
         # Extract description patterns
-        if entity_type == EntityType.NPC:
-            # Look for character descriptions
-            desc_patterns = [
-                r'(?:is a|appears to be|seems like)\s+([^.]+)',
-                r'(?:personality|character|trait)[:\s]+([^.]+)',
-            ]
-        elif entity_type == EntityType.LOCATION:
-            # Look for location descriptions
-            desc_patterns = [
-                r'(?:located|situated|found)\s+([^.]+)',
-                r'(?:description|appearance)[:\s]+([^.]+)',
-            ]
-        else:
-            desc_patterns = []
-        
-        for pattern in desc_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
+        for pattern in _DESC_PATTERNS.get(entity_type, ()):
+            for match in pattern.finditer(content):
                 phrase = match.group(1).strip()
                 if len(phrase) > 10:  # Only meaningful phrases
                     phrases.append(phrase)
@@ -368,20 +837,22 @@ class EntityResolver:
         if not self.case_sensitive:
             name = name.lower()
         
-        # Remove common prefixes/suffixes
-        name = re.sub(r'^(the|a|an)\s+', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+(the|a|an)$', '', name, flags=re.IGNORECASE)
+        # Splitting on whitespace also normalizes it
+        words = name.split()
         
-        # Normalize whitespace
-        name = re.sub(r'\s+', ' ', name).strip()
+        # Remove common prefixes/suffixes, never the only remaining word
+        if len(words) > 1 and words[0].lower() in _ARTICLES:
+            del words[0]
+        if len(words) > 1 and words[-1].lower() in _ARTICLES:
+            del words[-1]
         
-        return name
+        return ' '.join(words)
     
     def _clean_name_for_filename(self, name: str) -> str:
         """Clean entity name for use as filename."""
         # Remove/replace invalid filename characters
-        clean_name = re.sub(r'[<>:"/\\|?*]', '', name)
-        clean_name = re.sub(r'\s+', '_', clean_name)
+        clean_name = name.translate(_FILENAME_INVALID_CHARS)
+        clean_name = _WHITESPACE_RE.sub('_', clean_name)
         clean_name = clean_name.lower()
         
         # Limit length
@@ -390,45 +861,24 @@ class EntityResolver:
         
         return clean_name
     
-    def _names_equal(self, name1: str, name2: str) -> bool:
-        """Check if two names are equal considering case sensitivity."""
+    def _name_key(self, name: str) -> str:
+        """Normalize a name for exact comparison considering case sensitivity."""
         if self.case_sensitive:
-            return name1.strip() == name2.strip()
+            return name.strip()
         else:
-            return name1.strip().lower() == name2.strip().lower()
+            return name.strip().lower()
+    
+    def _names_equal(self, name1: str, name2: str) -> bool:
+        """Check if two names are equal considering case sensitivity."""
+        return self._name_key(name1) == self._name_key(name2)
     
     def _is_generic_header(self, header: str) -> bool:
         """Check if header is too generic to be an entity name."""
-        generic_headers = {
-            'introduction', 'overview', 'description', 'summary',
-            'background', 'history', 'details', 'notes', 'information'
-        }
-        return header.lower() in generic_headers
+        return header.lower() in _GENERIC_HEADERS
     
     def _score_to_confidence(self, score: float) -> MatchConfidence:
         """Convert numeric score to confidence level."""
-        if score >= 100:
-            return MatchConfidence.EXACT
-        elif score >= 90:
-            return MatchConfidence.HIGH
-        elif score >= 70:
-            return MatchConfidence.MEDIUM
-        elif score >= 50:
-            return MatchConfidence.LOW
-        else:
-            return MatchConfidence.NONE
-    
-    def _deduplicate_matches(self, matches: List[EntityMatch]) -> List[EntityMatch]:
-        """Remove duplicate matches, keeping the best one."""
-        seen_entities = {}
-        
-        for match in matches:
-            key = str(match.file_path) if match.file_path else match.entity_name
-            
-            if key not in seen_entities or match.similarity_score > seen_entities[key].similarity_score:
-                seen_entities[key] = match
-        
-        return list(seen_entities.values())
+        return _CONFIDENCE_LEVELS[bisect.bisect_right(_CONFIDENCE_THRESHOLDS, score)]
     
     def get_cached_entities(self, entity_type: EntityType) -> List[EntityInfo]:
         """Get cached entities for a specific type."""
@@ -437,6 +887,7 @@ class EntityResolver:
     def clear_cache(self):
         """Clear the entity cache."""
         self._entity_cache.clear()
+        self._entity_index.clear()
 
 
 class EntityResolverError(Exception):
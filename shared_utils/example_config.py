@@ -6,11 +6,89 @@ Supports environment variables, and command-line overrides.
 import os
 import json
 import logging
+import functools
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# Optional: faster JSON (de)serialization for config files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files or directories marking the project root
+PROJECT_ROOT_INDICATORS = ('CLAUDE.md', 'requirements.txt', '.git')
+
+
+@functools.lru_cache(maxsize=8)
+def _find_project_root(cwd: str) -> str:
+    """Find the project root directory above cwd.
+    
+    Cached per working directory so repeated SharedConfig instances skip
+    the stat() calls up the directory tree.
+    """
+    current = Path(cwd)
+    
+    while current != current.parent:
+        for indicator in PROJECT_ROOT_INDICATORS:
+            if (current / indicator).exists():
+                return str(current)
+        current = current.parent
+    
+    # Fall back to current directory
+    return cwd
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(path: Path, obj: Any):
+    """Write obj to path as indented JSON, using orjson when it is installed.
+    
+    The stdlib fallback streams encoder chunks into a buffered file instead
+    of building the whole document as one string first.
+    """
+    with open(path, 'wb', buffering=1 << 20) as f:
+        if orjson is not None:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            for chunk in json.JSONEncoder(indent=2).iterencode(obj):
+                f.write(chunk.encode('utf-8'))
+
+
+# Config file contents keyed by path, with the (mtime_ns, size) they were read at
+_CONFIG_FILE_CACHE: Dict[str, tuple] = {}
+
+
+def _read_config_file(config_path: Path) -> Dict[str, Any]:
+    """Parse a JSON config file, reusing the last read if it is unchanged.
+    
+    The raw bytes are cached rather than the parsed dict: every caller gets
+    its own dict to merge into its sections, and parsing is cheaper than
+    deep-copying the result.
+    """
+    st = config_path.stat()
+    key = str(config_path)
+    cached = _CONFIG_FILE_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return _loads_json(cached[2])
+    
+    data = config_path.read_bytes()
+    _CONFIG_FILE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return _loads_json(data)
+
 class SharedConfig:
-    """Unified configuration management with environment variable support."""
+    """Unified configuration management with environment variable support.
+    
+    Instances deliberately keep a __dict__ rather than __slots__: the
+    configuration sections and derived lookups (replacement engine, silence
+    pattern set) are functools.cached_property values stored there on first use,
+    after which they are read like plain attributes.
+    """
     
     # Default settings for whisper transcription
     DEFAULT_WHISPER_CONFIG = {
@@ -107,14 +185,12 @@ class SharedConfig:
         "armor class": ["armer class", "armor klass", "armore class"]
     }
     
-    # Default silence gibberish patterns
+    # Default silence gibberish patterns (lowercase; matched case-insensitively)
     DEFAULT_SILENCE_PATTERNS = [
-        "you", "You", "Thank you", "Thank You", "thank you.", "Thank you.", 
-        "Hmm", "hmm", "Uh", "uh", "Oh", "oh", "Ah", "ah", "Um", "um",
-        "Mm", "mm", "Mm-hmm", "mm-hmm", "Uh-huh", "uh-huh", "Yeah", "yeah",
-        "Yep", "yep", "Yes", "yes", "No", "no", "Okay", "okay", "OK", "ok",
-        "Alright", "alright", "All right", "all right", "Right", "right",
-        "Well", "well", "So", "so", "I mean", "i mean", "Like", "like"
+        "you", "thank you", "thank you.",
+        "hmm", "uh", "oh", "ah", "um", "mm", "mm-hmm", "uh-huh",
+        "yeah", "yep", "yes", "no", "okay", "ok",
+        "alright", "all right", "right", "well", "so", "i mean", "like"
     ]
     
     # Output configuration
@@ -148,6 +224,8 @@ class SharedConfig:
         "max_tokens": 4000,
         "temperature": 0.1,
         "timeout": 120,
+        "max_concurrent_requests": 4,
+        "cache_dir": None,  # Directory for cached LLM responses (disabled when unset)
         
         # Entity resolution settings
         "fuzzy_threshold": 85.0,
@@ -158,6 +236,7 @@ class SharedConfig:
         # Document management
         "merge_strategy": "intelligent",
         "create_backups": True,
+        "frontmatter_format": "yaml",  # "yaml" or "json"
         "campaign_directory": "campaign_docs",
         
         # Prompt settings
@@ -195,11 +274,41 @@ class SharedConfig:
         "TTRPG_GOOGLE_MODEL": ("ai", "google_model"),
         "TTRPG_AI_MAX_TOKENS": ("ai", "max_tokens", int),
         "TTRPG_AI_TEMPERATURE": ("ai", "temperature", float),
+        "TTRPG_AI_MAX_CONCURRENT": ("ai", "max_concurrent_requests", int),
+        "TTRPG_LLM_CACHE_DIR": ("ai", "cache_dir"),
+        "TTRPG_LLM_CACHE_TTL": ("ai", "cache_ttl", float),
         "TTRPG_AI_FUZZY_THRESHOLD": ("ai", "fuzzy_threshold", float),
         "TTRPG_AI_MERGE_STRATEGY": ("ai", "merge_strategy"),
         "TTRPG_CAMPAIGN_DIR": ("ai", "campaign_directory"),
+        "TTRPG_FRONTMATTER_FORMAT": ("ai", "frontmatter_format"),
+    }
+    
+    # Command line argument -> section it overrides in update_from_args
+    _ARG_SECTIONS = {
+        # Whisper settings
+        "model": "whisper",
+        "language": "whisper",
+        "compression_ratio_threshold": "whisper",
+        "condition_on_previous_text": "whisper",
+        "fp16": "whisper",
+        "temperature": "whisper",
+        "verbose": "whisper",
+        
+        # Cleanup settings
+        "session_name": "cleanup",
+        "part": "cleanup",
+        "base_path": "cleanup",
+        "max_length": "cleanup",
+        "overlap": "cleanup",
+        
+        # Output settings
+        "output_dir": "output",
+        "temp_dir": "output",
     }
     
+    # Environment variable values treated as True for bool settings
+    _BOOL_TRUE = frozenset(('true', '1', 'yes', 'on'))
+    
     def __init__(self, config_file: Optional[str] = None, project_root: Optional[str] = None):
         """Initialize shared configuration.
         
@@ -207,17 +316,7 @@ class SharedConfig:
             config_file: Path to JSON config file
             project_root: Root directory of the project (for relative paths)
         """
-        self.project_root = project_root or self._find_project_root()
-        
-        # Initialize configuration dictionaries
-        self.whisper = self.DEFAULT_WHISPER_CONFIG.copy()
-        self.cleanup = self.DEFAULT_CLEANUP_CONFIG.copy()
-        self.output = self.DEFAULT_OUTPUT_CONFIG.copy()
-        self.progress = self.DEFAULT_PROGRESS_CONFIG.copy()
-        self.ai = self.DEFAULT_AI_CONFIG.copy()
-        self.name_mappings = getattr(self, 'DEFAULT_NAME_MAPPINGS', {}).copy()
-        self.silence_patterns = getattr(self, 'DEFAULT_SILENCE_PATTERNS', []).copy()
-        self.text_replacements = getattr(self, 'DEFAULT_TEXT_REPLACEMENTS', {}).copy()
+        self.project_root = project_root or _find_project_root(str(Path.cwd()))
         
         # Set computed defaults
         self._set_computed_defaults()
@@ -229,21 +328,6 @@ class SharedConfig:
         if config_file:
             self.load_from_file(config_file)
     
-    def _find_project_root(self) -> str:
-        """Find the project root directory."""
-        current = Path.cwd()
-        
-        # Look for common project indicators
-        indicators = ['CLAUDE.md', 'requirements.txt', '.git']
-        
-        while current != current.parent:
-            if any((current / indicator).exists() for indicator in indicators):
-                return str(current)
-            current = current.parent
-        
-        # Fall back to current directory
-        return str(Path.cwd())
-    
     def _set_computed_defaults(self):
         """Set computed default values."""
         if not self.cleanup["base_path"]:
@@ -253,29 +337,94 @@ class SharedConfig:
                 self.cleanup["part"]
             )
     
+    # Configuration sections, copied from the class defaults on first access
+    @functools.cached_property
+    def whisper(self) -> Dict[str, Any]:
+        """Whisper transcription settings."""
+        return self.DEFAULT_WHISPER_CONFIG.copy()
+    
+    @functools.cached_property
+    def cleanup(self) -> Dict[str, Any]:
+        """Transcript cleanup settings."""
+        return self.DEFAULT_CLEANUP_CONFIG.copy()
+    
+    @functools.cached_property
+    def output(self) -> Dict[str, Any]:
+        """Output settings."""
+        return self.DEFAULT_OUTPUT_CONFIG.copy()
+    
+    @functools.cached_property
+    def progress(self) -> Dict[str, Any]:
+        """Progress and logging settings."""
+        return self.DEFAULT_PROGRESS_CONFIG.copy()
+    
+    @functools.cached_property
+    def ai(self) -> Dict[str, Any]:
+        """AI campaign generation settings."""
+        return self.DEFAULT_AI_CONFIG.copy()
+    
+    @functools.cached_property
+    def name_mappings(self) -> Dict[str, str]:
+        """Discord username -> player/character name mappings."""
+        return getattr(self, 'DEFAULT_NAME_MAPPINGS', {}).copy()
+    
+    @functools.cached_property
+    def silence_patterns(self) -> List[str]:
+        """Transcript segments treated as silence gibberish."""
+        return getattr(self, 'DEFAULT_SILENCE_PATTERNS', []).copy()
+    
+    @functools.cached_property
+    def text_replacements(self) -> Dict[str, List[str]]:
+        """Correct term -> misheard variants replacement mapping."""
+        return getattr(self, 'DEFAULT_TEXT_REPLACEMENTS', {}).copy()
+    
+    @property
+    def replacement_engine(self):
+        """ReplacementEngine compiled from text_replacements.
+        
+        Shares text_processing's engine cache, which rebuilds the engine when
+        text_replacements is edited in place or replaced.
+        """
+        # Imported here: text_processing imports SharedConfig from this package
+        from .text_processing import _get_replacement_engine
+        return _get_replacement_engine(self.text_replacements, True)
+    
+    @property
+    def silence_pattern_set(self) -> frozenset:
+        """Current silence_patterns as a frozenset (used as-is by remove_silence_gibberish)."""
+        return frozenset(self.silence_patterns)
+    
     def _load_from_environment(self):
         """Load configuration from environment variables."""
-        for env_var, mapping in self.ENV_MAPPINGS.items():
-            value = os.environ.get(env_var)
-            if value is not None:
-                section, key = mapping[0], mapping[1]
-                type_converter = mapping[2] if len(mapping) > 2 else str
-                
-                # Convert value to appropriate type
-                if type_converter == bool:
-                    converted_value = value.lower() in ('true', '1', 'yes', 'on')
-                elif type_converter == int:
-                    try:
-                        converted_value = int(value)
-                    except ValueError:
-                        logging.warning(f"Invalid integer value for {env_var}: {value}")
-                        continue
-                else:
-                    converted_value = value
-                
-                # Set the value in the appropriate section
-                config_section = getattr(self, section)
-                config_section[key] = converted_value
+        env = os.environ
+        
+        # Only visit mapped variables that are actually set
+        for env_var in env.keys() & self.ENV_MAPPINGS.keys():
+            mapping = self.ENV_MAPPINGS[env_var]
+            value = env[env_var]
+            section, key = mapping[0], mapping[1]
+            type_converter = mapping[2] if len(mapping) > 2 else str
+            
+            # Convert value to appropriate type
+            if type_converter == bool:
+                converted_value = value.lower() in self._BOOL_TRUE
+            elif type_converter == int:
+                try:
+                    converted_value = int(value)
+                except ValueError:
+                    logging.warning(f"Invalid integer value for {env_var}: {value}")
+                    continue
+            elif type_converter == float:
+                try:
+                    converted_value = float(value)
+                except ValueError:
+                    logging.warning(f"Invalid float value for {env_var}: {value}")
+                    continue
+            else:
+                converted_value = value
+            
+            # Set the value in the appropriate section
+            getattr(self, section)[key] = converted_value
     
     def load_from_file(self, config_file: str):
         """Load configuration from JSON file."""
@@ -288,8 +437,7 @@ class SharedConfig:
             return
         
         try:
-            with open(config_path, 'r') as f:
-                file_config = json.load(f)
+            file_config = _read_config_file(config_path)
             
             # Update sections with file values
             for section_name in ['whisper', 'cleanup', 'output', 'progress']:
@@ -302,7 +450,7 @@ class SharedConfig:
                 self.name_mappings.update(file_config['name_mappings'])
             
             if 'silence_patterns' in file_config:
-                self.silence_patterns = file_config['silence_patterns']
+                self.silence_patterns = list(file_config['silence_patterns'])
                 
             if 'text_replacements' in file_config:
                 self.text_replacements.update(file_config['text_replacements'])
@@ -317,24 +465,15 @@ class SharedConfig:
     
     def update_from_args(self, args):
         """Update configuration from command line arguments."""
-        # Whisper settings
-        for attr in ['model', 'language', 'compression_ratio_threshold', 
-                     'condition_on_previous_text', 'fp16', 'temperature', 'verbose']:
-            if hasattr(args, attr) and getattr(args, attr) is not None:
-                self.whisper[attr] = getattr(args, attr)
-        
-        # Cleanup settings
-        for attr in ['session_name', 'part', 'base_path', 'max_length', 'overlap']:
-            if hasattr(args, attr) and getattr(args, attr) is not None:
-                self.cleanup[attr] = getattr(args, attr)
-        
-        # Output settings
-        for attr in ['output_dir', 'temp_dir']:
-            if hasattr(args, attr) and getattr(args, attr) is not None:
-                self.output[attr] = getattr(args, attr)
+        for name, value in vars(args).items():
+            if value is None:
+                continue
+            section = self._ARG_SECTIONS.get(name)
+            if section is not None:
+                getattr(self, section)[name] = value
         
         # Progress settings
-        if hasattr(args, 'verbose') and args.verbose is not None:
+        if getattr(args, 'verbose', None) is not None:
             self.progress['show_whisper_output'] = args.verbose
         
         # Recompute dependent values after updates
@@ -373,8 +512,8 @@ class SharedConfig:
         }
         
         config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(config_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        _write_json(config_path, config_dict)
+        _CONFIG_FILE_CACHE.pop(str(config_path), None)
         
         logging.info(f"Configuration saved to {config_path}")
     
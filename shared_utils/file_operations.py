@@ -4,16 +4,45 @@ Contains functions for handling files, directories, and data I/O.
 """
 
 import os
+import fnmatch
 import shutil
 import zipfile
 import tempfile
-import pandas as pd
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union, Tuple, Dict, Any
+from typing import Iterator, List, Optional, Union, Tuple, Dict, Any, TYPE_CHECKING
 import logging
 
 from .logging_config import get_logger
 
+# pandas, numpy and pyarrow are imported inside the DataFrame helpers so that
+# file and zip utilities do not pay their import cost
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Rows read per chunk when merge_csv_files streams into the output file
+MERGE_CSV_CHUNK_ROWS = 100_000
+
+@functools.lru_cache(maxsize=None)
+def _load_pyarrow():
+    """Import pyarrow on first use.
+    
+    pyarrow is optional; when installed, load_tsv_file and merge_csv_files
+    use its multithreaded columnar CSV reader.
+    
+    Returns:
+        Tuple of (pyarrow, pyarrow.compute, pyarrow.csv), or None if pyarrow
+        is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return None
+    return pa, pc, pacsv
+
 def ensure_directory_exists(directory_path: Union[str, Path], 
                            create_parents: bool = True) -> Path:
     """Ensure a directory exists, creating it if necessary.
@@ -49,14 +78,30 @@ def find_files_by_pattern(directory: Union[str, Path],
         logger.warning(f"Directory not found: {path}")
         return []
     
-    if recursive:
-        files = list(path.rglob(pattern))
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        # Multi-component patterns need pathlib's matching
+        files = list(path.rglob(pattern) if recursive else path.glob(pattern))
     else:
-        files = list(path.glob(pattern))
+        files = list(_fast_glob(path, pattern, recursive))
     
     logger.debug(f"Found {len(files)} files matching '{pattern}' in {path}")
     return files
 
+def _fast_glob(root: Path, pattern: str, recursive: bool) -> Iterator[Path]:
+    """Yield entries under root whose name matches a single-component pattern.
+    
+    Uses os.scandir and matches on entry names so Path objects are only
+    built for matches. Symlinked directories are not descended into.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                if fnmatch.fnmatchcase(entry.name, pattern):
+                    yield Path(entry.path)
+
 def extract_zip_file(zip_path: Union[str, Path],
                     extract_to: Optional[Union[str, Path]] = None,
                     temp_dir: bool = False) -> Tuple[Path, bool]:
@@ -90,10 +135,19 @@ def extract_zip_file(zip_path: Union[str, Path],
     
     try:
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
+            infos = zip_ref.infolist()
+            file_infos = [info for info in infos if not info.is_dir()]
+            
+            if len(file_infos) < 2:
+                # Nothing to parallelize
+                zip_ref.extractall(extract_path)
+            else:
+                for info in infos:
+                    if info.is_dir():
+                        zip_ref.extract(info, extract_path)
+                _extract_zip_members_parallel(zip_path, file_infos, extract_path)
         
-        extracted_files = list(extract_path.rglob("*"))
-        logger.info(f"Extracted {len(extracted_files)} files from {zip_path.name} to {extract_path}")
+        logger.info(f"Extracted {len(file_infos)} files from {zip_path.name} to {extract_path}")
         
     except Exception as e:
         if is_temp:
@@ -102,6 +156,35 @@ def extract_zip_file(zip_path: Union[str, Path],
     
     return extract_path, is_temp
 
+def _extract_zip_members_parallel(zip_path: Path,
+                                  file_infos: List[zipfile.ZipInfo],
+                                  extract_path: Path):
+    """Extract zip file members across a thread pool.
+    
+    zlib releases the GIL while decompressing, so members are split into one
+    batch per worker (largest first, dealt round-robin) and each worker
+    extracts its batch through its own ZipFile handle.
+    """
+    workers = min(len(file_infos), os.cpu_count() or 1)
+    ordered = sorted(file_infos, key=lambda info: info.file_size, reverse=True)
+    batches = [ordered[i::workers] for i in range(workers)]
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # list() re-raises the first worker exception
+        list(executor.map(lambda batch: _extract_zip_members(zip_path, batch, extract_path), batches))
+
+def _extract_zip_members(zip_path: Path,
+                         infos: List[zipfile.ZipInfo],
+                         extract_path: Path):
+    """Extract zip file members using a dedicated ZipFile handle."""
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for info in infos:
+            try:
+                zip_ref.extract(info, extract_path)
+            except FileExistsError:
+                # Another worker created the parent directory concurrently
+                zip_ref.extract(info, extract_path)
+
 def cleanup_temp_directory(temp_path: Union[str, Path]):
     """Clean up a temporary directory.
     
@@ -144,7 +227,9 @@ def copy_default_config_if_missing(default_file: Union[str, Path],
         return False
     
     try:
-        shutil.copy2(default_path, target_path)
+        # Config contents only; copyfile skips copying permissions and timestamps
+        ensure_directory_exists(target_path.parent)
+        shutil.copyfile(default_path, target_path)
         logger.info(f"Copied default config: {default_path} -> {target_path}")
         return True
     except Exception as e:
@@ -152,7 +237,7 @@ def copy_default_config_if_missing(default_file: Union[str, Path],
         return False
 
 def load_tsv_file(file_path: Union[str, Path], 
-                 encoding: str = 'utf-8') -> pd.DataFrame:
+                 encoding: str = 'utf-8') -> 'pd.DataFrame':
     """Load a TSV file into a pandas DataFrame.
     
     Args:
@@ -168,15 +253,29 @@ def load_tsv_file(file_path: Union[str, Path],
     if not file_path.exists():
         raise FileNotFoundError(f"TSV file not found: {file_path}")
     
+    import pandas as pd
+    
     try:
-        df = pd.read_csv(file_path, delimiter='\t', encoding=encoding)
+        arrow = _load_pyarrow()
+        if arrow is not None:
+            _, _, pacsv = arrow
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(encoding=encoding),
+                parse_options=pacsv.ParseOptions(delimiter='\t'),
+                # Empty or NA text becomes NaN, as with pandas
+                convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+            )
+            df = table.to_pandas(self_destruct=True)
+        else:
+            df = pd.read_csv(file_path, delimiter='\t', encoding=encoding)
         logger.debug(f"Loaded TSV file: {file_path} ({len(df)} rows)")
         return df
     except Exception as e:
         logger.error(f"Failed to load TSV file {file_path}: {e}")
         raise
 
-def save_dataframe(df: pd.DataFrame,
+def save_dataframe(df: 'pd.DataFrame',
                   file_path: Union[str, Path],
                   format_type: str = 'csv',
                   encoding: str = 'utf-8',
@@ -217,50 +316,184 @@ def save_dataframe(df: pd.DataFrame,
 def merge_csv_files(file_paths: List[Union[str, Path]],
                    output_path: Union[str, Path],
                    sort_column: Optional[str] = None,
-                   encoding: str = 'utf-8') -> pd.DataFrame:
+                   encoding: str = 'utf-8',
+                   return_dataframe: bool = True) -> Optional['pd.DataFrame']:
     """Merge multiple CSV files into one.
     
+    With ``return_dataframe=False`` and no sort column, files sharing the
+    same header are streamed into the output in chunks instead of being
+    held in memory together.
+    
     Args:
         file_paths: List of CSV file paths to merge
         output_path: Path for the merged output file
         sort_column: Column name to sort by after merging
         encoding: File encoding
+        return_dataframe: Whether to build and return the merged DataFrame
     
     Returns:
-        Merged DataFrame
+        Merged DataFrame, or None when the files were streamed
     """
     logger = get_logger()
     
     if not file_paths:
         raise ValueError("No files provided for merging")
     
-    dataframes = []
+    existing_paths = []
     for file_path in file_paths:
         file_path = Path(file_path)
         if file_path.exists():
-            df = pd.read_csv(file_path, encoding=encoding)
-            # Add source file column for tracking
-            df['source_file'] = file_path.name
-            dataframes.append(df)
-            logger.debug(f"Loaded {len(df)} rows from {file_path.name}")
+            existing_paths.append(file_path)
         else:
             logger.warning(f"File not found, skipping: {file_path}")
     
-    if not dataframes:
+    if not existing_paths:
         raise RuntimeError("No valid files found to merge")
     
+    if not return_dataframe and sort_column is None:
+        columns = _shared_csv_columns(existing_paths, encoding)
+        if columns is not None:
+            total_rows = _stream_csv_files(existing_paths, output_path, columns, encoding)
+            logger.info(f"Merged {len(file_paths)} files into {output_path} ({total_rows} total rows)")
+            return None
+        logger.debug("CSV headers differ, merging in memory")
+    
+    if _load_pyarrow() is not None:
+        merged_df = _merge_csv_files_arrow(existing_paths, sort_column, encoding)
+    else:
+        merged_df = _merge_csv_files_pandas(existing_paths, sort_column, encoding)
+    
+    # Save merged file
+    save_dataframe(merged_df, output_path, encoding=encoding)
+    
+    logger.info(f"Merged {len(file_paths)} files into {output_path} ({len(merged_df)} total rows)")
+    return merged_df if return_dataframe else None
+
+def _shared_csv_columns(file_paths: List[Path], encoding: str) -> Optional[List[str]]:
+    """Get the column names shared by all CSV files, or None if they differ."""
+    import pandas as pd
+    
+    columns = None
+    for file_path in file_paths:
+        file_columns = list(pd.read_csv(file_path, encoding=encoding, nrows=0).columns)
+        if columns is None:
+            columns = file_columns
+        elif file_columns != columns:
+            return None
+    return columns
+
+def _stream_csv_files(file_paths: List[Path],
+                      output_path: Union[str, Path],
+                      columns: List[str],
+                      encoding: str) -> int:
+    """Append CSV files with identical columns to output_path chunk by chunk.
+    
+    Returns:
+        Number of data rows written
+    """
+    import pandas as pd
+    
+    logger = get_logger()
+    output_path = Path(output_path)
+    ensure_directory_exists(output_path.parent)
+    
+    output_columns = columns if 'source_file' in columns else columns + ['source_file']
+    total_rows = 0
+    
+    with open(output_path, 'w', encoding=encoding, newline='') as out:
+        pd.DataFrame(columns=output_columns).to_csv(out, index=False)
+        for file_path in file_paths:
+            file_rows = 0
+            for chunk in pd.read_csv(file_path, encoding=encoding, chunksize=MERGE_CSV_CHUNK_ROWS):
+                # Add source file column for tracking
+                chunk['source_file'] = file_path.name
+                chunk.to_csv(out, index=False, header=False)
+                file_rows += len(chunk)
+            total_rows += file_rows
+            logger.debug(f"Streamed {file_rows} rows from {file_path.name}")
+    
+    return total_rows
+
+def _source_file_categories(file_paths: List[Path]) -> List[str]:
+    """Get the sorted, unique file names used as source_file categories.
+    
+    Every file shares the same categories so the categorical column survives
+    concatenation, and sorted categories keep the codes in name order.
+    """
+    return sorted({file_path.name for file_path in file_paths})
+
+def _merge_csv_files_arrow(file_paths: List[Path],
+                           sort_column: Optional[str],
+                           encoding: str) -> 'pd.DataFrame':
+    """Merge CSV files as Arrow tables and convert to pandas once at the end."""
+    import numpy as np
+    
+    pa, pc, pacsv = _load_pyarrow()
+    logger = get_logger()
+    read_options = pacsv.ReadOptions(encoding=encoding)
+    source_names = _source_file_categories(file_paths)
+    source_codes = {name: code for code, name in enumerate(source_names)}
+    source_dictionary = pa.array(source_names, type=pa.string())
+    
+    tables = []
+    for file_path in file_paths:
+        table = pacsv.read_csv(file_path, read_options=read_options)
+        # Add source file column for tracking (dictionary-encoded)
+        codes = np.full(table.num_rows, source_codes[file_path.name], dtype=np.int32)
+        source_column = pa.DictionaryArray.from_arrays(codes, source_dictionary)
+        if 'source_file' in table.column_names:
+            table = table.set_column(
+                table.column_names.index('source_file'), 'source_file', source_column
+            )
+        else:
+            table = table.append_column('source_file', source_column)
+        tables.append(table)
+        logger.debug(f"Loaded {table.num_rows} rows from {file_path.name}")
+    
+    # Concatenating Arrow tables appends chunks rather than copying data
+    merged = pa.concat_tables(tables, promote_options='permissive')
+    
+    if sort_column == 'source_file':
+        # Arrow cannot sort dictionary columns, but the codes follow name order
+        codes = merged['source_file'].combine_chunks().indices
+        merged = merged.take(pc.sort_indices(codes))
+        logger.info(f"Sorted merged data by '{sort_column}'")
+    elif sort_column and sort_column in merged.column_names:
+        merged = merged.sort_by(sort_column)
+        logger.info(f"Sorted merged data by '{sort_column}'")
+    
+    return merged.to_pandas(self_destruct=True)
+
+def _merge_csv_files_pandas(file_paths: List[Path],
+                            sort_column: Optional[str],
+                            encoding: str) -> 'pd.DataFrame':
+    """Merge CSV files by loading each with pandas and concatenating."""
+    import numpy as np
+    import pandas as pd
+    
+    logger = get_logger()
+    source_names = _source_file_categories(file_paths)
+    source_codes = {name: code for code, name in enumerate(source_names)}
+    
+    dataframes = []
+    for file_path in file_paths:
+        df = pd.read_csv(file_path, encoding=encoding)
+        # Add source file column for tracking (categorical)
+        codes = np.full(len(df), source_codes[file_path.name], dtype=np.int32)
+        df['source_file'] = pd.Categorical.from_codes(codes, categories=source_names)
+        dataframes.append(df)
+        logger.debug(f"Loaded {len(df)} rows from {file_path.name}")
+    
     # Merge all DataFrames
     merged_df = pd.concat(dataframes, ignore_index=True)
     
     # Sort if requested
     if sort_column and sort_column in merged_df.columns:
-        merged_df = merged_df.sort_values(sort_column).reset_index(drop=True)
+        merged_df = merged_df.sort_values(
+            sort_column, kind='mergesort' if sort_column == 'source_file' else 'quicksort'
+        ).reset_index(drop=True)
         logger.info(f"Sorted merged data by '{sort_column}'")
     
-    # Save merged file
-    save_dataframe(merged_df, output_path, encoding=encoding)
-    
-    logger.info(f"Merged {len(file_paths)} files into {output_path} ({len(merged_df)} total rows)")
     return merged_df
 
 def get_file_stats(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -314,6 +547,9 @@ def organize_output_files(source_dir: Union[str, Path],
     ensure_directory_exists(output_path)
     organized_files = {}
     
+    # Same filesystem: each move is a single rename
+    same_fs = source_path.stat().st_dev == output_path.stat().st_dev
+    
     for subdir_name, pattern in file_patterns.items():
         # Find files matching pattern
         files = find_files_by_pattern(source_path, pattern, recursive=False)
@@ -328,7 +564,10 @@ def organize_output_files(source_dir: Union[str, Path],
         for file_path in files:
             dest_path = subdir / file_path.name
             try:
-                shutil.move(str(file_path), str(dest_path))
+                if same_fs:
+                    os.replace(file_path, dest_path)
+                else:
+                    shutil.move(str(file_path), str(dest_path))
                 moved_files.append(dest_path)
                 logger.debug(f"Moved {file_path.name} to {subdir_name}/")
             except Exception as e:
@@ -0,0 +1,112 @@
+"""
+Disk cache for LLM responses used in campaign document generation.
+Avoids re-paying for identical requests when a session is regenerated.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from .llm_client import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(fields: Iterable[str]) -> str:
+    """Build a content-addressed cache key from request fields.
+
+    Each field is length-prefixed before hashing so that different field
+    splits of the same text can never produce the same key.
+
+    Args:
+        fields: Strings identifying the request (provider, model, prompt, ...)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for field in fields:
+        data = field.encode('utf-8')
+        digest.update(len(data).to_bytes(8, 'little'))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class LLMCache:
+    """Stores LLM responses as JSON files keyed by request hash."""
+
+    def __init__(self, cache_dir: Union[str, Path], ttl: Optional[Union[float, str]] = None):
+        """Initialize cache rooted at cache_dir (created on first write).
+        
+        Entries older than ttl seconds are treated as misses; None keeps
+        them forever.
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl = None
+        if ttl is not None:
+            try:
+                self.ttl = float(ttl)
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring invalid LLM cache ttl: {ttl!r}")
+
+    def _path_for(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Return the cached response for key, or None on a miss."""
+        path = self._path_for(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            response = LLMResponse(**entry['response'])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        if self.ttl is not None and time.time() - entry.get('cached_at', 0) > self.ttl:
+            logger.debug(f"LLM cache entry expired: {key[:12]}")
+            return None
+
+        logger.debug(f"LLM cache hit: {key[:12]}")
+        return response
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response under key, replacing any existing entry."""
+        path = self._path_for(key)
+        entry = {
+            'cached_at': time.time(),
+            'provider': response.provider,
+            'model': response.model,
+            'response': asdict(response),
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Failed to write LLM cache entry {path}: {e}")
+            return
+
+        logger.debug(f"LLM cache stored: {key[:12]}")
+
+
+class LLMCacheError(Exception):
+    """Base exception for LLM cache errors."""
+    pass
@@ -3,11 +3,15 @@ LLM client for AI-powered campaign document generation.
 Supports OpenAI, Anthropic Claude, and Google Gemini via LiteLLM.
 """
 
+import asyncio
 import os
 import json
 import logging
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+import random
+import tempfile
+import time
+from typing import Dict, Any, Optional, List, Sequence, Tuple, Union
+from dataclasses import dataclass, replace
 from dotenv import load_dotenv
 
 try:
@@ -15,8 +19,50 @@ try:
 except ImportError:
     litellm = None
 
+# httpx ships with LiteLLM; used for a shared keep-alive connection pool
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+# OpenAI-compatible endpoint used for Batch API requests
+BATCH_ENDPOINT = '/v1/chat/completions'
+
+# Batch statuses after which no further progress will be made
+BATCH_TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+# Providers whose Batch API accepts the OpenAI-style JSONL that submit_batch builds
+BATCH_PROVIDERS = frozenset({'openai'})
+
+# Seconds to wait for a batch before giving up; a little over the 24h
+# completion window, after which the provider expires the batch anyway
+BATCH_TIMEOUT = 25 * 60 * 60
+
+# LiteLLM exceptions worth retrying (rate limits, timeouts, transient server errors)
+RETRYABLE_ERROR_NAMES = (
+    'RateLimitError', 'APIConnectionError', 'Timeout',
+    'ServiceUnavailableError', 'InternalServerError', 'APIError'
+)
+
+# Retry defaults, overridable with the max_retries / retry_base_delay /
+# retry_max_delay config keys
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BASE_DELAY = 1.0
+DEFAULT_RETRY_MAX_DELAY = 30.0
+
+# Connection pool settings for the keep-alive HTTP clients handed to LiteLLM
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 30.0
+HTTP_TIMEOUT = 120.0
+
+# Responses are cached (when cache_dir is configured) only for requests at or
+# below this temperature, where repeating the call would give the same answer.
+# Overridden by the cache_max_temperature setting.
+CACHEABLE_MAX_TEMPERATURE = 0.05
+
 
 @dataclass
 class LLMResponse:
@@ -48,6 +94,13 @@ class LLMClient:
         ]
     }
     
+    # Environment variable holding each provider's API key
+    PROVIDER_API_KEYS = {
+        'openai': 'OPENAI_API_KEY',
+        'anthropic': 'ANTHROPIC_API_KEY',
+        'google': 'GOOGLE_API_KEY'
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize LLM client with configuration."""
         self.config = config or {}
@@ -69,22 +122,68 @@ class LLMClient:
             'google': self.config.get('google_model', 'gemini-1.5-pro')
         }
         
+        # Retry settings for transient provider errors
+        self.max_retries = max(0, int(self.config.get('max_retries', DEFAULT_MAX_RETRIES)))
+        self.retry_base_delay = float(self.config.get('retry_base_delay', DEFAULT_RETRY_BASE_DELAY))
+        self.retry_max_delay = float(self.config.get('retry_max_delay', DEFAULT_RETRY_MAX_DELAY))
+        self._retryable_errors = tuple(
+            error for error in (
+                getattr(litellm.exceptions, name, None) for name in RETRYABLE_ERROR_NAMES
+            ) if isinstance(error, type)
+        )
+        
+        # Optional disk cache for deterministic (low-temperature) responses
+        self.response_cache = None
+        self.cache_max_temperature = float(
+            self.config.get('cache_max_temperature', CACHEABLE_MAX_TEMPERATURE)
+        )
+        if self.config.get('cache_dir'):
+            # Imported here: llm_cache imports LLMResponse from this module
+            from .llm_cache import LLMCache
+            self.response_cache = LLMCache(self.config['cache_dir'], ttl=self.config.get('cache_ttl'))
+        
         # Validate API keys
         self._validate_api_keys()
         
+        # Reuse connections across requests instead of a TCP/TLS handshake per
+        # call; created last so a failed init never leaves a pool open
+        self._http_client = None
+        if httpx is not None:
+            self._http_client = httpx.Client(limits=self._http_limits(), timeout=HTTP_TIMEOUT)
+            litellm.client_session = self._http_client
+        
         logger.info("LLM client initialized with providers: %s", 
                    list(self.default_models.keys()))
     
-    def _validate_api_keys(self):
-        """Validate that required API keys are available."""
-        key_mapping = {
-            'openai': 'OPENAI_API_KEY',
-            'anthropic': 'ANTHROPIC_API_KEY', 
-            'google': 'GOOGLE_API_KEY'
-        }
+    @staticmethod
+    def _http_limits():
+        """Connection pool limits shared by the sync and async HTTP clients."""
+        return httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+        )
+    
+    def close(self):
+        """Close the pooled HTTP connections used by this client."""
+        if self._http_client is None:
+            return
         
+        if litellm.client_session is self._http_client:
+            litellm.client_session = None
+        self._http_client.close()
+        self._http_client = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _validate_api_keys(self):
+        """Validate that required API keys are available and record the providers that have them."""
         available_providers = []
-        for provider, env_key in key_mapping.items():
+        for provider, env_key in self.PROVIDER_API_KEYS.items():
             if os.getenv(env_key):
                 available_providers.append(provider)
             else:
@@ -93,22 +192,21 @@ class LLMClient:
         if not available_providers:
             raise ValueError(
                 "No valid API keys found. Please set at least one of: "
-                f"{', '.join(key_mapping.values())}"
+                f"{', '.join(self.PROVIDER_API_KEYS.values())}"
             )
         
+        self._available_providers = frozenset(available_providers)
         logger.info("Available LLM providers: %s", available_providers)
     
+    def refresh_providers(self):
+        """Re-read provider API keys from the environment (e.g. after setting one at runtime)."""
+        self._validate_api_keys()
+    
     def get_available_providers(self) -> List[str]:
         """Get list of providers with valid API keys."""
-        key_mapping = {
-            'openai': 'OPENAI_API_KEY',
-            'anthropic': 'ANTHROPIC_API_KEY', 
-            'google': 'GOOGLE_API_KEY'
-        }
-        
         return [
-            provider for provider, env_key in key_mapping.items()
-            if os.getenv(env_key)
+            provider for provider in self.PROVIDER_API_KEYS
+            if provider in self._available_providers
         ]
     
     def get_provider_models(self, provider: str) -> List[str]:
@@ -126,7 +224,152 @@ class LLMClient:
     ) -> LLMResponse:
         """Generate content using specified LLM provider."""
         
-        if provider not in self.get_available_providers():
+        full_model, model, messages = self._prepare_request(
+            prompt, provider, model, system_prompt
+        )
+        
+        cache_key = self._response_cache_key(provider, model, system_prompt, prompt, max_tokens, temperature)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        attempt = 0
+        while True:
+            try:
+                # Make LiteLLM call
+                logger.debug(f"Calling {full_model} with {len(prompt)} chars")
+                
+                response = litellm.completion(
+                    model=full_model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout=120  # 2 minute timeout
+                )
+                
+                llm_response = self._build_response(response, full_model, model, provider)
+                self._store_cached_response(cache_key, llm_response)
+                return llm_response
+                
+            except self._retryable_errors as e:
+                if attempt >= self.max_retries:
+                    logger.error(f"LLM generation failed for {provider}/{model}: {e}")
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(
+                    f"Transient error from {provider}/{model} ({e}); "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                attempt += 1
+            except Exception as e:
+                logger.error(f"LLM generation failed for {provider}/{model}: {e}")
+                raise
+    
+    async def agenerate_content(
+        self,
+        prompt: str,
+        provider: str = 'anthropic',
+        model: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        """Async variant of generate_content, for issuing requests concurrently."""
+        
+        full_model, model, messages = self._prepare_request(
+            prompt, provider, model, system_prompt
+        )
+        
+        cache_key = self._response_cache_key(provider, model, system_prompt, prompt, max_tokens, temperature)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        attempt = 0
+        while True:
+            try:
+                logger.debug(f"Calling {full_model} with {len(prompt)} chars (async)")
+                
+                response = await litellm.acompletion(
+                    model=full_model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    timeout=120  # 2 minute timeout
+                )
+                
+                llm_response = self._build_response(response, full_model, model, provider)
+                self._store_cached_response(cache_key, llm_response)
+                return llm_response
+                
+            except self._retryable_errors as e:
+                if attempt >= self.max_retries:
+                    logger.error(f"LLM generation failed for {provider}/{model}: {e}")
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.warning(
+                    f"Transient error from {provider}/{model} ({e}); "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+            except Exception as e:
+                logger.error(f"LLM generation failed for {provider}/{model}: {e}")
+                raise
+    
+    def _response_cache_key(
+        self,
+        provider: str,
+        model: str,
+        system_prompt: Optional[str],
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Optional[str]:
+        """Get the response cache key for a request, or None if it should not be cached."""
+        
+        if self.response_cache is None or temperature > self.cache_max_temperature:
+            return None
+        
+        # Imported here: llm_cache imports LLMResponse from this module
+        from .llm_cache import make_cache_key
+        return make_cache_key((
+            provider, model, system_prompt or '', prompt, str(max_tokens), repr(float(temperature))
+        ))
+    
+    def _get_cached_response(self, cache_key: Optional[str]) -> Optional[LLMResponse]:
+        """Look up a cached response; hits report zero cost since nothing was spent."""
+        
+        if cache_key is None:
+            return None
+        
+        cached = self.response_cache.get(cache_key)
+        if cached is None:
+            return None
+        
+        logger.info(f"Using cached response from {cached.provider}/{cached.model}")
+        return replace(cached, cost=0.0)
+    
+    def _store_cached_response(self, cache_key: Optional[str], llm_response: LLMResponse):
+        """Store a response in the cache if the request is cacheable."""
+        if cache_key is not None:
+            self.response_cache.put(cache_key, llm_response)
+    
+    def _retry_delay(self, attempt: int) -> float:
+        """Exponential backoff with up to a second of jitter, capped at retry_max_delay."""
+        return min(self.retry_base_delay * 2 ** attempt + random.uniform(0, 1), self.retry_max_delay)
+    
+    def _prepare_request(
+        self,
+        prompt: str,
+        provider: str,
+        model: Optional[str],
+        system_prompt: Optional[str]
+    ) -> Tuple[str, str, List[Dict[str, str]]]:
+        """Resolve the model and build the message list for a completion call."""
+        
+        if provider not in self._available_providers:
             raise ValueError(f"Provider {provider} not available or no API key")
         
         # Use default model if none specified
@@ -139,47 +382,259 @@ class LLMClient:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
+        return f"{provider}/{model}", model, messages
+    
+    def _build_response(self, response, full_model: str, model: str, provider: str) -> LLMResponse:
+        """Convert a LiteLLM completion response into an LLMResponse."""
+        
+        # Extract response data
+        content = response.choices[0].message.content
+        tokens_used = response.usage.total_tokens if response.usage else None
+        
+        # Calculate cost if available
+        cost = None
+        try:
+            cost = litellm.completion_cost(completion_response=response)
+        except Exception as e:
+            logger.debug(f"Could not calculate cost: {e}")
+        
+        logger.info(
+            f"Generated {len(content)} chars using {full_model} "
+            f"(tokens: {tokens_used}, cost: ${cost:.4f})" if cost else
+            f"(tokens: {tokens_used})"
+        )
+        
+        return LLMResponse(
+            content=content,
+            model=model,
+            provider=provider,
+            tokens_used=tokens_used,
+            cost=cost
+        )
+    
+    def submit_batch(
+        self,
+        prompts: Dict[str, str],
+        provider: str = 'openai',
+        model: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None
+    ) -> str:
+        """Submit prompts (keyed by custom id) as a single Batch API job and return its id."""
+        
+        if provider not in BATCH_PROVIDERS:
+            raise LLMClientError(
+                f"Batch API is not supported for {provider}; "
+                f"supported providers: {', '.join(sorted(BATCH_PROVIDERS))}"
+            )
+        
+        lines = []
+        for custom_id, prompt in prompts.items():
+            _, request_model, messages = self._prepare_request(prompt, provider, model, system_prompt)
+            lines.append(json.dumps({
+                'custom_id': custom_id,
+                'method': 'POST',
+                'url': BATCH_ENDPOINT,
+                'body': {
+                    'model': request_model,
+                    'messages': messages,
+                    'max_tokens': max_tokens,
+                    'temperature': temperature
+                }
+            }))
+        
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False, encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+            batch_input_path = f.name
+        
         try:
-            # Make LiteLLM call
-            full_model = f"{provider}/{model}"
-            logger.debug(f"Calling {full_model} with {len(prompt)} chars")
+            with open(batch_input_path, 'rb') as f:
+                batch_file = litellm.create_file(
+                    file=f,
+                    purpose='batch',
+                    custom_llm_provider=provider
+                )
             
-            response = litellm.completion(
-                model=full_model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                timeout=120  # 2 minute timeout
+            batch = litellm.create_batch(
+                completion_window='24h',
+                endpoint=BATCH_ENDPOINT,
+                input_file_id=batch_file.id,
+                custom_llm_provider=provider
             )
+        except Exception as e:
+            logger.error(f"Batch submission failed for {provider}: {e}")
+            raise
+        finally:
+            os.unlink(batch_input_path)
+        
+        logger.info(f"Submitted batch {batch.id} with {len(lines)} requests to {provider}")
+        return batch.id
+    
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        provider: str = 'openai',
+        poll_interval: float = 60.0,
+        timeout: Optional[float] = BATCH_TIMEOUT
+    ):
+        """Poll a batch until it reaches a terminal status and return the batch object.
+        
+        Raises TimeoutError if the batch is still running after ``timeout``
+        seconds (None waits indefinitely).
+        """
+        
+        started = time.monotonic()
+        while True:
+            batch = litellm.retrieve_batch(batch_id=batch_id, custom_llm_provider=provider)
             
-            # Extract response data
-            content = response.choices[0].message.content
-            tokens_used = response.usage.total_tokens if response.usage else None
+            if batch.status in BATCH_TERMINAL_STATUSES:
+                logger.info(f"Batch {batch_id} finished with status: {batch.status}")
+                return batch
             
-            # Calculate cost if available
-            cost = None
-            try:
-                cost = litellm.completion_cost(completion_response=response)
-            except Exception as e:
-                logger.debug(f"Could not calculate cost: {e}")
+            if timeout is not None and time.monotonic() - started > timeout:
+                raise TimeoutError(f"Batch {batch_id} still {batch.status} after {timeout}s")
             
-            logger.info(
-                f"Generated {len(content)} chars using {full_model} "
-                f"(tokens: {tokens_used}, cost: ${cost:.4f})" if cost else
-                f"(tokens: {tokens_used})"
-            )
+            logger.info(f"Batch {batch_id} status: {batch.status}")
+            time.sleep(poll_interval)
+    
+    def get_batch_results(self, batch, provider: str = 'openai') -> Dict[str, Any]:
+        """Map each custom id of a completed batch to an LLMResponse or an error message."""
+        
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise LLMClientError(f"Batch {batch.id} has no results (status: {batch.status})")
+        
+        output = litellm.file_content(file_id=batch.output_file_id, custom_llm_provider=provider)
+        
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            
+            entry = json.loads(line)
+            custom_id = entry.get('custom_id')
+            response = entry.get('response') or {}
+            
+            if entry.get('error') or response.get('status_code') != 200:
+                results[custom_id] = str(entry.get('error') or response.get('body'))
+                continue
             
-            return LLMResponse(
-                content=content,
-                model=model,
+            body = response['body']
+            usage = body.get('usage') or {}
+            results[custom_id] = LLMResponse(
+                content=body['choices'][0]['message']['content'],
+                model=body.get('model', ''),
                 provider=provider,
-                tokens_used=tokens_used,
-                cost=cost
+                tokens_used=usage.get('total_tokens')
             )
-            
-        except Exception as e:
-            logger.error(f"LLM generation failed for {provider}/{model}: {e}")
-            raise
+        
+        return results
+    
+    def generate_batch(
+        self,
+        prompts: Sequence[str],
+        provider: str = 'anthropic',
+        model: Optional[str] = None,
+        max_tokens: int = 4000,
+        temperature: float = 0.1,
+        system_prompt: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        use_batch_api: bool = False,
+        poll_interval: float = 60.0
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Generate content for many prompts, returning a response or exception per prompt.
+        
+        By default requests are issued concurrently, at most ``max_concurrency``
+        at a time (the ``max_concurrent_requests`` setting when not given).
+        With ``use_batch_api`` the prompts are submitted as one provider Batch
+        API job instead, which is cheaper but blocks until the job finishes.
+        Must not be called from a running event loop.
+        """
+        
+        if not prompts:
+            return []
+        
+        if use_batch_api:
+            return self._generate_via_batch_api(
+                prompts, provider, model, max_tokens, temperature, system_prompt, poll_interval
+            )
+        
+        if max_concurrency is None:
+            max_concurrency = self.config.get('max_concurrent_requests', 4)
+        
+        return asyncio.run(self._agenerate_all(
+            prompts,
+            max(1, int(max_concurrency)),
+            provider=provider,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt
+        ))
+    
+    async def _agenerate_all(
+        self,
+        prompts: Sequence[str],
+        max_concurrency: int,
+        **kwargs
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Run agenerate_content for every prompt, bounded by a semaphore."""
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def generate(prompt: str) -> LLMResponse:
+            async with semaphore:
+                return await self.agenerate_content(prompt, **kwargs)
+        
+        if httpx is None:
+            return await asyncio.gather(*(generate(prompt) for prompt in prompts), return_exceptions=True)
+        
+        # Async connections are bound to this event loop, so the pool lives
+        # only as long as the batch
+        previous_session = litellm.aclient_session
+        async with httpx.AsyncClient(limits=self._http_limits(), timeout=HTTP_TIMEOUT) as client:
+            litellm.aclient_session = client
+            try:
+                return await asyncio.gather(*(generate(prompt) for prompt in prompts), return_exceptions=True)
+            finally:
+                litellm.aclient_session = previous_session
+    
+    def _generate_via_batch_api(
+        self,
+        prompts: Sequence[str],
+        provider: str,
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+        poll_interval: float
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Run prompts as a single Batch API job, keyed by their position."""
+        
+        batch_id = self.submit_batch(
+            {str(index): prompt for index, prompt in enumerate(prompts)},
+            provider=provider,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt
+        )
+        batch = self.wait_for_batch(batch_id, provider, poll_interval)
+        
+        if batch.status != 'completed':
+            error = LLMClientError(f"Batch {batch_id} ended with status: {batch.status}")
+            return [error] * len(prompts)
+        
+        responses = self.get_batch_results(batch, provider)
+        
+        results = []
+        for index in range(len(prompts)):
+            outcome = responses.get(str(index))
+            if isinstance(outcome, LLMResponse):
+                results.append(outcome)
+            else:
+                results.append(LLMClientError(outcome or f"No result for request {index} in batch {batch_id}"))
+        return results
     
     def generate_with_fallback(
         self,
@@ -192,10 +647,9 @@ class LLMClient:
         if preferred_providers is None:
             preferred_providers = ['anthropic', 'openai', 'google']
         
-        available_providers = self.get_available_providers()
         providers_to_try = [
             p for p in preferred_providers 
-            if p in available_providers
+            if p in self._available_providers
         ]
         
         if not providers_to_try:
@@ -213,13 +667,71 @@ class LLMClient:
         
         raise RuntimeError(f"All providers failed. Last error: {last_error}")
     
-    def estimate_tokens(self, text: str) -> int:
-        """Rough token estimation (4 chars per token average)."""
-        return len(text) // 4
+    def generate_with_fallback_batch(
+        self,
+        prompts: Sequence[str],
+        preferred_providers: List[str] = None,
+        **kwargs
+    ) -> List[Union[LLMResponse, Exception]]:
+        """Batch counterpart of generate_with_fallback.
+        
+        Prompts that fail with one provider are retried together on the next;
+        the result for a prompt that failed everywhere is a RuntimeError.
+        """
+        
+        if preferred_providers is None:
+            preferred_providers = ['anthropic', 'openai', 'google']
+        
+        providers_to_try = [
+            p for p in preferred_providers 
+            if p in self._available_providers
+        ]
+        
+        if not providers_to_try:
+            raise ValueError("No available providers to try")
+        
+        results: List[Union[LLMResponse, Exception]] = [None] * len(prompts)
+        pending = list(range(len(prompts)))
+        last_errors = {}
+        for provider in providers_to_try:
+            if not pending:
+                break
+            
+            logger.info(f"Attempting batch generation of {len(pending)} prompts with {provider}")
+            outcomes = self.generate_batch([prompts[i] for i in pending], provider=provider, **kwargs)
+            
+            still_pending = []
+            for index, outcome in zip(pending, outcomes):
+                if isinstance(outcome, LLMResponse):
+                    results[index] = outcome
+                else:
+                    last_errors[index] = outcome
+                    still_pending.append(index)
+            
+            if still_pending:
+                logger.warning(f"Provider {provider} failed for {len(still_pending)} prompts")
+            pending = still_pending
+        
+        for index in pending:
+            results[index] = RuntimeError(f"All providers failed. Last error: {last_errors[index]}")
+        
+        return results
+    
+    def estimate_tokens(self, text: str, model: Optional[str] = None) -> int:
+        """Count tokens with the model's tokenizer via LiteLLM.
+        
+        Falls back to a rough 4 chars per token estimate when LiteLLM cannot
+        tokenize for the model.
+        """
+        try:
+            return litellm.token_counter(model=model or self.default_models['openai'], text=text)
+        except Exception as e:
+            logger.debug(f"Token counting failed for {model}, using estimate: {e}")
+            return len(text) // 4
     
     def validate_model_context(self, prompt: str, model: str = None) -> bool:
         """Check if prompt fits within model context limits."""
-        estimated_tokens = self.estimate_tokens(prompt)
+        estimated_tokens = self.estimate_tokens(prompt, model)
         
         # Conservative context limits
         context_limits = {
@@ -3,16 +3,50 @@ Common text processing utilities for TTRPG Session Notes automation.
 Contains functions for text replacement, cleaning, and processing.
 """
 
+import functools
 import json
 import re
+import numpy as np
 import pandas as pd
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, FrozenSet, Iterable, List, Tuple, Any, Optional, Union
 import logging
 
 from .logging_config import get_logger
-from .config import SharedConfig
+try:
+    from .config import SharedConfig
+except ImportError:
+    # No local config.py yet; fall back to the shipped defaults
+    from .example_config import SharedConfig
+
+# Optional: single-pass multi-pattern matching for text replacements
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+def load_replacements_file(replacements_file: Union[str, Path]) -> Dict[str, List[str]]:
+    """Load a text replacements mapping from a JSON file.
+    
+    Args:
+        replacements_file: Path to a JSON file mapping correct terms to lists of variants
+    
+    Returns:
+        Dictionary mapping correct terms to lists of variants (empty if the
+        file is missing or invalid)
+    """
+    logger = get_logger()
+    logger.info(f"Loading replacements from: {replacements_file}")
+    
+    try:
+        with open(replacements_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        logger.warning(f"Replacements file not found: {replacements_file}")
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in replacements file: {e}")
+    return {}
 
 def get_text_replacements(config: Optional[Any] = None) -> Dict[str, List[str]]:
     """Get text replacements from configuration.
@@ -38,12 +72,132 @@ def get_text_replacements(config: Optional[Any] = None) -> Dict[str, List[str]]:
             return {}
         return default_replacements
 
+class ReplacementEngine:
+    """Text replacements compiled once for applying a map to many texts.
+    
+    Builds the Aho-Corasick automaton (when pyahocorasick is installed) or
+    the alternation regex up front, so repeated apply() calls only scan.
+    """
+    
+    def __init__(self, replacement_map: Dict[str, List[str]], case_insensitive: bool = True):
+        """Collect and compile the variants in replacement_map.
+        
+        Args:
+            replacement_map: Dict mapping correct terms to lists of variants
+            case_insensitive: Whether to perform case-insensitive matching
+        """
+        logger = get_logger()
+        self.case_insensitive = case_insensitive
+        
+        # Every variant is reported in the counts, including those that never match
+        self._variants_by_term = {}
+        
+        # Collect variants; the first correct term listing a variant wins
+        variant_terms = {}
+        for correct_term, variants in (replacement_map or {}).items():
+            # Skip underscore-prefixed keys (comments, examples, etc.)
+            if correct_term.startswith('_'):
+                continue
+                
+            # Validate that variants is a list
+            if not isinstance(variants, list):
+                logger.warning(f"Skipping invalid replacement entry '{correct_term}': variants must be a list")
+                continue
+                
+            term_variants = self._variants_by_term.setdefault(correct_term, [])
+            for variant in variants:
+                term_variants.append(variant)
+                key = variant.lower() if case_insensitive else variant
+                if variant and key not in variant_terms:
+                    variant_terms[key] = (correct_term, variant)
+        
+        self._ordered = sorted(variant_terms.values(), key=lambda entry: len(entry[1]), reverse=True)
+        self._automaton = None
+        self._pattern = None
+        if self._ordered:
+            if ahocorasick is not None:
+                self._automaton = _build_replacement_automaton(self._ordered, case_insensitive)
+            self._pattern = _build_replacement_regex(self._ordered, case_insensitive)
+    
+    def apply(self, text: str) -> Tuple[str, Dict[str, Dict[str, int]]]:
+        """Apply the compiled replacements to text.
+        
+        Args:
+            text: Text to process
+        
+        Returns:
+            Tuple of (processed_text, replacement_counts)
+        """
+        replacement_counts = defaultdict(lambda: defaultdict(int))
+        for correct_term, variants in self._variants_by_term.items():
+            term_counts = replacement_counts[correct_term]
+            for variant in variants:
+                term_counts[variant] += 0
+        
+        if not self._ordered:
+            return text, dict(replacement_counts)
+        
+        ordered = self._ordered
+        
+        # The automaton matches on lowercased text, so it needs lowercasing to
+        # keep every character position
+        lowered = text.lower() if self.case_insensitive else text
+        if self._automaton is not None and len(lowered) == len(text):
+            parts = []
+            last = 0
+            for end, (length, index) in self._automaton.iter_long(lowered):
+                start = end - length + 1
+                correct_term, variant = ordered[index]
+                replacement_counts[correct_term][variant] += 1
+                parts.append(text[last:start])
+                parts.append(correct_term)
+                last = end + 1
+            parts.append(text[last:])
+            text = ''.join(parts)
+        else:
+            def replace_match(match):
+                correct_term, variant = ordered[match.lastindex - 1]
+                replacement_counts[correct_term][variant] += 1
+                return correct_term
+            
+            text = self._pattern.sub(replace_match, text)
+        
+        return text, dict(replacement_counts)
+
+# Engines reused across apply_text_replacements calls: (id(map), case_insensitive)
+# -> (map, snapshot of its entries, engine). Holding the map keeps its id from
+# being reused, and the snapshot catches in-place edits.
+_REPLACEMENT_ENGINE_CACHE = {}
+_REPLACEMENT_ENGINE_CACHE_SIZE = 8
+
+def _get_replacement_engine(replacement_map: Dict[str, List[str]],
+                            case_insensitive: bool) -> ReplacementEngine:
+    """Return a cached ReplacementEngine for replacement_map, building it if needed."""
+    cache_key = (id(replacement_map), case_insensitive)
+    snapshot = tuple(
+        (term, tuple(variants) if isinstance(variants, list) else variants)
+        for term, variants in replacement_map.items()
+    )
+    
+    cached = _REPLACEMENT_ENGINE_CACHE.get(cache_key)
+    if cached is not None and cached[0] is replacement_map and cached[1] == snapshot:
+        return cached[2]
+    
+    engine = ReplacementEngine(replacement_map, case_insensitive)
+    if cache_key not in _REPLACEMENT_ENGINE_CACHE and len(_REPLACEMENT_ENGINE_CACHE) >= _REPLACEMENT_ENGINE_CACHE_SIZE:
+        _REPLACEMENT_ENGINE_CACHE.pop(next(iter(_REPLACEMENT_ENGINE_CACHE)))
+    _REPLACEMENT_ENGINE_CACHE[cache_key] = (replacement_map, snapshot, engine)
+    return engine
+
 def apply_text_replacements(text: str, 
                           replacement_map: Dict[str, List[str]], 
                           case_insensitive: bool = True,
                           log_replacements: bool = False) -> Tuple[str, Dict[str, Dict[str, int]]]:
     """Apply text replacements using a mapping dictionary.
     
+    The compiled matcher is cached per replacement map; use ReplacementEngine
+    directly to control its lifetime when processing many texts.
+    
     Args:
         text: Text to process
         replacement_map: Dict mapping correct terms to lists of variants
@@ -54,36 +208,43 @@ def apply_text_replacements(text: str,
         Tuple of (processed_text, replacement_counts)
     """
     logger = get_logger()
-    replacement_counts = defaultdict(lambda: defaultdict(int))
     
     # Handle empty replacement map
     if not replacement_map:
         logger.debug("No replacements to apply")
-        return text, dict(replacement_counts)
+        return text, {}
     
-    for correct_term, variants in replacement_map.items():
-        # Skip underscore-prefixed keys (comments, examples, etc.)
-        if correct_term.startswith('_'):
-            continue
-            
-        # Validate that variants is a list
-        if not isinstance(variants, list):
-            logger.warning(f"Skipping invalid replacement entry '{correct_term}': variants must be a list")
-            continue
-            
-        for variant in variants:
-            # Count occurrences before replacement
-            flags = re.IGNORECASE if case_insensitive else 0
-            matches = re.findall(re.escape(variant), text, flags=flags)
-            replacement_counts[correct_term][variant] += len(matches)
-            
-            # Perform the replacement
-            text = re.sub(re.escape(variant), correct_term, text, flags=flags)
+    engine = _get_replacement_engine(replacement_map, case_insensitive)
+    text, replacement_counts = engine.apply(text)
     
     if log_replacements:
         log_replacement_statistics(replacement_counts, logger)
     
-    return text, dict(replacement_counts)
+    return text, replacement_counts
+
+def _build_replacement_automaton(ordered: List[Tuple[str, str]], case_insensitive: bool):
+    """Build an Aho-Corasick automaton over (correct_term, variant) pairs.
+    
+    Each variant maps to (match length, index into ordered); iter_long
+    then yields leftmost-longest, non-overlapping matches.
+    """
+    automaton = ahocorasick.Automaton()
+    for index, (_, variant) in enumerate(ordered):
+        key = variant.lower() if case_insensitive else variant
+        automaton.add_word(key, (len(key), index))
+    automaton.make_automaton()
+    return automaton
+
+def _build_replacement_regex(ordered: List[Tuple[str, str]], case_insensitive: bool) -> re.Pattern:
+    """Compile one alternation over (correct_term, variant) pairs.
+    
+    Each variant gets its own capture group (m.lastindex identifies it), and
+    ordered is longest first so longer variants win over their prefixes.
+    """
+    return re.compile(
+        '|'.join(f'({re.escape(variant)})' for _, variant in ordered),
+        flags=re.IGNORECASE if case_insensitive else 0
+    )
 
 def log_replacement_statistics(replacement_counts: Dict[str, Dict[str, int]], 
                              logger: Optional[logging.Logger] = None):
@@ -150,7 +311,8 @@ def merge_adjacent_segments(df: pd.DataFrame,
                           threshold: float = 0.01,
                           text_column: str = 'text',
                           start_column: str = 'start',
-                          end_column: str = 'end') -> Tuple[pd.DataFrame, int]:
+                          end_column: str = 'end',
+                          agg_map: Optional[Dict[str, Any]] = None) -> Tuple[pd.DataFrame, int]:
     """Merge adjacent segments based on timing threshold.
     
     Args:
@@ -159,34 +321,48 @@ def merge_adjacent_segments(df: pd.DataFrame,
         text_column: Name of the text column
         start_column: Name of the start time column
         end_column: Name of the end time column
+        agg_map: Optional column -> groupby aggregation for merged segments.
+            Columns not listed keep the first segment's value.
     
     Returns:
         Tuple of (merged_df, merge_count)
     """
     logger = get_logger()
     
-    df = df.copy().reset_index(drop=True)
-    merged_count = 0
-    i = 0
+    df = df.reset_index(drop=True)
+    if len(df) < 2:
+        return df.copy(), 0
     
-    while i < len(df) - 1:
-        # Check if current segment's end is close to next segment's start
-        if abs(df.iloc[i][end_column] - df.iloc[i + 1][start_column]) <= threshold:
-            # Merge the segments
-            end_val = df.iloc[i + 1][end_column]
-            combined_text = str(df.iloc[i][text_column]) + " " + str(df.iloc[i + 1][text_column])
-            
-            df.loc[i, end_column] = end_val
-            df.loc[i, text_column] = combined_text
-            df = df.drop(df.index[i + 1]).reset_index(drop=True)
-            merged_count += 1
-        else:
-            i += 1
+    # A new group starts wherever the gap to the previous segment is not within
+    # threshold (including missing start/end times, whose gap is NaN)
+    starts = df[start_column].to_numpy()
+    ends = df[end_column].to_numpy()
+    breaks = ~(np.abs(ends[:-1] - starts[1:]) <= threshold)
+    group = np.concatenate(([0], np.cumsum(breaks)))
+    
+    first_rows = np.flatnonzero(np.concatenate(([True], breaks)))
+    merged_count = len(df) - len(first_rows)
+    if merged_count == 0:
+        return df.copy(), 0
+    
+    last_rows = np.append(first_rows[1:] - 1, len(df) - 1)
+    sizes = last_rows - first_rows + 1
     
-    if merged_count > 0:
-        logger.info(f"Merged {merged_count} adjacent segments")
+    result = df.iloc[first_rows].reset_index(drop=True)
+    result[end_column] = ends[last_rows]
     
-    return df, merged_count
+    # Only multi-segment groups get joined text; single segments keep their value
+    joined = df[text_column].map(str).groupby(group, sort=False).agg(' '.join)
+    result[text_column] = result[text_column].where(sizes == 1, joined.to_numpy())
+    
+    if agg_map:
+        grouped = df.groupby(group, sort=False)
+        for column, func in agg_map.items():
+            result[column] = grouped[column].agg(func).to_numpy()
+    
+    logger.info(f"Merged {merged_count} adjacent segments")
+    
+    return result, merged_count
 
 def remove_short_text(df: pd.DataFrame,
                      min_length: int = 1,
@@ -204,9 +380,13 @@ def remove_short_text(df: pd.DataFrame,
     logger = get_logger()
     
     # Count short text entries
-    short_text_mask = df[text_column].apply(
-        lambda x: len(x) if isinstance(x, str) else 0
-    ) <= min_length
+    # Non-string values (NaN, numbers) count as length 0
+    try:
+        lengths = df[text_column].str.len().fillna(0)
+    except AttributeError:
+        # Column holds no strings at all
+        lengths = pd.Series(0, index=df.index)
+    short_text_mask = lengths <= min_length
     short_text_count = short_text_mask.sum()
     
     # Remove short text entries
@@ -217,14 +397,22 @@ def remove_short_text(df: pd.DataFrame,
     
     return df_cleaned, short_text_count
 
+@functools.lru_cache(maxsize=32)
+def _normalize_silence_patterns(patterns: FrozenSet[str]) -> FrozenSet[str]:
+    """Strip and casefold silence patterns (cached per distinct pattern set)."""
+    return frozenset(pattern.strip().casefold() for pattern in patterns)
+
 def remove_silence_gibberish(df: pd.DataFrame,
-                           patterns: List[str],
+                           patterns: Iterable[str],
                            text_column: str = 'text') -> Tuple[pd.DataFrame, int]:
     """Remove entries that match silence gibberish patterns.
     
+    Patterns match whole entries case-insensitively, ignoring surrounding
+    whitespace.
+    
     Args:
         df: DataFrame containing text data
-        patterns: List of patterns to remove
+        patterns: Patterns to remove (a frozenset avoids a conversion per call)
         text_column: Name of the text column
     
     Returns:
@@ -232,13 +420,16 @@ def remove_silence_gibberish(df: pd.DataFrame,
     """
     logger = get_logger()
     
-    if not patterns:
+    if not patterns or df.empty:
         return df, 0
     
     original_length = len(df)
     
     # Create a mask for rows that match gibberish patterns
-    gibberish_mask = df[text_column].isin(patterns)
+    pattern_set = patterns if isinstance(patterns, frozenset) else frozenset(patterns)
+    normalized_patterns = _normalize_silence_patterns(pattern_set)
+    normalized_text = df[text_column].astype('string').str.strip().str.casefold()
+    gibberish_mask = normalized_text.isin(normalized_patterns).fillna(False).astype(bool)
     df_cleaned = df[~gibberish_mask]
     
     removed_count = original_length - len(df_cleaned)
@@ -276,26 +467,23 @@ def split_text_with_overlap(text: str,
         # If this isn't the last chunk, try to break at a word boundary
         if end < len(text):
             # Look for a good break point (sentence end, then word boundary)
-            sentence_breaks = ['. ', '! ', '? ']
             best_break = -1
             
-            # Look for sentence breaks in the last part of the chunk
+            # Look for the last sentence break in the last part of the chunk;
+            # a break may start on the chunk's final character
             search_start = max(start + max_length - 1000, start)
-            for i in range(end - 1, search_start - 1, -1):
-                for break_pattern in sentence_breaks:
-                    if text[i:i+len(break_pattern)] == break_pattern:
-                        best_break = i + len(break_pattern)
-                        break
-                if best_break != -1:
-                    break
+            sentence_break = max(text.rfind('. ', search_start, end + 1),
+                                 text.rfind('! ', search_start, end + 1),
+                                 text.rfind('? ', search_start, end + 1))
+            if sentence_break != -1:
+                best_break = sentence_break + 2
             
             # If no sentence break, look for word boundary
             if best_break == -1:
                 search_start = max(start + max_length - 200, start)
-                for i in range(end - 1, search_start - 1, -1):
-                    if text[i] == ' ':
-                        best_break = i + 1
-                        break
+                space = text.rfind(' ', search_start, end)
+                if space != -1:
+                    best_break = space + 1
             
             if best_break != -1:
                 end = best_break
@@ -0,0 +1,120 @@
+"""
+Tests for campaign generation checkpointing.
+"""
+
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+
+# Add shared_utils to path for testing
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared_utils import campaign_generator, document_manager
+from shared_utils.campaign_generator import CampaignGenerator
+from shared_utils.llm_client import LLMResponse
+
+
+@unittest.skipIf(document_manager.frontmatter is None, "python-frontmatter not installed")
+class TestGenerationCheckpoint(unittest.TestCase):
+    """Test resuming direct generation from a JSONL checkpoint."""
+    
+    PROMPT_TYPES = ["NPC_template", "LOCATIONS_template"]
+    
+    def setUp(self):
+        """Set up a generator whose LLM client is a mock."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint = Path(self.temp_dir) / "checkpoint.jsonl"
+        
+        patcher = mock.patch.object(campaign_generator, 'LLMClient')
+        self.addCleanup(patcher.stop)
+        llm_client = patcher.start().return_value
+        llm_client.config = {'max_concurrent_requests': 2}
+        llm_client.agenerate_content = mock.AsyncMock(
+            return_value=LLMResponse(content="# Entity\nDetails.", model="test-model", provider="openai")
+        )
+        self.llm_client = llm_client
+        
+        self.generator = CampaignGenerator(Path(self.temp_dir) / "campaign")
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _generate(self, session_name="Session 1"):
+        return self.generator.generate_campaign_documents(
+            transcript_content="The party met Bob.",
+            session_name=session_name,
+            prompt_types=self.PROMPT_TYPES,
+            preferred_provider="openai",
+            output_jsonl=self.checkpoint
+        )
+    
+    def test_completed_prompt_types_are_recorded_and_skipped(self):
+        """Test that a rerun skips prompt types recorded in the checkpoint."""
+        first = self._generate()
+        
+        self.assertTrue(all(result.success for result in first))
+        self.assertEqual(self.llm_client.agenerate_content.await_count, 2)
+        records = [json.loads(line) for line in self.checkpoint.read_text().splitlines()]
+        self.assertEqual(sorted(record['prompt_type'] for record in records), sorted(self.PROMPT_TYPES))
+        
+        second = self._generate()
+        
+        self.assertEqual(self.llm_client.agenerate_content.await_count, 2)
+        self.assertEqual([result.entity_name for result in second], self.PROMPT_TYPES)
+        self.assertEqual(
+            [result.file_path for result in second],
+            [result.file_path for result in first]
+        )
+    
+    def test_resume_generates_only_missing_prompt_types(self):
+        """Test resuming after an interrupted run, ignoring a truncated last record."""
+        done_path = Path(self.temp_dir) / "campaign" / "NPC_Session_1.md"
+        self.checkpoint.write_text(
+            json.dumps({'prompt_type': 'NPC_template', 'session_name': 'Session 1',
+                        'file_path': str(done_path), 'success': True}) + '\n'
+            + '{"prompt_type": "LOCATIONS_templ',
+            encoding='utf-8'
+        )
+        
+        results = self._generate()
+        
+        self.assertEqual(self.llm_client.agenerate_content.await_count, 1)
+        self.assertIn(
+            self.generator.prompt_templates["LOCATIONS_template"],
+            self.llm_client.agenerate_content.await_args.kwargs['prompt']
+        )
+        self.assertEqual(results[0].file_path, done_path)
+        self.assertTrue(results[1].success)
+        self.assertIn(
+            'LOCATIONS_template',
+            self.generator._load_checkpoint(self.checkpoint, "Session 1")
+        )
+    
+    def test_checkpoint_is_per_session(self):
+        """Test that results recorded for one session do not skip another."""
+        self._generate("Session 1")
+        self._generate("Session 2")
+        
+        self.assertEqual(self.llm_client.agenerate_content.await_count, 4)
+        self.assertEqual(
+            set(self.generator._load_checkpoint(self.checkpoint, "Session 2")),
+            set(self.PROMPT_TYPES)
+        )
+    
+    def test_failed_generation_is_not_recorded(self):
+        """Test that failures are left out of the checkpoint so they are retried."""
+        self.llm_client.agenerate_content.side_effect = RuntimeError("provider down")
+        
+        results = self._generate()
+        
+        self.assertFalse(any(result.success for result in results))
+        self.assertEqual(self.generator._load_checkpoint(self.checkpoint, "Session 1"), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,11 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared_utils.config import SharedConfig, get_shared_config
+try:
+    from shared_utils.config import SharedConfig, get_shared_config
+except ImportError:
+    # No local config.py (it is created from example_config.py); test the template
+    from shared_utils.example_config import SharedConfig, get_shared_config
 
 
 class TestSharedConfig(unittest.TestCase):
@@ -139,6 +143,18 @@ class TestSharedConfig(unittest.TestCase):
         
         config = get_shared_config(config_file=self.config_file)
         self.assertEqual(config.whisper["model"], "convenience-test")
+    
+    def test_replacement_engine_follows_text_replacements(self):
+        """Test that the replacement engine reflects edits to text_replacements."""
+        config = SharedConfig()
+        config.text_replacements = {"Gandalf": ["gandolf"]}
+        self.assertEqual(config.replacement_engine.apply("gandolf froto")[0], "Gandalf froto")
+        
+        config.text_replacements["Frodo"] = ["froto"]
+        self.assertEqual(config.replacement_engine.apply("gandolf froto")[0], "Gandalf Frodo")
+        
+        config.text_replacements = {"Frodo": ["froto"]}
+        self.assertEqual(config.replacement_engine.apply("gandolf froto")[0], "gandolf Frodo")
 
 
 if __name__ == '__main__':
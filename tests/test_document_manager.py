@@ -0,0 +1,119 @@
+"""
+Tests for campaign document merging.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+
+# Add shared_utils to path for testing
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared_utils import document_manager
+from shared_utils.document_manager import CampaignDocument, DocumentManager
+
+
+@unittest.skipIf(document_manager.frontmatter is None, "python-frontmatter not installed")
+class TestDocumentManager(unittest.TestCase):
+    """Test intelligent merging of campaign documents."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = DocumentManager(Path(self.temp_dir))
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _existing_document(self, content):
+        return CampaignDocument(
+            file_path=Path(self.temp_dir) / "doc.md",
+            frontmatter={},
+            content=content,
+            sections=self.manager._parse_sections(content),
+            exists=True
+        )
+    
+    def test_intelligent_merge_appends_before_new_sections(self):
+        """Test that additions to the last section stay under it when a new section is added."""
+        existing_doc = self._existing_document(
+            "# A\nThe original description of section A."
+        )
+        new_content = "# B\nBrand new section content.\n# A\nextra detail about A"
+        
+        merged = self.manager.merge_document_content(existing_doc, new_content)
+        
+        sections = {section.title: section.content for section in merged.sections}
+        self.assertEqual(list(sections), ["A", "B"])
+        self.assertIn("extra detail about A", sections["A"])
+        self.assertNotIn("extra detail about A", sections["B"])
+        self.assertIn("Brand new section content.", sections["B"])
+        self.assertEqual(merged.sections, self.manager._parse_sections(merged.content))
+
+    
+    def test_merged_sections_match_reparsed_content(self):
+        """Test that sections tracked while merging equal a fresh parse of the merged content."""
+        cases = [
+            # Preamble, a minimal section to replace, a section to append to, a new section
+            ("Intro text\n# NPCs\nTODO\n## Bob\nA baker.\n# Places\nThe town.",
+             "# NPCs\nBob and Alice\n## Bob\nAlso a spy.\n# Items\nA sword."),
+            # Only new sections, added after content without a trailing newline
+            ("# A\nfirst", "# B\nsecond\n### C\nthird"),
+            # Several edits at the end of the document
+            ("# A\nThe original text of A.\n# B\n[placeholder]",
+             "# C\nnew\n# B\nfilled in\n# A\nmore about A"),
+            # Repeated titles and an empty existing document
+            ("", "# A\none\n# A\ntwo"),
+            ("# A\nTBD\n# A\nkept", "# A\nreplacement\n# A\nappended"),
+        ]
+        
+        for existing_content, new_content in cases:
+            with self.subTest(existing=existing_content, new=new_content):
+                existing_doc = self._existing_document(existing_content)
+                merged = self.manager.merge_document_content(existing_doc, new_content)
+                self.assertEqual(merged.sections, self.manager._parse_sections(merged.content))
+    
+    def test_apply_line_edits_sections(self):
+        """Test section tracking for edits sharing a position, including a replaced range."""
+        content = "# A\nalpha\n# B\nTODO\n# C\ngamma"
+        sections = self.manager._parse_sections(content)
+        new_b = self.manager._parse_sections("# B\nbeta")[0]
+        new_d = self.manager._parse_sections("# D\ndelta")[0]
+        edits = [
+            (2, 4, [self.manager._format_section(new_b)], new_b),
+            (2, 2, ['', self.manager._format_section(new_d)], new_d),
+            (2, 2, ['more alpha'], None),
+        ]
+        
+        merged_content, merged_sections = self.manager._apply_line_edits(content, sections, edits)
+        
+        self.assertEqual([section.title for section in merged_sections], ["A", "D", "B", "C"])
+        self.assertIn("more alpha", merged_sections[0].content)
+        self.assertEqual(merged_sections, self.manager._parse_sections(merged_content))
+    
+    def test_save_load_round_trip(self):
+        """Test that saving a loaded document leaves the file unchanged, in both formats."""
+        for frontmatter_format in DocumentManager.FRONTMATTER_FORMATS:
+            for metadata in ({}, {"title": "Doc", "tags": ["npc", "session"]}):
+                with self.subTest(frontmatter_format=frontmatter_format, metadata=metadata):
+                    manager = DocumentManager(Path(self.temp_dir), frontmatter_format)
+                    path = Path(self.temp_dir) / f"{frontmatter_format}_{len(metadata)}.md"
+                    content = "# A\nSome content."
+                    
+                    manager.save_document(
+                        CampaignDocument(path, dict(metadata), content, []), backup=False
+                    )
+                    first_save = path.read_text(encoding='utf-8')
+                    loaded = manager.load_document(path)
+                    manager.save_document(loaded, backup=False)
+                    
+                    self.assertEqual(loaded.frontmatter, metadata)
+                    self.assertEqual(loaded.content, content)
+                    self.assertEqual(path.read_text(encoding='utf-8'), first_save)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Tests for entity mention scanning.
+"""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add shared_utils to path for testing
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared_utils import entity_resolver
+from shared_utils.entity_resolver import _MentionMatcher
+
+
+class TestMentionMatcher(unittest.TestCase):
+    """Test whole-word mention matching on both matcher backends."""
+    
+    KEYS = ["red", "red dragon", "dragon", "the red dragon lair"]
+    
+    CASES = [
+        ("red dragons", ["red"]),
+        ("a red dragon appears", ["red dragon"]),
+        ("the red dragon lairs and a dragon", ["red dragon", "dragon"]),
+        ("into the red dragon lair", ["the red dragon lair"]),
+        ("reddish dragonfly", []),
+    ]
+    
+    def _check_cases(self):
+        matcher = _MentionMatcher(self.KEYS)
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(list(matcher.iter_matches(text)), expected)
+    
+    def test_iter_matches_regex(self):
+        """Test the regex alternation fallback."""
+        with mock.patch.object(entity_resolver, 'ahocorasick', None):
+            self._check_cases()
+    
+    @unittest.skipIf(entity_resolver.ahocorasick is None, "pyahocorasick not installed")
+    def test_iter_matches_automaton(self):
+        """Test the Aho-Corasick path gives the same matches as the regex."""
+        self._check_cases()
+
+
+if __name__ == '__main__':
+    unittest.main()
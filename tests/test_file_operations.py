@@ -8,11 +8,13 @@ import os
 import pandas as pd
 import zipfile
 from pathlib import Path
+from unittest import mock
 
 # Add shared_utils to path for testing
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from shared_utils import file_operations
 from shared_utils.file_operations import (
     ensure_directory_exists,
     find_files_by_pattern,
@@ -158,6 +160,31 @@ class TestFileOperations(unittest.TestCase):
         start_values = merged_df['start'].tolist()
         self.assertEqual(start_values, sorted(start_values))
     
+    def test_merge_csv_files_streaming_matches_dataframe(self):
+        """Test that streaming the merge writes the same rows as the in-memory merge."""
+        df1 = pd.DataFrame({
+            'start': [0.5, 1.25, 2.0],
+            'count': [1, 2, 3],
+            'text': ['hello, "world"', 'two\nlines', 'plain']
+        })
+        df2 = pd.DataFrame({'start': [3.1, 4.0], 'count': [4, None], 'text': ['foo', None]})
+        
+        csv_paths = [os.path.join(self.temp_dir, name) for name in ("file1.csv", "file2.csv")]
+        df1.to_csv(csv_paths[0], index=False)
+        df2.to_csv(csv_paths[1], index=False)
+        
+        dataframe_path = os.path.join(self.temp_dir, "merged_dataframe.csv")
+        streamed_path = os.path.join(self.temp_dir, "merged_streamed.csv")
+        
+        # Small chunks so each file is streamed in several pieces
+        with mock.patch.object(file_operations, 'MERGE_CSV_CHUNK_ROWS', 2):
+            merged_df = merge_csv_files(csv_paths, dataframe_path)
+            streamed = merge_csv_files(csv_paths, streamed_path, return_dataframe=False)
+        
+        self.assertIsNone(streamed)
+        self.assertEqual(len(merged_df), 5)
+        pd.testing.assert_frame_equal(pd.read_csv(streamed_path), pd.read_csv(dataframe_path))
+    
     def test_get_file_stats(self):
         """Test getting file statistics."""
         # Test with existing file
@@ -0,0 +1,108 @@
+"""
+Tests for LLM client retry handling.
+"""
+
+import asyncio
+import os
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add shared_utils to path for testing
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from shared_utils import llm_client
+from shared_utils.llm_client import LLMClient
+
+
+class RateLimitError(Exception):
+    """Stand-in for litellm.exceptions.RateLimitError."""
+
+
+class AuthenticationError(Exception):
+    """Stand-in for litellm.exceptions.AuthenticationError."""
+
+
+def _completion_response(content):
+    message = types.SimpleNamespace(content=content)
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)], usage=None)
+
+
+class TestLLMClientRetry(unittest.TestCase):
+    """Test that transient provider errors are retried and other errors are not."""
+    
+    def setUp(self):
+        """Set up a client backed by a fake LiteLLM module."""
+        self.completion = mock.Mock()
+        self.fake_litellm = types.SimpleNamespace(
+            completion=self.completion,
+            acompletion=mock.AsyncMock(side_effect=lambda **kwargs: self.completion(**kwargs)),
+            completion_cost=mock.Mock(side_effect=Exception("no pricing")),
+            exceptions=types.SimpleNamespace(
+                RateLimitError=RateLimitError,
+                AuthenticationError=AuthenticationError
+            ),
+            client_session=None
+        )
+        
+        self.addCleanup(mock.patch.stopall)
+        mock.patch.object(llm_client, 'litellm', self.fake_litellm).start()
+        mock.patch.object(llm_client, 'httpx', None).start()
+        mock.patch.object(llm_client, 'load_dotenv').start()
+        mock.patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}).start()
+        self.sleep = mock.patch.object(llm_client.time, 'sleep').start()
+        
+        self.client = LLMClient({'max_retries': 2, 'retry_base_delay': 0, 'retry_max_delay': 0})
+    
+    def test_retries_retryable_errors(self):
+        """Test that a rate limit error is retried until the call succeeds."""
+        self.completion.side_effect = [RateLimitError("slow down"), RateLimitError("slow down"),
+                                       _completion_response("done")]
+        
+        response = self.client.generate_content("prompt", provider='openai')
+        
+        self.assertEqual(response.content, "done")
+        self.assertEqual(self.completion.call_count, 3)
+        self.assertEqual(self.sleep.call_count, 2)
+    
+    def test_gives_up_after_max_retries(self):
+        """Test that the last retryable error is raised once retries run out."""
+        self.completion.side_effect = RateLimitError("slow down")
+        
+        with self.assertRaises(RateLimitError):
+            self.client.generate_content("prompt", provider='openai')
+        self.assertEqual(self.completion.call_count, 3)
+    
+    def test_does_not_retry_other_errors(self):
+        """Test that non-transient errors are raised without retrying."""
+        self.completion.side_effect = AuthenticationError("bad key")
+        
+        with self.assertRaises(AuthenticationError):
+            self.client.generate_content("prompt", provider='openai')
+        self.assertEqual(self.completion.call_count, 1)
+        self.sleep.assert_not_called()
+    
+    def test_async_retries_retryable_errors(self):
+        """Test that agenerate_content retries the same errors as generate_content."""
+        self.completion.side_effect = [RateLimitError("slow down"), _completion_response("done")]
+        
+        with mock.patch.object(llm_client.asyncio, 'sleep', mock.AsyncMock()) as async_sleep:
+            response = asyncio.run(self.client.agenerate_content("prompt", provider='openai'))
+        
+        self.assertEqual(response.content, "done")
+        self.assertEqual(self.completion.call_count, 2)
+        self.assertEqual(async_sleep.await_count, 1)
+    
+    def test_async_does_not_retry_other_errors(self):
+        """Test that agenerate_content raises non-transient errors immediately."""
+        self.completion.side_effect = AuthenticationError("bad key")
+        
+        with self.assertRaises(AuthenticationError):
+            asyncio.run(self.client.agenerate_content("prompt", provider='openai'))
+        self.assertEqual(self.completion.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
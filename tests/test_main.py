@@ -0,0 +1,81 @@
+"""
+Tests for the lazily built command line parser.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path for testing
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import main
+
+
+class TestMainParser(unittest.TestCase):
+    """Test help and version output of the per-command parsers."""
+    
+    def _run_parser(self, command, argv):
+        """Parse argv with the parser built for command; return (exit code, stdout)."""
+        try:
+            parser = main.create_main_parser(command)
+        except ModuleNotFoundError as e:
+            self.skipTest(f"{command} command dependencies not available: {e}")
+        
+        output = io.StringIO()
+        with redirect_stdout(output), self.assertRaises(SystemExit) as raised:
+            parser.parse_args(argv)
+        return raised.exception.code, output.getvalue()
+    
+    def test_command_help(self):
+        """Test that every command prints its own help when its parser is built."""
+        for command in main.COMMANDS:
+            with self.subTest(command=command):
+                code, output = self._run_parser(command, [command, '--help'])
+                self.assertEqual(code, 0)
+                self.assertIn(f"usage: ttrpg {command}", output)
+                self.assertIn("--help", output)
+    
+    def test_main_help_lists_every_command(self):
+        """Test that top-level help lists all commands whichever one is fully built."""
+        for command in [None, *main.COMMANDS]:
+            with self.subTest(command=command):
+                code, output = self._run_parser(command, ['--help'])
+                self.assertEqual(code, 0)
+                # Help text may be wrapped across lines
+                output = ' '.join(output.split())
+                for name in main.COMMANDS:
+                    self.assertIn(f"{name} ", output)
+    
+    def test_version(self):
+        """Test that --version works with every command's parser."""
+        for command in [None, *main.COMMANDS]:
+            with self.subTest(command=command):
+                code, output = self._run_parser(command, ['--version'])
+                self.assertEqual(code, 0)
+                self.assertEqual(output.strip(), main.VERSION)
+    
+    def test_version_fast_path(self):
+        """Test that global --version is answered before any parser is built."""
+        for argv in (['--version'], ['--log-level', 'DEBUG', '-V'], ['--version', 'generate']):
+            with self.subTest(argv=argv):
+                output = io.StringIO()
+                with mock.patch.object(sys, 'argv', ['ttrpg', *argv]), \
+                        mock.patch.object(main, 'create_main_parser') as create_parser, \
+                        redirect_stdout(output):
+                    self.assertEqual(main.main(), 0)
+                create_parser.assert_not_called()
+                self.assertEqual(output.getvalue().strip(), main.VERSION)
+    
+    def test_command_version_option_not_intercepted(self):
+        """Test that -V after the subcommand is left to the subcommand's parser."""
+        self.assertFalse(main._requests_version(['generate', '-V']))
+        self.assertFalse(main._requests_version(['--config', '-V', 'generate']))
+        self.assertTrue(main._requests_version(['--config', 'c.json', '-V']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared_utils.text_processing import (
     load_replacements_file,
     apply_text_replacements,
+    ReplacementEngine,
     remove_duplicate_short_text,
     merge_adjacent_segments,
     remove_short_text,
@@ -86,6 +87,20 @@ class TestTextProcessing(unittest.TestCase):
         self.assertEqual(result_text, "Gandalf and Gandalf and Gandalf")
         self.assertEqual(counts["Gandalf"]["gandolf"], 3)
     
+    def test_replacement_engine_reuse(self):
+        """Test applying one compiled ReplacementEngine to several texts."""
+        engine = ReplacementEngine({"Gandalf": ["gandolf"], "Frodo": ["froto"]})
+        
+        first_text, first_counts = engine.apply("gandolf and gandolf")
+        second_text, second_counts = engine.apply("froto")
+        
+        self.assertEqual(first_text, "Gandalf and Gandalf")
+        self.assertEqual(first_counts["Gandalf"]["gandolf"], 2)
+        self.assertEqual(first_counts["Frodo"]["froto"], 0)
+        self.assertEqual(second_text, "Frodo")
+        self.assertEqual(second_counts["Gandalf"]["gandolf"], 0)
+        self.assertEqual(second_counts["Frodo"]["froto"], 1)
+    
     def test_remove_duplicate_short_text(self):
         """Test removing duplicate short text entries."""
         df = pd.DataFrame({
@@ -123,6 +138,24 @@ class TestTextProcessing(unittest.TestCase):
         merged_texts = result_df['text'].tolist()
         self.assertTrue(any(' ' in text for text in merged_texts))
     
+    def test_merge_adjacent_segments_agg_map(self):
+        """Test custom aggregation of extra columns when merging."""
+        df = pd.DataFrame({
+            'text': ['Hello', 'world', 'Bye'],
+            'start': [1.0, 2.0, 5.0],
+            'end': [2.0, 3.0, 6.0],
+            'confidence': [0.9, 0.5, 0.8]
+        })
+        
+        result_df, merge_count = merge_adjacent_segments(
+            df, threshold=0.1, agg_map={'confidence': 'min'}
+        )
+        
+        self.assertEqual(merge_count, 1)
+        self.assertEqual(result_df['text'].tolist(), ['Hello world', 'Bye'])
+        self.assertEqual(result_df['end'].tolist(), [3.0, 6.0])
+        self.assertEqual(result_df['confidence'].tolist(), [0.5, 0.8])
+    
     def test_remove_short_text(self):
         """Test removing short text entries."""
         df = pd.DataFrame({
@@ -387,10 +387,13 @@ def create_argument_parser() -> argparse.ArgumentParser:
     
     return parser
 
-def main():
-    """Main entry point"""
-    parser = create_argument_parser()
-    args = parser.parse_args()
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    return create_argument_parser().parse_args(argv)
+
+def run(args: argparse.Namespace) -> int:
+    """Run transcription for already-parsed arguments and return an exit code"""
+    config = None
     
     # Handle config file creation
     if args.create_config:
@@ -426,7 +429,7 @@ def main():
         return 0 if success else 1
         
     except TranscriptionError as e:
-        if config.progress_config.get('colored_output', True):
+        if config is None or config.progress_config.get('colored_output', True):
             print(f"{Fore.RED}Error: {e}{Style.RESET_ALL}")
         else:
             print(f"Error: {e}")
@@ -438,5 +441,9 @@ def main():
         print(f"Unexpected error: {e}")
         return 1
 
+def main():
+    """Main entry point"""
+    return run(parse_args())
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -32,6 +32,7 @@ from shared_utils.config import get_shared_config
 from shared_utils.logging_config import setup_logging, get_logger
 from shared_utils.text_processing import (
     get_text_replacements,
+    load_replacements_file,
     apply_text_replacements,
     log_replacement_statistics
 )
@@ -51,17 +52,7 @@ def process_text_file(input_file: Path, output_file: Path, logger, config=None,
 
     # Load replacements - prioritize explicit replacements file
     if replacements_file:
-        import json
-        logger.info(f"Loading replacements from: {replacements_file}")
-        try:
-            with open(replacements_file, 'r', encoding='utf-8') as f:
-                replacements = json.load(f)
-        except FileNotFoundError:
-            logger.warning(f"Replacements file not found: {replacements_file}")
-            replacements = {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in replacements file: {e}")
-            replacements = {}
+        replacements = load_replacements_file(replacements_file)
     else:
         # Load replacements from config
         replacements = get_text_replacements(config)
@@ -130,8 +121,8 @@ def process_text_file(input_file: Path, output_file: Path, logger, config=None,
     
     return True
 
-def main():
-    """Main processing function."""
+def parse_args(argv=None):
+    """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="TTRPG JSON Text Replace - Phase 1 Improved")
     parser.add_argument('--input', type=Path, help='Input text file to process')
     parser.add_argument('--output', type=Path, help='Output file for processed text')
@@ -141,10 +132,19 @@ def main():
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        help='Logging level')
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+def run(args, logger):
+    """Run text replacement for already-parsed arguments.
     
-    # Setup logging
-    logger = setup_logging(level=args.log_level, use_colors=True)
+    Args:
+        args: Namespace with input, output, replacements and config
+              (paths may be str, Path, or None)
+        logger: Logger to report progress to
+    
+    Returns:
+        True if processing succeeded, False otherwise
+    """
     logger.info("TTRPG JSON Text Replace v2.0 (Phase 1 Improved)")
     logger.info("=" * 60)
     
@@ -155,7 +155,7 @@ def main():
         
         # Determine file paths
         if args.input:
-            input_file = args.input
+            input_file = Path(args.input)
         else:
             # Look for common transcript files
             possible_files = [
@@ -177,14 +177,15 @@ def main():
                 return False
         
         if args.output:
-            output_file = args.output
+            output_file = Path(args.output)
         else:
             # Generate output filename
             output_file = input_file.with_stem(f"{input_file.stem}_UPDATED")
             logger.info(f"Auto-generated output file: {output_file.name}")
         
         # Process the file
-        success = process_text_file(input_file, output_file, logger, config, replacements_file=args.replacements)
+        replacements_file = Path(args.replacements) if args.replacements else None
+        success = process_text_file(input_file, output_file, logger, config, replacements_file=replacements_file)
         
         if success:
             logger.info("Text replacement completed successfully!")
@@ -202,6 +203,12 @@ def main():
         logger.debug("Full error details:", exc_info=True)
         return False
 
+def main():
+    """Main processing function."""
+    args = parse_args()
+    logger = setup_logging(level=args.log_level, use_colors=True)
+    return run(args, logger)
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file
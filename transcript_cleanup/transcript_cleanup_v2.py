@@ -25,7 +25,7 @@ from shared_utils.config import get_shared_config
 from shared_utils.logging_config import setup_logging, get_logger
 from shared_utils.text_processing import (
     get_text_replacements,
-    apply_text_replacements,
+    ReplacementEngine,
     clean_transcript_dataframe,
     split_text_with_overlap
 )
@@ -50,7 +50,7 @@ def process_tsv_file(file_path: Path, config, logger):
         'merge_threshold': config.cleanup['merge_threshold'],
         'short_text_length': config.cleanup['short_text_length'],
         'remove_silence_gibberish': config.cleanup['remove_silence_gibberish'],
-        'silence_gibberish_patterns': config.silence_patterns
+        'silence_gibberish_patterns': config.silence_pattern_set
     }
     
     cleaned_df = clean_transcript_dataframe(df, config_dict)
@@ -140,16 +140,16 @@ def apply_text_replacements_to_dataframe(df, config, logger):
         logger.info("To add corrections, update your configuration file")
         return df
     
-    # Apply replacements to text column
+    # Compile the replacements once (reusing the config's engine when the
+    # configured replacements are in use) and apply them to each text row
+    if replacements is config.text_replacements:
+        engine = config.replacement_engine
+    else:
+        engine = ReplacementEngine(replacements, case_insensitive=True)
     total_replacements = 0
     for idx, row in df.iterrows():
         original_text = row['text']
-        replaced_text, counts = apply_text_replacements(
-            original_text, 
-            replacements, 
-            case_insensitive=True,
-            log_replacements=False
-        )
+        replaced_text, counts = engine.apply(original_text)
         df.at[idx, 'text'] = replaced_text
         
         # Count total replacements
@@ -209,9 +209,8 @@ def create_final_transcripts(df, config, logger):
     
     return complete_path, part_files
 
-def main():
-    """Main processing function."""
-    # Parse command line arguments
+def parse_args(argv=None):
+    """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="TTRPG Transcript Cleanup - Phase 1 Improved")
     parser.add_argument('--config', help='Path to configuration file')
     parser.add_argument('--log-level', default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -220,10 +219,18 @@ def main():
     parser.add_argument('--session-name', help='Override session name')
     parser.add_argument('--part', help='Override session part')
     
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+def run(args, logger):
+    """Run the cleanup pipeline for already-parsed arguments.
     
-    # Setup logging
-    logger = setup_logging(level=args.log_level, use_colors=True)
+    Args:
+        args: Namespace with config, base_path, session_name and part
+        logger: Logger to report progress to
+    
+    Returns:
+        True if processing succeeded, False otherwise
+    """
     logger.info("TTRPG Transcript Cleanup v2.0 (Phase 1 Improved)")
     logger.info("=" * 60)
     
@@ -330,6 +337,12 @@ def main():
         logger.debug("Full error details:", exc_info=True)
         return False
 
+def main():
+    """Main processing function."""
+    args = parse_args()
+    logger = setup_logging(level=args.log_level, use_colors=True)
+    return run(args, logger)
+
 if __name__ == "__main__":
     success = main()
     sys.exit(0 if success else 1)
\ No newline at end of file